@@ -1,154 +1,82 @@
-from datetime import datetime
+from datetime import datetime, time, timedelta
 from django import forms
-from django.utils import timezone
 from django.contrib.auth import get_user_model
-from django.utils.dateparse import parse_date
-from django.core.exceptions import ValidationError
-from booking.models import Booking, Table
-from booking.utils import get_available_slots
-from booking.constants import SLOT_DURATION
+from django.utils import timezone
+from booking.forms import BookingForm
 
 User = get_user_model()
 
 
-class StaffBookingForm(forms.ModelForm):
+class StaffBookingForm(BookingForm):
     name = forms.ModelChoiceField(
         queryset=User.objects.all(),
         required=True,
         label='Booking for user'
     )
 
-    date = forms.DateField(
-        widget=forms.DateInput(
-            attrs={
-                'type': 'date',
-                'min': timezone.localdate().isoformat(),
-            }
-        )
-    )
-
-    slot = forms.ChoiceField(
-        label='Time',
-        choices=[],
-        required=True,
-    )
-
-    class Meta:
-        model = Booking
+    class Meta(BookingForm.Meta):
         exclude = (
             'start_time',
             'table',
             'status',
-        )
-        widgets = {
-            'allergies': forms.Textarea(attrs={'rows': 2})
-        }
-
-    def __init__(self, *args, **kwargs):
-        self.user = kwargs.pop('user', None)
-        self.instance = kwargs.get('instance')
-        super().__init__(*args, **kwargs)
-        if self.instance and self.instance.start_time:
-            self.fields['date'].initial = self.instance.start_time.date()
-        # Let AJAX populate on GET
-        if not self.is_bound:
-            return
-
-        selected_date = self.data.get('date')
-        party_size = self.data.get('party_size')
-
-        if not selected_date or not party_size:
-            return
-
-        try:
-            selected_date = parse_date(selected_date)
-            party_size = int(party_size)
-        except (TypeError, ValueError):
-            return
-
-        if not selected_date:
-            return
-
-        # Used when editing an existing booking
-        exclude_bookings = None
-        if self.instance and self.instance.pk:
-            exclude_bookings = Booking.objects.filter(pk=self.instance.pk)
-
-        slots = get_available_slots(
-            date=selected_date,
-            party_size=party_size,
-            exclude_bookings=exclude_bookings,
+            'cancellation_reason',
         )
 
-        if self.instance and self.instance.pk and self.instance.start_time:
-            slots = list(slots)
-            if self.instance.start_time not in slots:
-                slots.append(self.instance.start_time)
+    def get_booking_name(self):
+        return self.cleaned_data['name']
 
-        slots = sorted(slots)
 
-        self.fields['slot'].choices = [
-            (slot.isoformat(), slot.strftime('%H:%M'))
-            for slot in slots
-        ]
+class BulkCancelForm(forms.Form):
+    date = forms.DateField(
+        widget=forms.DateInput(attrs={'type': 'date'}),
+    )
+    end_date = forms.DateField(
+        required=False,
+        widget=forms.DateInput(attrs={'type': 'date'}),
+        help_text='Leave blank to cancel a single day',
+    )
+    from_time = forms.TimeField(
+        required=False,
+        widget=forms.TimeInput(attrs={'type': 'time'}),
+        help_text='Leave blank to start at midnight',
+    )
+    to_time = forms.TimeField(
+        required=False,
+        widget=forms.TimeInput(attrs={'type': 'time'}),
+        help_text='Leave blank to run to the end of the day',
+    )
+    reason = forms.CharField(
+        widget=forms.Textarea(attrs={'rows': 3}),
+        help_text='Sent to every guest whose booking is cancelled',
+    )
 
     def clean(self):
         cleaned_data = super().clean()
-        slot_value = cleaned_data.get('slot')
+        date = cleaned_data.get('date')
 
-        if not slot_value:
+        if not date:
             return cleaned_data
 
-        try:
-            start_dt = datetime.fromisoformat(slot_value)
-
-            if timezone.is_naive(start_dt):
-                start_dt = timezone.make_aware(start_dt)
-
-        except Exception:
-            raise ValidationError('Invalid time slot selected.')
-
-        cleaned_data['start_time'] = start_dt
-
-        return cleaned_data
-
-    def save(self, commit=True):
-        if 'start_time' not in self.cleaned_data:
-            raise forms.ValidationError('Please select a valid booking time.')
-
-        booking = super().save(commit=False)
+        end_date = cleaned_data.get('end_date') or date
+        from_time = cleaned_data.get('from_time') or time.min
 
-        booking.start_time = self.cleaned_data['start_time']
-        booking.party_size = self.cleaned_data['party_size']
-        booking.name = self.user
+        start = timezone.make_aware(datetime.combine(date, from_time))
 
-        start = booking.start_time
-        end = booking.start_time + SLOT_DURATION
-
-        table_qs = Table.objects.filter(seats__gte=booking.party_size)
-
-        # Bookings that would conflict with this slot (ignore CANCELLED)
-        conflict_bookings = Booking.objects.filter(
-            status='BOOKED',
-            time_range__overlap=(start, end),
-        )
-
-        # When editing, exclude the booking itself from the conflict check
-        if booking.pk:
-            conflict_bookings = conflict_bookings.exclude(pk=booking.pk)
-
-        # Exclude any table that has a conflicting booking
-        table_qs = table_qs.exclude(bookings__in=conflict_bookings)
-
-        # Pick the smallest suitable table
-        booking.table = table_qs.order_by('seats').first()
+        if cleaned_data.get('to_time'):
+            end = timezone.make_aware(
+                datetime.combine(end_date, cleaned_data['to_time'])
+            )
+        else:
+            end = timezone.make_aware(
+                datetime.combine(end_date + timedelta(days=1), time.min)
+            )
 
-        if booking.table_id is None:
+        if end <= start:
             raise forms.ValidationError(
-                'That time is no longer available. Please choose another.'
+                'The end of the window must be after its start.'
             )
 
-        if commit:
-            booking.save()
+        cleaned_data['start'] = start
+        cleaned_data['end'] = end
 
-        return booking
+        return cleaned_data
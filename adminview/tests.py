@@ -1,3 +1,304 @@
+import csv
+import io
+import json
+from datetime import datetime
 from django.test import TestCase
+from django.urls import reverse
+from django.contrib.auth.models import User
+from django.utils import timezone
+from booking.models import Booking, BookingArchive, OutboxEmail, Table
 
-# Create your tests here.
+
+class ExportBookingsTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a staff user, a guest and bookings on three days
+        """
+        self.staff = User.objects.create_user(
+            username='staff',
+            password='password123',
+            is_staff=True,
+        )
+        self.client.force_login(self.staff)
+
+        self.guest = User.objects.create_user(
+            username='guest',
+            email='guest@example.com',
+        )
+        table = Table.objects.create(number=7, seats=4)
+
+        for day in (1, 2, 3):
+            Booking.objects.create(
+                table=table,
+                name=self.guest,
+                party_size=2,
+                start_time=timezone.make_aware(
+                    datetime(2026, 2, day, 19, 0)
+                ),
+                allergies='Nuts, shellfish' if day == 2 else '',
+            )
+
+        self.url = reverse('adminview:export_bookings')
+
+    def download(self, **params):
+        response = self.client.get(self.url, params)
+        return response, b''.join(response.streaming_content).decode()
+
+    def test_json_lines_export(self):
+        """
+        Test that a date range streams one JSON object per booking
+        """
+        response, body = self.download(
+            start='2026-02-02',
+            end='2026-02-03',
+            format='jsonl',
+        )
+
+        rows = [json.loads(line) for line in body.splitlines()]
+
+        self.assertEqual(response['Content-Type'], 'application/jsonl')
+        self.assertEqual(len(rows), 2)
+        self.assertEqual(rows[0]['table'], 7)
+        self.assertEqual(rows[0]['email'], 'guest@example.com')
+        self.assertEqual(rows[0]['allergies'], 'Nuts, shellfish')
+        self.assertEqual(
+            rows[1]['start_time'],
+            timezone.localtime(
+                timezone.make_aware(datetime(2026, 2, 3, 19, 0))
+            ).isoformat(),
+        )
+
+    def test_csv_export(self):
+        """
+        Test that CSV has a header and a row per booking
+        """
+        response, body = self.download(
+            start='2026-02-01',
+            end='2026-02-03',
+            format='csv',
+        )
+
+        rows = list(csv.reader(io.StringIO(body)))
+
+        self.assertIn('attachment;', response['Content-Disposition'])
+        self.assertEqual(rows[0][0], 'reference')
+        self.assertEqual(len(rows), 4)
+        self.assertEqual(rows[2][-1], 'Nuts, shellfish')
+
+    def test_invalid_range_is_rejected(self):
+        """
+        Test that missing, impossible or reversed dates and unknown
+        formats are rejected
+        """
+        for params in (
+            {},
+            {'start': '2026-02-30', 'end': '2026-03-02'},
+            {'start': '2026-02-01', 'end': '2026-02-31'},
+            {'start': '2026-02-03', 'end': '2026-02-01'},
+            {'start': '2026-02-01', 'end': '2026-02-03', 'format': 'xml'},
+        ):
+            response = self.client.get(self.url, params)
+            self.assertEqual(response.status_code, 400)
+
+    def test_export_is_staff_only(self):
+        """
+        Test that guests cannot export bookings
+        """
+        self.client.force_login(self.guest)
+
+        response = self.client.get(self.url, {
+            'start': '2026-02-01',
+            'end': '2026-02-03',
+        })
+
+        self.assertEqual(response.status_code, 302)
+
+
+class BulkCancelViewTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a staff user, a guest and two bookings on one evening
+        and one the next day
+        """
+        self.staff = User.objects.create_user(
+            username='staff',
+            password='password123',
+            is_staff=True,
+        )
+        self.client.force_login(self.staff)
+
+        guest = User.objects.create_user(
+            username='guest',
+            email='guest@example.com',
+        )
+        table = Table.objects.create(number=7, seats=4)
+        other = Table.objects.create(number=8, seats=4)
+
+        self.bookings = [
+            Booking.objects.create(
+                table=booking_table,
+                name=guest,
+                party_size=2,
+                start_time=timezone.make_aware(datetime(2026, 2, day, 19)),
+            )
+            for booking_table, day in ((table, 2), (other, 2), (table, 3))
+        ]
+        self.url = reverse('adminview:bulk_cancel')
+
+    def test_cancels_the_window_and_queues_emails(self):
+        """
+        Test that posting a day cancels its bookings, queues an email
+        per booking and reports how many were cancelled
+        """
+        response = self.client.post(self.url, {
+            'date': '2026-02-02',
+            'reason': 'Kitchen flood',
+        }, follow=True)
+
+        self.assertRedirects(response, reverse('adminview:cancellations'))
+        self.assertContains(response, '2 bookings cancelled')
+        self.assertContains(response, 'Kitchen flood')
+        self.assertEqual(
+            list(
+                Booking.objects
+                .order_by('start_time', 'id')
+                .values_list('status', flat=True)
+            ),
+            ['CANCELLED', 'CANCELLED', 'BOOKED'],
+        )
+        self.assertEqual(OutboxEmail.objects.count(), 2)
+
+    def test_time_window_within_a_day(self):
+        """
+        Test that a from and to time limit the cancellation to the
+        bookings overlapping them
+        """
+        self.client.post(self.url, {
+            'date': '2026-02-02',
+            'end_date': '2026-02-03',
+            'from_time': '21:00',
+            'to_time': '20:00',
+            'reason': 'Private event',
+        })
+
+        self.assertEqual(
+            Booking.objects.filter(status='CANCELLED').count(),
+            1,
+        )
+
+    def test_window_must_end_after_it_starts(self):
+        """
+        Test that a window ending before it starts is rejected
+        """
+        response = self.client.post(self.url, {
+            'date': '2026-02-02',
+            'from_time': '20:00',
+            'to_time': '18:00',
+            'reason': 'Closed',
+        })
+
+        self.assertContains(response, 'must be after its start')
+        self.assertFalse(
+            Booking.objects.filter(status='CANCELLED').exists()
+        )
+
+    def test_bulk_cancel_is_staff_only(self):
+        """
+        Test that guests are sent to log in instead
+        """
+        self.client.force_login(User.objects.get(username='guest'))
+
+        response = self.client.post(self.url, {
+            'date': '2026-02-02',
+            'reason': 'Closed',
+        })
+
+        self.assertEqual(response.status_code, 302)
+        self.assertFalse(
+            Booking.objects.filter(status='CANCELLED').exists()
+        )
+
+
+class AcknowledgeCancellationTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a staff user and a cancelled and a live booking
+        """
+        self.staff = User.objects.create_user(
+            username='staff',
+            password='password123',
+            is_staff=True,
+        )
+        self.client.force_login(self.staff)
+
+        guest = User.objects.create_user(username='guest')
+        table = Table.objects.create(number=7, seats=4)
+
+        self.cancelled, self.booked = [
+            Booking.objects.create(
+                table=table,
+                name=guest,
+                party_size=2,
+                start_time=timezone.make_aware(datetime(2026, 2, 2, hour)),
+                status=status,
+            )
+            for hour, status in ((12, 'CANCELLED'), (19, 'BOOKED'))
+        ]
+
+    def acknowledge(self, booking):
+        return self.client.post(
+            reverse('adminview:staff_delete_booking', args=[booking.pk]),
+            follow=True,
+        )
+
+    def test_acknowledging_archives_the_booking(self):
+        """
+        Test that acknowledging a cancellation moves it to the archive
+        """
+        response = self.acknowledge(self.cancelled)
+
+        self.assertContains(response, 'has been archived')
+        self.assertFalse(
+            Booking.objects.filter(pk=self.cancelled.pk).exists()
+        )
+        self.assertEqual(
+            BookingArchive.objects.get().reference,
+            self.cancelled.reference,
+        )
+
+    def test_live_bookings_are_still_deleted(self):
+        """
+        Test that a booking that is not cancelled is deleted as before
+        rather than archived
+        """
+        response = self.acknowledge(self.booked)
+
+        self.assertContains(response, 'has been deleted')
+        self.assertFalse(Booking.objects.filter(pk=self.booked.pk).exists())
+        self.assertFalse(BookingArchive.objects.exists())
+
+    def test_get_changes_nothing(self):
+        """
+        Test that following a link to acknowledge is refused, so only
+        the form on the cancellations page archives or deletes
+        """
+        for booking in (self.cancelled, self.booked):
+            response = self.client.get(
+                reverse('adminview:staff_delete_booking', args=[booking.pk]),
+            )
+
+            self.assertEqual(response.status_code, 405)
+            self.assertTrue(Booking.objects.filter(pk=booking.pk).exists())
+
+        self.assertFalse(BookingArchive.objects.exists())
+
+    def test_missing_bookings_are_not_found(self):
+        """
+        Test that an id with no live booking is a 404
+        """
+        self.acknowledge(self.cancelled)
+
+        self.assertEqual(self.acknowledge(self.cancelled).status_code, 404)
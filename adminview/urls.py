@@ -15,7 +15,17 @@ urlpatterns = [
         name='staff_delete_booking',
     ),
     path('cancellations/', views.cancellations_view, name='cancellations'),
+    path(
+        'cancellations/bulk/',
+        views.bulk_cancel_view,
+        name='bulk_cancel',
+    ),
     path('reservations/', views.reservations_view, name='reservations'),
+    path(
+        'reservations/export/',
+        views.export_bookings,
+        name='export_bookings',
+    ),
     path(
         'reservations/edit/<int:booking_id>/',
         views.staff_booking,
@@ -1,9 +1,21 @@
+from datetime import datetime, time, timedelta
+from django.http import HttpResponseBadRequest, StreamingHttpResponse
 from django.shortcuts import get_object_or_404, redirect, render
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
-from django.utils.dateparse import parse_datetime
-from booking.models import Booking
-from .forms import StaffBookingForm
+from django.template.defaultfilters import pluralize
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from django.utils.timezone import localtime
+from django.views.decorators.http import require_POST
+from booking.archive import archive_cancelled
+from booking.cancellation import cancel_window
+from booking.constants import SLOT_DURATION
+from booking.models import Booking, BookingArchive
+from booking.streaming import CHUNK_SIZE, csv_chunks, json_lines_chunks
+from .forms import BulkCancelForm, StaffBookingForm
 
 
 @staff_member_required(login_url='account_login')
@@ -21,7 +33,12 @@ def cancellations_view(request):
     Staff-only Cancellations page.
     This is the page linked from the main navigation.
     """
-    bookings = Booking.objects.filter(status__iexact='CANCELLED')
+    bookings = (
+        Booking.objects
+        .filter(status='CANCELLED')
+        .select_related('name')
+        .order_by('start_time')
+    )
     return render(request, 'adminview/cancellations.html', {
         'bookings': bookings
     })
@@ -47,11 +64,51 @@ def staff_cancel_booking(request, booking_ref):
     return redirect('adminview:reservations')
 
 
+@staff_member_required(login_url='account_login')
+def bulk_cancel_view(request):
+    """
+    Cancels every booking in a date or time window, e.g. for a closure
+    or private event, and queues an email with the reason to each
+    guest.
+    """
+    form = BulkCancelForm(request.POST or None)
+
+    if request.method == 'POST' and form.is_valid():
+        bookings = cancel_window(
+            form.cleaned_data['start'],
+            form.cleaned_data['end'],
+            form.cleaned_data['reason'],
+        )
+        messages.success(
+            request,
+            f'{len(bookings)} booking{pluralize(len(bookings))} cancelled '
+            f'and the guests will be emailed.',
+        )
+        return redirect('adminview:cancellations')
+
+    return render(request, 'adminview/bulk_cancel.html', {'form': form})
+
+
 @staff_member_required
+@require_POST
 def staff_delete_booking(request, booking_id):
     booking = get_object_or_404(Booking, id=booking_id)
-    booking.delete()
-    messages.success(request, f'Booking {booking.reference} has been deleted.')
+
+    # Cancelled bookings are kept in the archive, live ones are still
+    # deleted outright
+    if booking.status == 'CANCELLED':
+        archive_cancelled([booking.pk])
+        messages.success(
+            request,
+            f'Booking {booking.reference} has been archived.',
+        )
+    else:
+        booking.delete()
+        messages.success(
+            request,
+            f'Booking {booking.reference} has been deleted.',
+        )
+
     return redirect('adminview:cancellations')
 
 
@@ -64,16 +121,14 @@ def staff_booking(request, booking_id=None):
     if request.method == 'POST':
         form = StaffBookingForm(request.POST, instance=booking)
         if form.is_valid():
-            new_booking = form.save(commit=False)
-            slot = request.POST.get('slot')
-            if slot:
-                start_datetime = parse_datetime(slot)
-                if start_datetime:
-                    new_booking.start_time = start_datetime
-            new_booking.name = form.cleaned_data['name']
-            new_booking.save()
-            messages.success(request, 'Booking saved successfully!')
-            return redirect('adminview:reservations')
+            try:
+                form.save()
+            except ValidationError as error:
+                # Every suitable table was taken while the form was open
+                form.add_error(None, error)
+            else:
+                messages.success(request, 'Booking saved successfully!')
+                return redirect('adminview:reservations')
     else:
         form = StaffBookingForm(instance=booking)  # ✅ pre-filled for GET
 
@@ -86,3 +141,105 @@ def staff_booking(request, booking_id=None):
             'editing': True if booking else False
         }
     )
+
+
+EXPORT_COLUMNS = (
+    ('reference', 'reference'),
+    ('start_time', 'start_time'),
+    ('party_size', 'party_size'),
+    ('status', 'status'),
+    ('table', 'table__number'),
+    ('username', 'name__username'),
+    ('first_name', 'name__first_name'),
+    ('last_name', 'name__last_name'),
+    ('email', 'name__email'),
+    ('allergies', 'allergies'),
+)
+
+# Archived bookings keep the table number rather than the table
+ARCHIVE_EXPORT_FIELDS = [
+    'table_number' if field == 'table__number' else field
+    for _, field in EXPORT_COLUMNS
+]
+
+
+def export_rows(start_date, end_date):
+    """
+    Yields a tuple per booking on the dates from start_date to end_date
+    inclusive, reading the bookings a chunk at a time.
+    """
+    start = timezone.make_aware(datetime.combine(start_date, time.min))
+    end = timezone.make_aware(
+        datetime.combine(end_date + timedelta(days=1), time.min)
+    )
+
+    archived = (
+        BookingArchive.objects
+        .filter(start_time__lt=end, end_time__gt=start)
+        .values_list(*ARCHIVE_EXPORT_FIELDS)
+    )
+    # Each status is read through its own partial index. Every booking
+    # lasts SLOT_DURATION, so cancelled ones are found by start time
+    rows = (
+        Booking.objects
+        .filter(
+            Q(status='BOOKED', time_range__overlap=(start, end))
+            | Q(
+                status='CANCELLED',
+                start_time__gt=start - SLOT_DURATION,
+                start_time__lt=end,
+            )
+        )
+        .values_list(*[field for _, field in EXPORT_COLUMNS])
+        .union(archived, all=True)
+        .order_by('start_time', 'reference')
+        .iterator(chunk_size=CHUNK_SIZE)
+    )
+
+    for row in rows:
+        yield (row[0], localtime(row[1]).isoformat()) + row[2:]
+
+
+@staff_member_required(login_url='account_login')
+def export_bookings(request):
+    """
+    Streams the bookings between two dates as JSON Lines or CSV.
+    """
+    try:
+        start_date = parse_date(request.GET.get('start') or '')
+        end_date = parse_date(request.GET.get('end') or '')
+    except ValueError:
+        # Well formed but not a real day, e.g. 2026-02-30
+        start_date = end_date = None
+
+    export_format = request.GET.get('format', 'jsonl')
+
+    if (
+        not start_date
+        or not end_date
+        or end_date < start_date
+        or export_format not in ('jsonl', 'csv')
+    ):
+        return HttpResponseBadRequest(
+            'Please give start and end dates as YYYY-MM-DD and a format '
+            'of jsonl or csv.'
+        )
+
+    header = [column for column, _ in EXPORT_COLUMNS]
+    rows = export_rows(start_date, end_date)
+
+    if export_format == 'csv':
+        response = StreamingHttpResponse(
+            csv_chunks(header, rows),
+            content_type='text/csv',
+        )
+    else:
+        response = StreamingHttpResponse(
+            json_lines_chunks(dict(zip(header, row)) for row in rows),
+            content_type='application/jsonl',
+        )
+
+    filename = f'bookings-{start_date}-{end_date}.{export_format}'
+    response['Content-Disposition'] = f'attachment; filename="{filename}"'
+
+    return response
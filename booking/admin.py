@@ -1,9 +1,14 @@
-from django.conf import settings
 from django.contrib import admin, messages
-from django.template.loader import render_to_string
-from django.core.mail import send_mail
-from .models import Booking, OpeningHours, Table
+from .cancellation import cancellation_email
+from .models import (
+    Booking,
+    BookingArchive,
+    OpeningHours,
+    OutboxEmail,
+    Table,
+)
 from .forms import BookingAdminForm
+from .outbox import queue_email
 
 admin.site.register(OpeningHours)
 admin.site.register(Table)
@@ -59,32 +64,84 @@ class BookingAdmin(admin.ModelAdmin):
             and obj.status == 'CANCELLED'
             and obj.name.email
         ):
-
-            reason = form.cleaned_data.get('cancellation_reason')
-
-            context = {
-                'user': obj.name,
-                'booking': obj,
-                'reason': reason,
-            }
-
-            message = render_to_string(
-                'account/email/cancellation_notification.txt',
-                context,
+            subject, body, recipients = cancellation_email(
+                obj,
+                form.cleaned_data.get('cancellation_reason'),
             )
 
-            send_mail(
-                subject=(
-                    'Gregorys Bistro: '
-                    f'Booking cancelled - Ref {obj.reference}'
-                ),
-                message=message,
-                from_email=getattr(settings, 'DEFAULT_FROM_EMAIL', None),
-                recipient_list=[obj.name.email],
-                fail_silently=False,
+            # Sent by the send_outbox worker once the save commits
+            queue_email(
+                subject=subject,
+                body=body,
+                recipients=recipients,
             )
 
             messages.success(
                 request,
-                f'Cancellation email sent to {obj.name.email}.',
+                f'Cancellation email queued for {obj.name.email}.',
             )
+
+
+@admin.register(OutboxEmail)
+class OutboxEmailAdmin(admin.ModelAdmin):
+    """
+    Lists queued emails so failed sends can be spotted and retried.
+    """
+    list_display = (
+        'subject',
+        'status',
+        'attempts',
+        'next_attempt_at',
+        'sent_on',
+    )
+
+    list_filter = (
+        'status',
+    )
+
+    search_fields = (
+        'subject',
+        'recipients',
+    )
+
+    readonly_fields = (
+        'created_on',
+        'sent_on',
+        'last_error',
+    )
+
+
+@admin.register(BookingArchive)
+class BookingArchiveAdmin(admin.ModelAdmin):
+    """
+    Read only view of archived bookings, which are never changed.
+    """
+    list_display = (
+        'reference',
+        'start_time',
+        'name',
+        'party_size',
+        'status',
+        'archived_on',
+    )
+
+    list_filter = (
+        'status',
+    )
+
+    search_fields = (
+        'reference',
+        'name__username',
+        'name__email',
+    )
+
+    date_hierarchy = 'start_time'
+
+    def has_add_permission(self, request):
+        return False
+
+    def has_change_permission(self, request, obj=None):
+        return False
+
+    def has_delete_permission(self, request, obj=None):
+        return False
@@ -0,0 +1,163 @@
+from datetime import datetime
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.timezone import localtime
+from .assignment import get_strategy
+from .constants import SLOT_DURATION
+from .occupancy import get_occupancy
+from .registry import registry
+from .utils import get_slot_starts
+
+DOUBLE_BOOKING_CONSTRAINT = 'prevent_table_double_booking'
+
+# Tables tried before giving up when other requests keep taking them
+MAX_ALLOCATION_ATTEMPTS = 5
+
+NO_LONGER_AVAILABLE = (
+    'That time is no longer available. Please choose another.'
+)
+
+
+def is_double_booking(error):
+    """
+    Returns True when an IntegrityError came from the table double
+    booking exclusion constraint, or its copy on a monthly partition.
+    """
+    diag = getattr(error.__cause__, 'diag', None)
+    name = getattr(diag, 'constraint_name', None) or ''
+    return (
+        name == DOUBLE_BOOKING_CONSTRAINT
+        or name.startswith(f'{DOUBLE_BOOKING_CONSTRAINT}_')
+    )
+
+
+def parse_slot(value):
+    """
+    Returns the aware start time for a submitted slot value.
+    """
+    try:
+        start_time = datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise ValidationError('Invalid time slot selected.')
+
+    if timezone.is_naive(start_time):
+        start_time = timezone.make_aware(start_time)
+
+    return start_time
+
+
+def validate_slot(start_time, party_size, booking=None):
+    """
+    Checks a requested start time is a bookable slot with a free table,
+    without generating the rest of the day's slots. booking is the
+    booking being edited, if any, which keeps its current time.
+    """
+    from .models import Booking, Table
+
+    keeps_time = booking is not None and booking.start_time == start_time
+
+    if not keeps_time:
+        date = localtime(start_time).date()
+
+        opening = registry.opening(date.weekday())
+
+        if opening is None:
+            raise ValidationError('The restaurant is closed on this day.')
+
+        if start_time not in get_slot_starts(date, opening):
+            raise ValidationError('Invalid time slot selected.')
+
+    # Bookings that would conflict with this slot (ignore CANCELLED)
+    conflict_bookings = Booking.objects.filter(
+        status='BOOKED',
+        time_range__overlap=(start_time, start_time + SLOT_DURATION),
+    )
+
+    if booking is not None:
+        conflict_bookings = conflict_bookings.exclude(pk=booking.pk)
+
+    available_tables = (
+        Table.objects
+        .filter(seats__gte=party_size)
+        .exclude(bookings__in=conflict_bookings)
+    )
+
+    if not available_tables.exists():
+        raise ValidationError(NO_LONGER_AVAILABLE)
+
+
+def free_tables_for(booking, tried=()):
+    """
+    Returns the ids of tables free for the booking's slot, best first
+    by the assignment strategy, skipping any already tried.
+    """
+    index = get_occupancy(localtime(booking.start_time).date())
+
+    if index is None:
+        return []
+
+    # When editing, ignore the booking's own time on the floor
+    exclude = [booking.pk] if booking.pk else ()
+
+    free_tables = [
+        table_id
+        for table_id in index.free_tables(
+            booking.start_time,
+            booking.party_size,
+            exclude=exclude,
+        )
+        if table_id not in tried
+    ]
+
+    return get_strategy().order(
+        index,
+        booking.start_time,
+        booking.party_size,
+        free_tables,
+        exclude,
+    )
+
+
+def pick_table(booking):
+    """
+    Assigns the best free table without saving.
+    """
+    free_tables = free_tables_for(booking)
+
+    if not free_tables:
+        raise ValidationError(NO_LONGER_AVAILABLE)
+
+    booking.table_id = free_tables[0]
+
+    return booking
+
+
+def allocate_table(booking):
+    """
+    Assigns the best free table and saves the booking. If another
+    request takes the table first, the exclusion constraint rejects the
+    save and the next best free table is tried instead.
+    """
+    tried = set()
+
+    for _ in range(MAX_ALLOCATION_ATTEMPTS):
+        free_tables = free_tables_for(booking, tried)
+
+        if not free_tables:
+            break
+
+        booking.table_id = free_tables[0]
+
+        try:
+            with transaction.atomic():
+                booking.save()
+        except IntegrityError as error:
+            if not is_double_booking(error):
+                raise
+            tried.add(booking.table_id)
+            continue
+
+        return booking
+
+    raise ValidationError(NO_LONGER_AVAILABLE)
@@ -0,0 +1,112 @@
+from django.db import connection, transaction
+from .cache import bump_availability
+from .models import Booking, BookingArchive, Table
+from .signals import booking_dates
+
+BATCH_SIZE = 1000
+
+# Moves one batch of bookings matching the condition into the archive
+# in a single statement, returning the times of those moved. SKIP
+# LOCKED leaves rows another request is changing for the next run
+# instead of waiting on them.
+ARCHIVE_SQL = '''
+    WITH batch AS (
+        SELECT id FROM {booking}
+        WHERE {condition}
+        ORDER BY id
+        LIMIT %(batch_size)s
+        FOR UPDATE SKIP LOCKED
+    ), moved AS (
+        DELETE FROM {booking} AS booking
+        USING batch
+        WHERE booking.id = batch.id
+        RETURNING booking.*
+    )
+    INSERT INTO {archive} (
+        booking_id, reference, name_id, table_number, party_size,
+        start_time, end_time, status, allergies, cancellation_reason,
+        archived_on
+    )
+    SELECT
+        moved.id, moved.reference, moved.name_id, tables.number,
+        moved.party_size, lower(moved.time_range), upper(moved.time_range),
+        moved.status,
+        CASE WHEN %(scrub)s THEN '' ELSE moved.allergies END,
+        moved.cancellation_reason, now()
+    FROM moved
+    JOIN {table} AS tables ON tables.id = moved.table_id
+    RETURNING start_time, end_time
+'''
+
+# Bookings that finished before the cutoff. Cancellations still to
+# come stay live until staff acknowledge them
+ENDED = "time_range << tstzrange(%(cutoff)s, NULL, '[)')"
+
+# The given bookings, if they are cancelled
+CANCELLED_IDS = "id = ANY(%(ids)s) AND status = 'CANCELLED'"
+
+
+def archive_batch(condition, params, batch_size=BATCH_SIZE, scrub=False):
+    """
+    Moves up to batch_size bookings matching the condition into the
+    archive in its own short transaction, and returns how many moved.
+    """
+    sql = ARCHIVE_SQL.format(
+        booking=Booking._meta.db_table,
+        archive=BookingArchive._meta.db_table,
+        table=Table._meta.db_table,
+        condition=condition,
+    )
+
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(sql, {
+                **params,
+                'batch_size': batch_size,
+                'scrub': scrub,
+            })
+            rows = cursor.fetchall()
+
+        # Signals do not fire for raw SQL, so invalidate here, once for
+        # the whole batch
+        dates = [
+            date
+            for time_range in rows
+            for date in booking_dates(time_range)
+        ]
+        if dates:
+            bump_availability(*dates)
+
+    return len(rows)
+
+
+def archive_ended(cutoff, batch_size=BATCH_SIZE, scrub=False):
+    """
+    Yields the number moved by each batch while archiving every booking
+    that ended before cutoff.
+    """
+    while True:
+        moved = archive_batch(
+            ENDED,
+            {'cutoff': cutoff},
+            batch_size,
+            scrub,
+        )
+
+        if not moved:
+            return
+
+        yield moved
+
+
+def archive_cancelled(ids, scrub=False):
+    """
+    Archives the given cancelled bookings, e.g. once staff have
+    acknowledged them, and returns how many moved.
+    """
+    return archive_batch(
+        CANCELLED_IDS,
+        {'ids': list(ids)},
+        batch_size=len(ids),
+        scrub=scrub,
+    )
@@ -0,0 +1,107 @@
+from abc import ABC, abstractmethod
+from datetime import timedelta
+from django.conf import settings
+from django.utils.module_loading import import_string
+from .constants import SLOT_DURATION, INTERVAL
+
+DEFAULT_STRATEGY = 'booking.assignment.BestFitGapStrategy'
+
+# Idle table time a seat left empty is worth, so a tight gap on a bigger
+# table can beat a wide open smaller one, but two spare seats never
+# outweigh a whole free evening on a table that fits
+SPARE_SEAT_COST = timedelta(minutes=30)
+
+
+class AssignmentStrategy(ABC):
+    """
+    Decides which free table a booking is given. Subclasses order the
+    candidate tables, best first; allocation moves down the list when a
+    table is lost to another request.
+    """
+    name = ''
+
+    @abstractmethod
+    def order(self, index, start, party_size, table_ids, exclude=()):
+        pass
+
+
+class SmallestTableStrategy(AssignmentStrategy):
+    """
+    The smallest table that seats the party, as bookings were always
+    assigned before strategies were added.
+    """
+    name = 'smallest table'
+
+    def order(self, index, start, party_size, table_ids, exclude=()):
+        # The index already lists free tables smallest first
+        return list(table_ids)
+
+
+class BestFitGapStrategy(AssignmentStrategy):
+    """
+    Best fit: picks the table the booking wastes least of, counting the
+    idle time left either side of it until the table's neighbouring
+    bookings, and SPARE_SEAT_COST for each seat the party leaves empty.
+    Sittings are packed back to back, on a bigger table when it has a
+    gap that fits, so the longer free runs of every table size stay
+    open for later bookings.
+    """
+    name = 'best fit by gap'
+
+    def order(self, index, start, party_size, table_ids, exclude=()):
+        seats = {
+            table_id: table_seats for table_seats, table_id in index.tables
+        }
+        seat_cost = SPARE_SEAT_COST // INTERVAL
+
+        def fit(table_id):
+            before, after = index.gaps(table_id, start, exclude)
+            spare = seats[table_id] - party_size
+            waste = spare * seat_cost + before + after
+            return waste, seats[table_id], table_id
+
+        return sorted(table_ids, key=fit)
+
+
+def simulate(index, requests, strategy):
+    """
+    Replays (start, party_size) requests in arrival order against an
+    empty day's index, seating each one the strategy can place. Returns
+    the requests and covers seated and the share of seat time used.
+    """
+    seated = covers = used = 0
+
+    for booking_id, (start, party_size) in enumerate(requests):
+        free_tables = index.free_tables(start, party_size)
+
+        if not free_tables:
+            continue
+
+        table_id = strategy.order(index, start, party_size, free_tables)[0]
+        index.set_booking(booking_id, table_id, (start, start + SLOT_DURATION))
+
+        seated += 1
+        covers += party_size
+        used += party_size * (SLOT_DURATION // INTERVAL)
+
+    capacity = sum(seats for seats, _ in index.tables) * index.size
+
+    return {
+        'requests': len(requests),
+        'seated': seated,
+        'covers': covers,
+        'utilisation': used / capacity if capacity else 0,
+    }
+
+
+def get_strategy(path=None):
+    """
+    Returns the strategy named by path, or by the
+    BOOKING_ASSIGNMENT_STRATEGY setting.
+    """
+    if path is None:
+        path = getattr(
+            settings, 'BOOKING_ASSIGNMENT_STRATEGY', DEFAULT_STRATEGY
+        )
+
+    return import_string(path)()
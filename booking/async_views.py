@@ -0,0 +1,157 @@
+from functools import wraps
+from asgiref.sync import sync_to_async
+from django.contrib.auth.views import redirect_to_login
+from django.http import JsonResponse, StreamingHttpResponse
+from django.shortcuts import resolve_url
+from django.utils.cache import get_conditional_response, patch_cache_control
+from django.utils.dateparse import parse_date
+from django.utils.http import quote_etag
+from .cache import get_cached_available_slots
+from .calendar import (
+    calendar_bookings,
+    calendar_etag,
+    calendar_event,
+    get_window,
+)
+from .instrumentation import query_budget
+from .models import Booking
+from .streaming import CHUNK_SIZE, ajson_array_chunks
+from .utils import get_available_slots
+
+
+async def get_user(request):
+    """
+    Loads the lazy request.user without blocking the event loop.
+    """
+    def load():
+        request.user.is_authenticated
+        return request.user
+
+    return await sync_to_async(load)()
+
+
+def async_login_required(view):
+    """
+    login_required for async views, which Django 4.2 does not support.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await get_user(request)
+
+        if not user.is_authenticated:
+            return redirect_to_login(request.get_full_path())
+
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+def async_staff_member_required(view):
+    """
+    staff_member_required for async views, sending others to log in.
+    """
+    @wraps(view)
+    async def wrapper(request, *args, **kwargs):
+        user = await get_user(request)
+
+        if not (user.is_active and user.is_staff):
+            return redirect_to_login(
+                request.get_full_path(),
+                resolve_url('account_login'),
+            )
+
+        return await view(request, *args, **kwargs)
+
+    return wrapper
+
+
+# Async versions of the endpoints the booking page and staff calendar
+# poll, used under ASGI (see Async Deployment in the README)
+@async_login_required
+@query_budget(8)
+async def available_slots(request):
+    date_str = request.GET.get('date')
+    party_size = request.GET.get('party_size')
+    exclude_id = request.GET.get('exclude')
+
+    if not date_str or not party_size:
+        return JsonResponse({'slots': []})
+
+    try:
+        date = parse_date(date_str)
+    except ValueError:
+        # Well formed but not a real day, e.g. 2026-02-30
+        date = None
+    if not date:
+        return JsonResponse({'slots': []})
+
+    try:
+        party_size = int(party_size)
+    except (TypeError, ValueError):
+        return JsonResponse({'slots': []})
+
+    # Used when editing an existing booking
+    booking = None
+    if exclude_id:
+        try:
+            booking = await Booking.objects.only('pk').aget(
+                id=exclude_id,
+                name=request.user,
+            )
+        except (Booking.DoesNotExist, ValueError):
+            booking = None
+
+    if booking is None:
+        slots = await sync_to_async(get_cached_available_slots)(
+            date=date,
+            party_size=party_size,
+        )
+    else:
+        slots = await sync_to_async(get_available_slots)(
+            date=date,
+            party_size=party_size,
+            exclude_bookings=Booking.objects.filter(pk=booking.pk),
+        )
+
+    data = [
+        {
+            'value': slot.isoformat(),
+            'label': slot.strftime('%H:%M'),
+        }
+        for slot in slots
+    ]
+
+    return JsonResponse({'slots': data})
+
+
+@async_staff_member_required
+@query_budget(5)
+async def booking_calendar_data(request):
+    """
+    Returns bookings overlapping the start/end window FullCalendar asks
+    for as calendar events, streamed as the rows arrive. Unchanged
+    windows get a 304.
+    """
+    window = get_window(request)
+
+    if window is None:
+        return JsonResponse([], safe=False)
+
+    etag = await sync_to_async(calendar_etag)(request)
+    etag = quote_etag(etag) if etag else None
+
+    response = get_conditional_response(request, etag=etag)
+
+    if response is None:
+        rows = calendar_bookings(*window).aiterator(chunk_size=CHUNK_SIZE)
+        response = StreamingHttpResponse(
+            ajson_array_chunks(calendar_event(row) async for row in rows),
+            content_type='application/json',
+        )
+
+    if etag:
+        response.headers.setdefault('ETag', etag)
+
+    patch_cache_control(response, private=True, no_cache=True)
+
+    return response
@@ -0,0 +1,229 @@
+import time
+import uuid
+from datetime import timedelta
+from django.core.cache import cache
+from django.db import connection, transaction
+from django.utils import timezone
+from .constants import MAX_RANGE_DAYS
+from .utils import get_available_slots_range
+
+GLOBAL_VERSION_KEY = 'availability:version'
+
+
+def date_version_key(date):
+    return f'availability:version:{date.isoformat()}'
+
+
+def slots_key(date, party_size, global_version, date_version):
+    return (
+        f'availability:slots:{date.isoformat()}:{party_size}:'
+        f'{global_version}:{date_version}'
+    )
+
+
+def new_version():
+    # Prefixed with the time in hex so versions sort by when they were
+    # made when debugging
+    return f'{time.time_ns():x}.{uuid.uuid4().hex}'
+
+
+# Swaps in the new version and returns the one it replaced, under the
+# row lock, so the before and after of a bump are always consecutive
+# even when processes bump at once
+SWAP_VERSIONS_SQL = '''
+    UPDATE {table} AS current
+    SET version = %s
+    FROM (
+        SELECT key, version FROM {table}
+        WHERE key = ANY(%s)
+        ORDER BY key
+        FOR UPDATE
+    ) AS previous
+    WHERE current.key = previous.key
+    RETURNING current.key, previous.version
+'''
+
+INSERT_VERSIONS_SQL = '''
+    INSERT INTO {table} (key, version)
+    SELECT unnest(%s::varchar[]), %s
+    ON CONFLICT (key) DO NOTHING
+    RETURNING key
+'''
+
+# Returns every key, including any another process created meanwhile,
+# so reading a new date costs one more query however lookups race
+CREATE_VERSIONS_SQL = '''
+    INSERT INTO {table} (key, version)
+    SELECT unnest(%s::varchar[]), %s
+    ON CONFLICT (key) DO UPDATE SET version = {table}.version
+    RETURNING key, version
+'''
+
+
+def _version_table():
+    from .models import AvailabilityVersion
+
+    return connection.ops.quote_name(AvailabilityVersion._meta.db_table)
+
+
+def _swap_versions(keys, after):
+    """
+    Moves each key on to the version after and returns the versions
+    before, None for keys that had none.
+    """
+    table = _version_table()
+    before = {}
+    missing = sorted(keys)
+
+    with connection.cursor() as cursor:
+        while missing:
+            cursor.execute(
+                SWAP_VERSIONS_SQL.format(table=table),
+                [after, missing],
+            )
+            before.update(cursor.fetchall())
+
+            missing = [key for key in missing if key not in before]
+            if not missing:
+                break
+
+            cursor.execute(
+                INSERT_VERSIONS_SQL.format(table=table),
+                [missing, after],
+            )
+            for (key,) in cursor.fetchall():
+                before[key] = None
+
+            # Any left were inserted by another process meanwhile
+            missing = [key for key in missing if key not in before]
+
+    return before
+
+
+def _set_new_versions(keys, on_bump=None, committed=True):
+    after = new_version()
+    before = _swap_versions(keys, after)
+
+    if on_bump:
+        on_bump(before, dict.fromkeys(keys, after), committed)
+
+
+def _bump(keys, on_bump=None):
+    # Inside a transaction, bump now for this request and again on commit
+    # for requests that read the old rows while it was open
+    if connection.in_atomic_block:
+        _set_new_versions(keys, on_bump, committed=False)
+
+    transaction.on_commit(lambda: _set_new_versions(keys, on_bump))
+
+
+def bump_availability(*dates, on_bump=None):
+    """
+    Gives each date a new version so slot lists cached against the old
+    one are never read again. on_bump is called with the versions
+    before and after, and whether the change has been committed yet, to
+    carry local state forward.
+    """
+    keys = [date_version_key(date) for date in set(dates)]
+    _bump(keys, on_bump)
+
+
+def bump_all_availability():
+    """
+    Invalidates every cached date, e.g. when tables or opening hours
+    change.
+    """
+    _bump([GLOBAL_VERSION_KEY])
+
+
+def get_versions(keys):
+    """
+    Returns the current version for each key, creating any that are
+    missing.
+    """
+    from .models import AvailabilityVersion
+
+    versions = dict(
+        AvailabilityVersion.objects
+        .filter(key__in=keys)
+        .values_list('key', 'version')
+    )
+
+    missing = [key for key in keys if key not in versions]
+    if missing:
+        with connection.cursor() as cursor:
+            cursor.execute(
+                CREATE_VERSIONS_SQL.format(table=_version_table()),
+                [missing, new_version()],
+            )
+            versions.update(cursor.fetchall())
+
+    return versions
+
+
+def get_cached_available_slots_range(start_date, end_date, party_size=1):
+    """
+    Cached get_available_slots_range. Only the dates missing from the
+    cache are computed, in a single range lookup.
+    """
+    end_date = min(
+        end_date,
+        start_date + timedelta(days=MAX_RANGE_DAYS - 1),
+    )
+
+    dates = []
+    date = start_date
+    while date <= end_date:
+        dates.append(date)
+        date += timedelta(days=1)
+
+    versions = get_versions(
+        [GLOBAL_VERSION_KEY] + [date_version_key(date) for date in dates]
+    )
+
+    keys = {
+        date: slots_key(
+            date,
+            party_size,
+            versions[GLOBAL_VERSION_KEY],
+            versions[date_version_key(date)],
+        )
+        for date in dates
+    }
+
+    cached = cache.get_many(keys.values())
+    days = {
+        date: cached[key]
+        for date, key in keys.items()
+        if key in cached
+    }
+
+    missing = [date for date in dates if date not in days]
+    if missing:
+        computed = get_available_slots_range(
+            missing[0],
+            missing[-1],
+            party_size=party_size,
+        )
+        cache.set_many({
+            keys[date]: slots
+            for date, slots in computed.items()
+            if date in keys
+        })
+        days.update(computed)
+
+    # Cached lists for today may include slots that have since passed
+    now = timezone.now()
+    return {
+        date: [slot for slot in days[date] if slot > now]
+        if date == now.date() else days[date]
+        for date in dates
+    }
+
+
+def get_cached_available_slots(date, party_size=1):
+    return get_cached_available_slots_range(
+        date,
+        date,
+        party_size=party_size,
+    )[date]
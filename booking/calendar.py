@@ -0,0 +1,136 @@
+import hashlib
+from datetime import datetime, time, timedelta
+from django.utils import timezone
+from django.utils.dateparse import parse_date, parse_datetime
+from django.utils.timezone import localtime
+from .cache import GLOBAL_VERSION_KEY, date_version_key, get_versions
+from .constants import MAX_CALENDAR_DAYS
+
+CALENDAR_FIELDS = (
+    'id',
+    'reference',
+    'time_range',
+    'party_size',
+    'status',
+    'allergies',
+    'table__number',
+    'table__seats',
+    'name__username',
+    'name__first_name',
+    'name__last_name',
+)
+
+
+def parse_bound(value):
+    """
+    Parses a FullCalendar start or end parameter, which is an ISO date
+    or datetime, into an aware datetime.
+    """
+    if not value:
+        return None
+
+    # A + in the offset arrives as a space when it was not URL encoded
+    value = value.replace(' ', '+')
+    bound = parse_datetime(value)
+
+    if bound is None:
+        date = parse_date(value)
+        if date is None:
+            return None
+        bound = datetime.combine(date, time.min)
+
+    if timezone.is_naive(bound):
+        bound = timezone.make_aware(bound)
+
+    return bound
+
+
+def get_window(request):
+    """
+    Returns the (start, end) the calendar asked for, at most
+    MAX_CALENDAR_DAYS long, or None when either is missing or invalid.
+    """
+    try:
+        start = parse_bound(request.GET.get('start'))
+        end = parse_bound(request.GET.get('end'))
+    except ValueError:
+        return None
+
+    if not start or not end or end <= start:
+        return None
+
+    return start, min(end, start + timedelta(days=MAX_CALENDAR_DAYS))
+
+
+def window_versions(start, end):
+    """
+    Returns the availability versions of every date in the window.
+    Booking, table and opening hours changes all bump them.
+    """
+    dates = []
+    date = localtime(start).date()
+    while date <= localtime(end).date():
+        dates.append(date)
+        date += timedelta(days=1)
+
+    return get_versions(
+        [GLOBAL_VERSION_KEY] + [date_version_key(date) for date in dates]
+    )
+
+
+def calendar_etag(request, *args, **kwargs):
+    # There is no Last-Modified, as a version row created by the first
+    # read carries the time of that read, not of the last change
+    window = get_window(request)
+
+    if window is None:
+        return None
+
+    versions = window_versions(*window)
+    digest = hashlib.md5(usedforsecurity=False)
+    digest.update(f'{window[0].isoformat()}|{window[1].isoformat()}'.encode())
+    for key in sorted(versions):
+        digest.update(f'|{versions[key]}'.encode())
+
+    return digest.hexdigest()
+
+
+def calendar_bookings(start, end):
+    """
+    Returns the booked rows overlapping the window, only the columns
+    the calendar shows.
+    """
+    from .models import Booking
+
+    return (
+        Booking.objects
+        .filter(time_range__overlap=(start, end))
+        .filter(status='BOOKED')
+        .order_by('start_time', 'id')
+        .values(*CALENDAR_FIELDS)
+    )
+
+
+def calendar_event(row):
+    """
+    Builds the FullCalendar event for a row from calendar_bookings.
+    """
+    table = f'Table No. {row["table__number"]} ({row["table__seats"]} seats)'
+    full_name = (
+        f'{row["name__first_name"]} {row["name__last_name"]}'.strip()
+    )
+
+    return {
+        'id': row['id'],
+        'title': f'Table {row["table__number"]} - {row["name__username"]}',
+        'start': localtime(row['time_range'].lower).isoformat(),
+        'end': localtime(row['time_range'].upper).isoformat(),
+        'extendedProps': {
+            'reference': row['reference'],
+            'name': full_name or row['name__username'],
+            'table': table,
+            'party_size': row['party_size'],
+            'status': row['status'],
+            'allergies': row['allergies'],
+        }
+    }
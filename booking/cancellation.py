@@ -0,0 +1,85 @@
+from django.contrib.auth.models import User
+from django.db import connection, transaction
+from django.template.loader import render_to_string
+from .cache import bump_availability
+from .models import Booking
+from .outbox import queue_emails
+from .signals import booking_dates
+
+CANCELLATION_TEMPLATE = 'account/email/cancellation_notification.txt'
+
+# Cancels and returns every booking in the window with its guest, in
+# one statement however many bookings there are
+CANCEL_WINDOW_SQL = f'''
+    UPDATE {Booking._meta.db_table} AS booking
+    SET status = 'CANCELLED', cancellation_reason = %s
+    FROM {User._meta.db_table} AS guest
+    WHERE guest.id = booking.name_id
+      AND booking.status = 'BOOKED'
+      AND booking.time_range && tstzrange(%s, %s, '[)')
+    RETURNING booking.id, booking.reference, booking.start_time,
+              booking.party_size, booking.time_range,
+              guest.id, guest.username, guest.email
+'''
+
+
+def cancellation_email(booking, reason):
+    """
+    Returns the (subject, body, recipients) telling the guest their
+    booking was cancelled by the restaurant.
+    """
+    body = render_to_string(CANCELLATION_TEMPLATE, {
+        'user': booking.name,
+        'booking': booking,
+        'reason': reason,
+    })
+
+    return (
+        f'Gregorys Bistro: Booking cancelled - Ref {booking.reference}',
+        body,
+        [booking.name.email],
+    )
+
+
+def cancel_window(start, end, reason):
+    """
+    Cancels every BOOKED booking overlapping start-end with the reason
+    and queues an email to each guest. Runs a fixed number of queries
+    however many bookings are cancelled, and returns the cancelled
+    bookings, soonest first.
+    """
+    with transaction.atomic():
+        with connection.cursor() as cursor:
+            cursor.execute(CANCEL_WINDOW_SQL, [reason, start, end])
+            rows = cursor.fetchall()
+
+        bookings = []
+        dates = []
+
+        for (pk, reference, start_time, party_size, time_range,
+             guest_id, username, email) in rows:
+            bookings.append(Booking(
+                pk=pk,
+                reference=reference,
+                start_time=start_time,
+                party_size=party_size,
+                time_range=time_range,
+                status='CANCELLED',
+                cancellation_reason=reason,
+                name=User(pk=guest_id, username=username, email=email),
+            ))
+            dates.extend(booking_dates(time_range))
+
+        bookings.sort(key=lambda booking: (booking.start_time, booking.pk))
+
+        # Signals do not fire for the update, so invalidate here
+        if dates:
+            bump_availability(*dates)
+
+        queue_emails(
+            cancellation_email(booking, reason)
+            for booking in bookings
+            if booking.name.email
+        )
+
+    return bookings
@@ -2,3 +2,6 @@ from datetime import timedelta
 
 SLOT_DURATION = timedelta(hours=1, minutes=30)
 INTERVAL = timedelta(minutes=15)
+MAX_RANGE_DAYS = 60
+MAX_CALENDAR_DAYS = 42
+HISTORY_PAGE_SIZE = 10
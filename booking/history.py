@@ -0,0 +1,116 @@
+from datetime import datetime, timedelta, timezone as dt_timezone
+from django.db.models import Q
+from .constants import HISTORY_PAGE_SIZE
+
+# Only the columns the booking list shows
+HISTORY_FIELDS = (
+    'id',
+    'reference',
+    'start_time',
+    'party_size',
+    'status',
+)
+
+UPCOMING = 'upcoming'
+PAST = 'past'
+
+EPOCH = datetime(1970, 1, 1, tzinfo=dt_timezone.utc)
+MICROSECOND = timedelta(microseconds=1)
+
+
+def encode_cursor(row):
+    """
+    Returns the cursor for the page after row, as the row's start time
+    in microseconds and its id.
+    """
+    return f"{(row['start_time'] - EPOCH) // MICROSECOND}-{row['id']}"
+
+
+def decode_cursor(value):
+    """
+    Returns the (start_time, id) a cursor points at, or None if it is
+    not a valid cursor.
+    """
+    try:
+        micros, pk = (int(part) for part in value.split('-'))
+    except (AttributeError, ValueError):
+        return None
+
+    try:
+        return EPOCH + micros * MICROSECOND, pk
+    except OverflowError:
+        return None
+
+
+def seek(rows, kind, after, id_field):
+    """
+    Filters rows to those after the (start_time, id) cursor in the
+    list's order.
+    """
+    start_time, pk = after
+
+    # The first filter keeps the seek on the (name, start_time) index
+    if kind == UPCOMING:
+        return rows.filter(start_time__gte=start_time).filter(
+            Q(start_time__gt=start_time) | Q(**{f'{id_field}__gt': pk})
+        )
+
+    return rows.filter(start_time__lte=start_time).filter(
+        Q(start_time__lt=start_time) | Q(**{f'{id_field}__lt': pk})
+    )
+
+
+def booking_history(user, kind, now, after=None,
+                    page_size=HISTORY_PAGE_SIZE):
+    """
+    Returns a page of the user's upcoming bookings, soonest first, or
+    past bookings, latest first, and the cursor for the next page. The
+    page seeks past the (start_time, id) of after, so later pages cost
+    the same as the first. Both include archived bookings, which keep
+    their original id.
+    """
+    from .models import Booking, BookingArchive
+
+    bookings = Booking.objects.filter(name=user)
+
+    if kind == UPCOMING:
+        bookings = bookings.filter(start_time__gte=now)
+        order = ('start_time', 'id')
+    else:
+        bookings = bookings.filter(start_time__lt=now)
+        order = ('-start_time', '-id')
+
+    if after is not None:
+        bookings = seek(bookings, kind, after, 'id')
+
+    # One extra row shows whether there is another page
+    limit = page_size + 1
+    rows = bookings.order_by(*order).values(*HISTORY_FIELDS)[:limit]
+
+    archived = BookingArchive.objects.filter(name=user)
+
+    # Cancelled bookings are archived whatever their date
+    if kind == UPCOMING:
+        archived = archived.filter(start_time__gte=now)
+        archive_order = ('start_time', 'booking_id')
+    else:
+        archived = archived.filter(start_time__lt=now)
+        archive_order = ('-start_time', '-booking_id')
+
+    if after is not None:
+        archived = seek(archived, kind, after, 'booking_id')
+
+    archived = (
+        archived
+        .order_by(*archive_order)
+        .values_list('booking_id', *HISTORY_FIELDS[1:])[:limit]
+    )
+    rows = rows.union(archived, all=True).order_by(*order)[:limit]
+
+    rows = list(rows)
+
+    if len(rows) <= page_size:
+        return rows, None
+
+    rows = rows[:page_size]
+    return rows, encode_cursor(rows[-1])
@@ -0,0 +1,203 @@
+import logging
+import time
+from asgiref.sync import (
+    iscoroutinefunction,
+    markcoroutinefunction,
+    sync_to_async,
+)
+from django.conf import settings
+from django.core.cache import caches
+from django.core.cache.backends.db import DatabaseCache
+from django.core.signals import got_request_exception
+from django.db import connection
+
+logger = logging.getLogger(__name__)
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def cache_tables():
+    """
+    Returns the tables of the configured database caches.
+    """
+    return {
+        backend._table
+        for backend in caches.all()
+        if isinstance(backend, DatabaseCache)
+    }
+
+
+class QueryStats:
+    """
+    Database execute wrapper that counts the queries run through it and
+    the time they took. Queries against a database cache's table are
+    counted apart as cache queries, so budgets are the same whichever
+    cache backend is configured, but their time is still database time.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.cache_count = 0
+        self.duration = 0.0
+        self.cache_tables = cache_tables()
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return execute(sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+
+            if any(table in sql for table in self.cache_tables):
+                self.cache_count += 1
+            else:
+                self.count += 1
+
+
+def query_budget(queries):
+    """
+    Declares the most queries a request to the view should need, not
+    counting cache queries. Going over logs a warning, and when
+    QUERY_BUDGET_STRICT is set, as it is under tests, also reports
+    QueryBudgetExceeded as a request exception without changing the
+    response.
+    """
+    def decorator(view):
+        view.query_budget = queries
+        return view
+
+    return decorator
+
+
+def add_wrapper(stats):
+    connection.execute_wrappers.append(stats)
+
+
+def remove_wrapper(stats):
+    connection.execute_wrappers.remove(stats)
+
+
+def server_timing(stats, total):
+    return (
+        f'db;dur={stats.duration * 1000:.1f};desc="{stats.count} queries", '
+        f'cache;desc="{stats.cache_count} cache queries", '
+        f'total;dur={total * 1000:.1f}'
+    )
+
+
+class QueryInstrumentationMiddleware:
+    """
+    Counts the SQL queries and database time of each request, adds them
+    to a Server-Timing header and logs a summary per view, checking it
+    against the view's query budget.
+    """
+
+    sync_capable = True
+    async_capable = True
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+        if iscoroutinefunction(get_response):
+            markcoroutinefunction(self)
+
+    def __call__(self, request):
+        if iscoroutinefunction(self):
+            return self.__acall__(request)
+
+        stats = QueryStats()
+        started = time.perf_counter()
+
+        with connection.execute_wrapper(stats):
+            response = self.get_response(request)
+
+        return self.finish(request, response, stats, started)
+
+    async def __acall__(self, request):
+        stats = QueryStats()
+        started = time.perf_counter()
+
+        # Async views query from the request's thread sensitive worker,
+        # so the wrapper goes on that thread's connection
+        await sync_to_async(add_wrapper)(stats)
+        try:
+            response = await self.get_response(request)
+        finally:
+            await sync_to_async(remove_wrapper)(stats)
+
+        return self.finish(request, response, stats, started)
+
+    def finish(self, request, response, stats, started):
+        response['Server-Timing'] = server_timing(
+            stats,
+            time.perf_counter() - started,
+        )
+
+        # Streamed bodies query as they are sent, so report after
+        if response.streaming and not response.is_async:
+            response.streaming_content = self.stream(
+                response.streaming_content,
+                request, response, stats, started,
+            )
+        else:
+            self.report(request, response, stats, started)
+
+        return response
+
+    def stream(self, content, request, response, stats, started):
+        add_wrapper(stats)
+        try:
+            yield from content
+        finally:
+            remove_wrapper(stats)
+
+        self.report(request, response, stats, started, streamed=True)
+
+    def report(self, request, response, stats, started, streamed=False):
+        match = request.resolver_match
+
+        # Static files and unknown URLs have no view to report on
+        if match is None:
+            return
+
+        logger.info(
+            'view=%s method=%s status=%s queries=%d cache=%d db_ms=%.1f '
+            'total_ms=%.1f',
+            match.view_name,
+            request.method,
+            response.status_code,
+            stats.count,
+            stats.cache_count,
+            stats.duration * 1000,
+            (time.perf_counter() - started) * 1000,
+        )
+
+        budget = getattr(match.func, 'query_budget', None)
+
+        if budget is None or stats.count <= budget:
+            return
+
+        message = (
+            f'{match.view_name} ran {stats.count} queries, over its '
+            f'budget of {budget}.'
+        )
+
+        logger.warning(message)
+
+        if not settings.QUERY_BUDGET_STRICT:
+            return
+
+        # Only a streamed body, which is already on its way, is failed
+        # by raising
+        if streamed:
+            raise QueryBudgetExceeded(message)
+
+        # Anything the view saved is committed by now, so the response
+        # still goes out and the error is reported the way Django reports
+        # a failed request, which the test client raises
+        try:
+            raise QueryBudgetExceeded(message)
+        except QueryBudgetExceeded:
+            got_request_exception.send(sender=type(self), request=request)
@@ -0,0 +1,290 @@
+import http.client
+import json
+import math
+import random
+import threading
+import time as timer
+from collections import Counter
+from datetime import datetime, time, timedelta
+from importlib import import_module
+from urllib.parse import urlencode, urlsplit
+from django.conf import settings
+from django.contrib.auth import (
+    BACKEND_SESSION_KEY,
+    HASH_SESSION_KEY,
+    SESSION_KEY,
+)
+from django.middleware.csrf import CSRF_ALLOWED_CHARS, CSRF_SECRET_LENGTH
+from django.urls import reverse
+from django.utils import timezone
+from django.utils.crypto import get_random_string
+from .allocation import NO_LONGER_AVAILABLE
+
+# Seeded users and tables, so they can be found and cleared again
+USERNAME_PREFIX = 'loadtest-'
+STAFF_USERNAME = 'loadtest-staff'
+FIRST_TABLE_NUMBER = 8000
+LAST_TABLE_NUMBER = 8999
+
+# Share of requests each worker makes of each kind
+DEFAULT_MIX = {'slots': 80, 'book': 15, 'calendar': 5}
+
+SLOTS = 'available_slots'
+BOOK = 'make_booking'
+CALENDAR = 'booking_calendar_data'
+ERROR = 'error'
+
+
+def percentile(values, fraction):
+    """
+    Returns the nearest rank percentile of the sorted values.
+    """
+    if not values:
+        return 0.0
+
+    rank = max(math.ceil(fraction * len(values)), 1)
+    return values[rank - 1]
+
+
+def session_cookie(user):
+    """
+    Returns a session key logged in as the user, as the test client's
+    force_login does, so workers skip the login form.
+    """
+    engine = import_module(settings.SESSION_ENGINE)
+    session = engine.SessionStore()
+    session[SESSION_KEY] = user._meta.pk.value_to_string(user)
+    session[BACKEND_SESSION_KEY] = settings.AUTHENTICATION_BACKENDS[0]
+    session[HASH_SESSION_KEY] = user.get_session_auth_hash()
+    session.save()
+
+    return session.session_key
+
+
+class EndpointStats:
+    """
+    Latencies and outcomes of the requests made to one endpoint.
+    """
+
+    def __init__(self):
+        self.latencies = []
+        self.outcomes = Counter()
+        self.lock = threading.Lock()
+
+    def record(self, outcome, seconds):
+        with self.lock:
+            self.latencies.append(seconds)
+            self.outcomes[outcome] += 1
+
+    def summary(self, elapsed):
+        latencies = sorted(self.latencies)
+        count = len(latencies)
+
+        return {
+            'requests': count,
+            'rps': round(count / elapsed, 1) if elapsed else 0.0,
+            'p50_ms': round(percentile(latencies, 0.50) * 1000, 1),
+            'p95_ms': round(percentile(latencies, 0.95) * 1000, 1),
+            'p99_ms': round(percentile(latencies, 0.99) * 1000, 1),
+            'error_rate': (
+                round(self.outcomes[ERROR] / count, 4) if count else 0.0
+            ),
+            'outcomes': dict(self.outcomes),
+        }
+
+
+class Session:
+    """
+    One worker's keep-alive connection to the site, logged in as a
+    seeded user.
+    """
+
+    def __init__(self, base_url, session_key):
+        url = urlsplit(base_url)
+        connection_class = (
+            http.client.HTTPSConnection
+            if url.scheme == 'https'
+            else http.client.HTTPConnection
+        )
+        self.connection = connection_class(url.netloc, timeout=30)
+
+        # A bare secret is accepted as the token for its own cookie
+        self.csrf_token = get_random_string(
+            CSRF_SECRET_LENGTH,
+            CSRF_ALLOWED_CHARS,
+        )
+        self.headers = {
+            'Cookie': (
+                f'{settings.SESSION_COOKIE_NAME}={session_key}; '
+                f'{settings.CSRF_COOKIE_NAME}={self.csrf_token}'
+            ),
+            'Referer': base_url,
+        }
+
+    def request(self, method, path, params=None):
+        headers = dict(self.headers)
+        body = None
+
+        if method == 'GET' and params:
+            path = f'{path}?{urlencode(params)}'
+        elif params:
+            body = urlencode(params)
+            headers['Content-Type'] = 'application/x-www-form-urlencoded'
+            headers['X-CSRFToken'] = self.csrf_token
+
+        try:
+            self.connection.request(method, path, body, headers)
+            response = self.connection.getresponse()
+            return response.status, response.read()
+        except (OSError, http.client.HTTPException):
+            self.connection.close()
+            raise
+
+
+class LoadRun:
+    """
+    Replays a mix of slot lookups, booking attempts and staff calendar
+    reads against a running site from a number of threads, recording
+    the latency and outcome of every request.
+    """
+
+    def __init__(self, base_url, guests, staff, mix=None, days_ahead=14,
+                 seed=None):
+        self.base_url = base_url.rstrip('/')
+        self.guests = guests
+        self.staff = staff
+        self.mix = mix or DEFAULT_MIX
+        self.days_ahead = days_ahead
+        self.random = random.Random(seed)
+
+        self.urls = {
+            SLOTS: reverse('booking:available_slots'),
+            BOOK: reverse('booking:booking'),
+            CALENDAR: reverse('booking:booking_calendar_data'),
+        }
+
+    def run(self, concurrency, duration):
+        """
+        Runs for duration seconds with concurrency workers and returns
+        the summary of each endpoint and of the run as a whole.
+        """
+        stats = {name: EndpointStats() for name in self.urls}
+        guests = self.random.sample(self.guests, len(self.guests))
+        deadline = timer.perf_counter() + duration
+
+        # Each worker has its own connections, as a browser would
+        workers = [
+            threading.Thread(target=self.work, args=(
+                Session(self.base_url, session_cookie(
+                    guests[number % len(guests)]
+                )),
+                Session(self.base_url, session_cookie(self.staff)),
+                random.Random(self.random.random()),
+                stats,
+                deadline,
+            ))
+            for number in range(concurrency)
+        ]
+
+        started = timer.perf_counter()
+        for worker in workers:
+            worker.start()
+        for worker in workers:
+            worker.join()
+        elapsed = timer.perf_counter() - started
+
+        summary = {
+            name: endpoint.summary(elapsed)
+            for name, endpoint in stats.items()
+        }
+        requests = sum(endpoint['requests'] for endpoint in summary.values())
+        errors = sum(
+            endpoint['outcomes'].get(ERROR, 0)
+            for endpoint in summary.values()
+        )
+
+        return {
+            'concurrency': concurrency,
+            'seconds': round(elapsed, 1),
+            'requests': requests,
+            'rps': round(requests / elapsed, 1),
+            'error_rate': round(errors / requests, 4) if requests else 0.0,
+            'endpoints': summary,
+        }
+
+    def work(self, guest, staff, rng, stats, deadline):
+        actions = list(self.mix)
+        weights = [self.mix[action] for action in actions]
+
+        while timer.perf_counter() < deadline:
+            action = rng.choices(actions, weights)[0]
+
+            if action == 'calendar':
+                self.read_calendar(staff, rng, stats)
+            elif action == 'book':
+                slots = self.lookup_slots(guest, rng, stats)
+                if slots:
+                    self.book(guest, rng, slots, stats)
+            else:
+                self.lookup_slots(guest, rng, stats)
+
+    def timed(self, stats, name, session, method, path, params, outcome):
+        started = timer.perf_counter()
+        try:
+            status, body = session.request(method, path, params)
+        except (OSError, http.client.HTTPException):
+            result = ERROR, None
+        else:
+            result = outcome(status, body), body
+
+        stats[name].record(result[0], timer.perf_counter() - started)
+
+        return result
+
+    def lookup_slots(self, session, rng, stats):
+        date = timezone.localdate() + timedelta(
+            days=rng.randint(1, self.days_ahead)
+        )
+        party_size = rng.choice((2, 2, 2, 3, 4, 4, 5, 6))
+        params = {'date': date.isoformat(), 'party_size': party_size}
+
+        outcome, body = self.timed(
+            stats, SLOTS, session, 'GET', self.urls[SLOTS], params,
+            lambda status, body: 'ok' if status == 200 else ERROR,
+        )
+
+        if outcome != 'ok':
+            return None
+
+        slots = json.loads(body)['slots']
+
+        return [(date, party_size, slot['value']) for slot in slots]
+
+    def book(self, session, rng, slots, stats):
+        date, party_size, slot = rng.choice(slots)
+
+        def outcome(status, body):
+            # The form is shown again when every table was taken
+            if status == 302:
+                return 'booked'
+            if status == 200 and NO_LONGER_AVAILABLE.encode() in body:
+                return 'conflict'
+            if status == 200:
+                return 'rejected'
+            return ERROR
+
+        self.timed(stats, BOOK, session, 'POST', self.urls[BOOK], {
+            'date': date.isoformat(),
+            'party_size': party_size,
+            'slot': slot,
+            'allergies': '',
+        }, outcome)
+
+    def read_calendar(self, session, rng, stats):
+        date = timezone.localdate() + timedelta(days=rng.randint(0, 28))
+        start = timezone.make_aware(datetime.combine(date, time.min))
+
+        self.timed(stats, CALENDAR, session, 'GET', self.urls[CALENDAR], {
+            'start': start.isoformat(),
+            'end': (start + timedelta(days=7)).isoformat(),
+        }, lambda status, body: 'ok' if status == 200 else ERROR)
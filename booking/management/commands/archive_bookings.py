@@ -0,0 +1,64 @@
+import time as timer
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from booking.archive import BATCH_SIZE, archive_ended
+
+
+class Command(BaseCommand):
+    help = (
+        'Moves bookings that ended more than --keep-days ago into the '
+        'booking archive, a batch at a time in short transactions so it '
+        'can run during service.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--keep-days',
+            type=int,
+            default=7,
+            help='Days of past bookings to keep in the live table',
+        )
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            '--scrub-allergies',
+            action='store_true',
+            help='Blank the allergies of archived bookings',
+        )
+        parser.add_argument(
+            '--pause',
+            type=float,
+            default=0,
+            help='Seconds to wait between batches',
+        )
+
+    def handle(self, *args, **options):
+        if options['keep_days'] < 0 or options['batch_size'] < 1:
+            raise CommandError(
+                '--keep-days cannot be negative and --batch-size must be '
+                'at least 1.'
+            )
+
+        cutoff = timezone.now() - timedelta(days=options['keep_days'])
+        started = timer.perf_counter()
+        archived = batches = 0
+
+        for moved in archive_ended(
+            cutoff,
+            options['batch_size'],
+            options['scrub_allergies'],
+        ):
+            archived += moved
+            batches += 1
+
+            if options['pause']:
+                timer.sleep(options['pause'])
+
+        elapsed = timer.perf_counter() - started
+        rate = archived / elapsed if elapsed else 0
+
+        self.stdout.write(
+            f'Archived {archived} bookings that ended before '
+            f'{timezone.localtime(cutoff):%Y-%m-%d %H:%M} in '
+            f'{batches} batches ({rate:.0f} per second)'
+        )
@@ -0,0 +1,158 @@
+import asyncio
+import time as timer
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, time, timedelta
+from asgiref.sync import ThreadSensitiveContext, sync_to_async
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.test import AsyncRequestFactory, RequestFactory
+from django.utils import timezone
+from booking import async_views, views
+from booking.constants import SLOT_DURATION, INTERVAL
+from booking.models import Booking, Table
+from booking.registry import registry
+
+USERNAME = 'benchmark-async-views'
+
+
+def close_connection():
+    # Connections are closed after every request in production
+    connection.close()
+
+
+class Command(BaseCommand):
+    help = (
+        'Compares concurrent request throughput of the sync and async '
+        'available_slots and booking_calendar_data views against the '
+        'configured database. Seeds a user, tables and bookings for '
+        'tomorrow and deletes them afterwards, so point it at a local '
+        'database.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--requests', type=int, default=200)
+        parser.add_argument('--concurrency', type=int, default=20)
+        parser.add_argument('--tables', type=int, default=20)
+
+    def handle(self, *args, **options):
+        date = timezone.localdate() + timedelta(days=1)
+        opening = registry.opening(date.weekday())
+
+        if opening is None:
+            raise CommandError(
+                f'Add opening hours for {date:%A} to run the benchmark.'
+            )
+
+        user = User.objects.create_user(username=USERNAME, is_staff=True)
+
+        try:
+            self.seed(user, date, opening, options['tables'])
+            self.run(user, date, options['requests'], options['concurrency'])
+        finally:
+            Table.objects.filter(bookings__name=user).delete()
+            user.delete()
+
+    def seed(self, user, date, opening, table_count):
+        open_at = timezone.make_aware(
+            datetime.combine(date, opening.open_time)
+        )
+        close_at = timezone.make_aware(
+            datetime.combine(date, opening.close_time)
+        )
+
+        bookings = []
+        for number in range(table_count):
+            table = Table.objects.create(number=9000 + number, seats=4)
+            start = open_at + INTERVAL * (number % 4)
+            while start + SLOT_DURATION <= close_at:
+                bookings.append(Booking(
+                    table=table,
+                    name=user,
+                    party_size=2,
+                    start_time=start,
+                    time_range=(start, start + SLOT_DURATION),
+                    reference=f'ASYNC{len(bookings):07d}',
+                ))
+                start += SLOT_DURATION + INTERVAL * 2
+
+        Booking.objects.bulk_create(bookings)
+        self.stdout.write(
+            f'Seeded {table_count} tables and {len(bookings)} bookings '
+            f'on {date.isoformat()}'
+        )
+
+    def run(self, user, date, requests, concurrency):
+        day_start = timezone.make_aware(datetime.combine(date, time.min))
+        endpoints = (
+            (
+                'available_slots',
+                views.available_slots,
+                async_views.available_slots,
+                {'date': date.isoformat(), 'party_size': 2},
+            ),
+            (
+                'booking_calendar_data',
+                views.booking_calendar_data,
+                async_views.booking_calendar_data,
+                {
+                    'start': day_start.isoformat(),
+                    'end': (day_start + timedelta(days=7)).isoformat(),
+                },
+            ),
+        )
+
+        self.stdout.write(f'{requests} requests, {concurrency} at a time')
+
+        for name, sync_view, async_view, params in endpoints:
+            sync_elapsed = self.run_sync(
+                sync_view, user, params, requests, concurrency
+            )
+            async_elapsed = asyncio.run(self.run_async(
+                async_view, user, params, requests, concurrency
+            ))
+
+            for mode, elapsed in (
+                ('sync', sync_elapsed),
+                ('async', async_elapsed),
+            ):
+                self.stdout.write(
+                    f'{name:<24}{mode:<7}{requests / elapsed:10.1f} req/s'
+                )
+
+    def run_sync(self, view, user, params, requests, concurrency):
+        factory = RequestFactory()
+
+        def call(_):
+            request = factory.get('/', params)
+            request.user = user
+            response = view(request)
+            if response.streaming:
+                b''.join(response.streaming_content)
+            close_connection()
+
+        started = timer.perf_counter()
+        with ThreadPoolExecutor(concurrency) as pool:
+            list(pool.map(call, range(requests)))
+
+        return timer.perf_counter() - started
+
+    async def run_async(self, view, user, params, requests, concurrency):
+        factory = AsyncRequestFactory()
+        limit = asyncio.Semaphore(concurrency)
+
+        async def call():
+            async with limit:
+                # As the ASGI handler does for each request
+                async with ThreadSensitiveContext():
+                    request = factory.get('/', params)
+                    request.user = user
+                    response = await view(request)
+                    if response.streaming:
+                        [chunk async for chunk in response.streaming_content]
+                    await sync_to_async(close_connection)()
+
+        started = timer.perf_counter()
+        await asyncio.gather(*[call() for _ in range(requests)])
+
+        return timer.perf_counter() - started
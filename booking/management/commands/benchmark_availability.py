@@ -0,0 +1,112 @@
+import time as timer
+from datetime import datetime, time, timedelta
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.utils import timezone
+from booking.constants import SLOT_DURATION, INTERVAL
+from booking.models import Booking, OpeningHours, Table
+from booking.occupancy import build_occupancy
+from booking.reference import per_slot_available_slots
+from booking.utils import get_available_slots_range, get_slot_starts
+
+
+class Command(BaseCommand):
+    help = (
+        'Times availability lookups for one day: per-slot ORM queries, '
+        'the interval sweep and the occupancy index. Seeds its own data '
+        'in a transaction that is rolled back.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tables', type=int, default=20)
+        parser.add_argument('--repeat', type=int, default=20)
+        parser.add_argument('--party-size', type=int, default=2)
+
+    def handle(self, *args, **options):
+        with transaction.atomic():
+            date = self.seed(options['tables'])
+            self.run(date, options['party_size'], options['repeat'])
+            transaction.set_rollback(True)
+
+    def seed(self, table_count):
+        date = timezone.localdate() + timedelta(days=1)
+
+        OpeningHours.objects.filter(weekday=date.weekday()).delete()
+        OpeningHours.objects.create(
+            weekday=date.weekday(),
+            open_time=time(11, 0),
+            close_time=time(23, 0),
+        )
+
+        user = User.objects.create_user(username='benchmark-availability')
+        open_at = timezone.make_aware(datetime.combine(date, time(11, 0)))
+
+        bookings = []
+        for number in range(table_count):
+            table = Table.objects.create(
+                number=1000 + number,
+                seats=(2, 4, 6)[number % 3],
+            )
+            # Stagger sittings so every table is busy most of the evening
+            start = open_at + INTERVAL * (number % 4)
+            while start + SLOT_DURATION <= open_at + timedelta(hours=12):
+                bookings.append(Booking(
+                    table=table,
+                    name=user,
+                    party_size=2,
+                    start_time=start,
+                    time_range=(start, start + SLOT_DURATION),
+                    reference=f'BENCH{len(bookings):07d}',
+                ))
+                start += SLOT_DURATION + INTERVAL * 2
+
+        Booking.objects.bulk_create(bookings)
+        self.stdout.write(
+            f'Seeded {table_count} tables and {len(bookings)} bookings '
+            f'on {date.isoformat()}'
+        )
+
+        return date
+
+    def time(self, label, repeat, func, baseline=None):
+        started = timer.perf_counter()
+        for _ in range(repeat):
+            func()
+        elapsed = (timer.perf_counter() - started) / repeat * 1000
+
+        speedup = f'{baseline / elapsed:8.1f}x' if baseline else ''
+        self.stdout.write(f'{label:<28}{elapsed:10.3f} ms {speedup}')
+
+        return elapsed
+
+    def run(self, date, party_size, repeat):
+        index = build_occupancy(date)
+        slots = get_slot_starts(date, index.opening)
+
+        baseline = self.time(
+            'per-slot ORM queries',
+            repeat,
+            lambda: per_slot_available_slots(date, party_size),
+        )
+        self.time(
+            'interval sweep',
+            repeat,
+            lambda: get_available_slots_range(date, date, party_size),
+            baseline,
+        )
+        self.time(
+            'occupancy index build',
+            repeat,
+            lambda: build_occupancy(date),
+            baseline,
+        )
+        self.time(
+            'occupancy index lookup',
+            repeat,
+            lambda: [
+                slot for slot in slots
+                if index.is_available(slot, party_size)
+            ],
+            baseline,
+        )
@@ -0,0 +1,187 @@
+import json
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand, CommandError
+from django.db import connection
+from django.utils import timezone
+from booking.loadtest import (
+    DEFAULT_MIX,
+    LoadRun,
+    STAFF_USERNAME,
+    USERNAME_PREFIX,
+)
+from booking.models import Booking
+
+DOUBLE_BOOKED_SQL = f'''
+    SELECT COUNT(*)
+    FROM {Booking._meta.db_table} a
+    JOIN {Booking._meta.db_table} b
+      ON a.table_id = b.table_id
+     AND a.id < b.id
+     AND a.time_range && b.time_range
+    WHERE a.status = 'BOOKED'
+      AND b.status = 'BOOKED'
+      AND a.start_time >= %s
+      AND b.start_time >= %s
+'''
+
+
+def parse_mix(value):
+    """
+    Parses a request mix such as slots=80,book=15,calendar=5.
+    """
+    mix = {}
+
+    for part in value.split(','):
+        action, _, weight = part.partition('=')
+        if action not in DEFAULT_MIX or not weight.isdigit():
+            raise CommandError(
+                'Give the mix as slots=N,book=N,calendar=N.'
+            )
+        mix[action] = int(weight)
+
+    return mix
+
+
+class Command(BaseCommand):
+    help = (
+        'Replays a mix of slot lookups, bookings and staff calendar '
+        'reads against a running site, seeded by seed_load_test and '
+        'sharing its database, at each concurrency given. Reports '
+        'p50/p95/p99 latency, requests per second, booking conflicts '
+        'and errors per endpoint, and the highest rate that stayed '
+        'within the p95 target.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--url',
+            default='http://127.0.0.1:8000',
+            help='Where the site under test is running.',
+        )
+        parser.add_argument(
+            '--concurrency',
+            type=int,
+            nargs='+',
+            default=[5, 10, 20, 40],
+            help='Run a step at each of these numbers of workers.',
+        )
+        parser.add_argument(
+            '--duration',
+            type=float,
+            default=30,
+            help='Seconds each step runs for.',
+        )
+        parser.add_argument(
+            '--mix',
+            type=parse_mix,
+            default=DEFAULT_MIX,
+            help='Request mix, slots=80,book=15,calendar=5 by default.',
+        )
+        parser.add_argument('--days-ahead', type=int, default=14)
+        parser.add_argument(
+            '--p95-target',
+            type=float,
+            default=500,
+            help='Milliseconds every endpoint p95 must stay under for a '
+                 'step to count as sustainable.',
+        )
+        parser.add_argument(
+            '--max-error-rate',
+            type=float,
+            default=0.01,
+        )
+        parser.add_argument('--seed', type=int, default=None)
+        parser.add_argument(
+            '--json',
+            dest='json_path',
+            help='Also write the report to this file for comparison.',
+        )
+
+    def handle(self, *args, **options):
+        guests = list(
+            User.objects
+            .filter(username__startswith=USERNAME_PREFIX)
+            .exclude(username=STAFF_USERNAME)
+        )
+        staff = User.objects.filter(username=STAFF_USERNAME).first()
+
+        if not guests or staff is None:
+            raise CommandError('Run seed_load_test first.')
+
+        load_run = LoadRun(
+            options['url'],
+            guests,
+            staff,
+            mix=options['mix'],
+            days_ahead=options['days_ahead'],
+            seed=options['seed'],
+        )
+        started = timezone.now()
+        steps = []
+
+        for concurrency in options['concurrency']:
+            step = load_run.run(concurrency, options['duration'])
+            step['sustainable'] = self.sustainable(step, options)
+            steps.append(step)
+            self.report(step)
+
+        report = {
+            'url': options['url'],
+            'started': started.isoformat(),
+            'duration': options['duration'],
+            'mix': options['mix'],
+            'steps': steps,
+            'max_sustainable_rps': max(
+                [step['rps'] for step in steps if step['sustainable']],
+                default=0.0,
+            ),
+            'double_booked': self.double_booked(started),
+        }
+
+        self.stdout.write(
+            f"Max sustainable: {report['max_sustainable_rps']} req/s "
+            f"(p95 under {options['p95_target']:g} ms, errors under "
+            f"{options['max_error_rate']:.1%})"
+        )
+        self.stdout.write(
+            f"Tables double booked during the run: {report['double_booked']}"
+        )
+
+        if options['json_path']:
+            with open(options['json_path'], 'w') as report_file:
+                json.dump(report, report_file, indent=2)
+
+    def sustainable(self, step, options):
+        return step['error_rate'] <= options['max_error_rate'] and all(
+            endpoint['p95_ms'] <= options['p95_target']
+            for endpoint in step['endpoints'].values()
+            if endpoint['requests']
+        )
+
+    def report(self, step):
+        self.stdout.write(
+            f"\n{step['concurrency']} workers, {step['seconds']}s: "
+            f"{step['requests']} requests, {step['rps']} req/s, "
+            f"{step['error_rate']:.2%} errors"
+        )
+        self.stdout.write(
+            f"{'endpoint':<24}{'req':>7}{'req/s':>9}{'p50':>9}{'p95':>9}"
+            f"{'p99':>9}  outcomes"
+        )
+
+        for name, endpoint in step['endpoints'].items():
+            outcomes = ', '.join(
+                f'{outcome} {count}'
+                for outcome, count in sorted(endpoint['outcomes'].items())
+            )
+            self.stdout.write(
+                f"{name:<24}{endpoint['requests']:>7}"
+                f"{endpoint['rps']:>9}{endpoint['p50_ms']:>9}"
+                f"{endpoint['p95_ms']:>9}{endpoint['p99_ms']:>9}  {outcomes}"
+            )
+
+    def double_booked(self, since):
+        # Should always be 0 while prevent_table_double_booking holds
+        with connection.cursor() as cursor:
+            cursor.execute(DOUBLE_BOOKED_SQL, [since, since])
+            return cursor.fetchone()[0]
@@ -0,0 +1,72 @@
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+from django.utils import timezone
+from booking.partitions import (
+    add_months,
+    convert,
+    detach_partitions,
+    ensure_partitions,
+    is_partitioned,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Creates the monthly booking partitions for the months ahead and '
+        'detaches old ones. Run it daily once bookings are partitioned.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--convert',
+            action='store_true',
+            help='Partition the bookings table first if it is not yet',
+        )
+        parser.add_argument(
+            '--months-ahead',
+            type=int,
+            default=settings.BOOKING_PARTITION_MONTHS_AHEAD,
+            help='Months after this one to have partitions ready for',
+        )
+        parser.add_argument(
+            '--detach-months',
+            type=int,
+            help='Detach partitions of months more than this many before '
+                 'this one',
+        )
+        parser.add_argument(
+            '--drop',
+            action='store_true',
+            help='Drop the partitions once detached',
+        )
+
+    def handle(self, *args, **options):
+        detach_months = options['detach_months']
+
+        if options['months_ahead'] < 0 or (detach_months or 0) < 0:
+            raise CommandError(
+                '--months-ahead and --detach-months cannot be negative.'
+            )
+
+        if options['convert'] and convert(options['months_ahead']):
+            self.stdout.write('Partitioned the bookings table by month')
+        elif not is_partitioned():
+            raise CommandError(
+                'Bookings are not partitioned, run with --convert first.'
+            )
+
+        for name in ensure_partitions(options['months_ahead']):
+            self.stdout.write(f'Created {name}')
+
+        if detach_months is None:
+            return
+
+        before = add_months(
+            timezone.localdate().replace(day=1),
+            -detach_months,
+        )
+
+        for name in detach_partitions(before, drop=options['drop']):
+            self.stdout.write(
+                f'{"Dropped" if options["drop"] else "Detached"} {name}'
+            )
@@ -0,0 +1,159 @@
+import random
+from datetime import datetime, time, timedelta
+from django.contrib.auth.hashers import make_password
+from django.contrib.auth.models import User
+from django.core.management.base import BaseCommand
+from django.utils import timezone
+from booking.constants import INTERVAL, SLOT_DURATION
+from booking.loadtest import (
+    FIRST_TABLE_NUMBER,
+    LAST_TABLE_NUMBER,
+    STAFF_USERNAME,
+    USERNAME_PREFIX,
+)
+from booking.models import Booking, OpeningHours, Table
+
+TABLE_SEATS = (2, 2, 4, 4, 4, 6, 8)
+
+
+class Command(BaseCommand):
+    help = (
+        'Seeds users, tables, opening hours and past bookings for the '
+        'load_test command. Run it against a local database only; '
+        '--clear removes everything a previous seed created.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--users', type=int, default=200)
+        parser.add_argument('--tables', type=int, default=20)
+        parser.add_argument('--bookings', type=int, default=20000)
+        parser.add_argument(
+            '--days',
+            type=int,
+            default=365,
+            help='Spread the past bookings over this many days.',
+        )
+        parser.add_argument('--seed', type=int, default=0)
+        parser.add_argument(
+            '--clear',
+            action='store_true',
+            help='Only remove seeded users, tables and bookings.',
+        )
+
+    def handle(self, *args, **options):
+        self.clear()
+
+        if options['clear']:
+            return
+
+        rng = random.Random(options['seed'])
+
+        self.seed_opening_hours()
+        users = self.seed_users(options['users'])
+        tables = self.seed_tables(options['tables'])
+        count = self.seed_bookings(
+            rng, users, tables, options['bookings'], options['days']
+        )
+
+        self.stdout.write(
+            f'Seeded {len(users)} users, {len(tables)} tables and {count} '
+            f'past bookings. Staff user: {STAFF_USERNAME}'
+        )
+
+    def clear(self):
+        # Bookings go with their users and tables
+        users, _ = User.objects.filter(
+            username__startswith=USERNAME_PREFIX,
+        ).delete()
+        tables, _ = Table.objects.filter(
+            number__gte=FIRST_TABLE_NUMBER,
+            number__lte=LAST_TABLE_NUMBER,
+        ).delete()
+
+        if users or tables:
+            self.stdout.write('Removed the previous load test seed')
+
+    def seed_opening_hours(self):
+        # Days the restaurant already has hours for are left as they are
+        for weekday, _ in OpeningHours.WEEKDAYS:
+            OpeningHours.objects.get_or_create(
+                weekday=weekday,
+                defaults={
+                    'open_time': time(11, 0),
+                    'close_time': time(23, 0),
+                },
+            )
+
+    def seed_users(self, count):
+        password = make_password(None)
+
+        User.objects.create_user(
+            username=STAFF_USERNAME,
+            is_staff=True,
+        )
+
+        return User.objects.bulk_create([
+            User(
+                username=f'{USERNAME_PREFIX}{number}',
+                email=f'{USERNAME_PREFIX}{number}@example.com',
+                password=password,
+            )
+            for number in range(count)
+        ])
+
+    def seed_tables(self, count):
+        count = min(count, LAST_TABLE_NUMBER - FIRST_TABLE_NUMBER + 1)
+
+        return Table.objects.bulk_create([
+            Table(
+                number=FIRST_TABLE_NUMBER + number,
+                seats=TABLE_SEATS[number % len(TABLE_SEATS)],
+            )
+            for number in range(count)
+        ])
+
+    def seed_bookings(self, rng, users, tables, count, days):
+        if not users or not tables:
+            return 0
+
+        openings = {
+            opening.weekday: opening
+            for opening in OpeningHours.objects.all()
+        }
+        today = timezone.localdate()
+        bookings = []
+
+        # Sittings on each table run back to back from a random offset,
+        # newest day first, until enough bookings are made
+        for day in range(1, days + 1):
+            date = today - timedelta(days=day)
+            opening = openings[date.weekday()]
+            close = timezone.make_aware(
+                datetime.combine(date, opening.close_time)
+            )
+
+            for table in tables:
+                start = timezone.make_aware(
+                    datetime.combine(date, opening.open_time)
+                ) + INTERVAL * rng.randint(0, 8)
+
+                while start + SLOT_DURATION <= close:
+                    if len(bookings) == count:
+                        break
+
+                    bookings.append(Booking(
+                        table=table,
+                        name=rng.choice(users),
+                        party_size=rng.randint(1, table.seats),
+                        start_time=start,
+                        time_range=(start, start + SLOT_DURATION),
+                        reference=f'LOAD{len(bookings):08d}',
+                        status=(
+                            'CANCELLED' if rng.random() < 0.1 else 'BOOKED'
+                        ),
+                    ))
+                    start += SLOT_DURATION + INTERVAL * rng.randint(0, 8)
+
+        Booking.objects.bulk_create(bookings, batch_size=5000)
+
+        return len(bookings)
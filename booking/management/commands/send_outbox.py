@@ -0,0 +1,53 @@
+import time
+from django.core.mail import get_connection
+from django.core.management.base import BaseCommand
+from booking.outbox import BATCH_SIZE, send_batch
+
+
+class Command(BaseCommand):
+    help = (
+        'Sends the emails waiting in the outbox in batches over one SMTP '
+        'connection, retrying failures with backoff. Stops once nothing '
+        'is due unless --loop is given.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--batch-size', type=int, default=BATCH_SIZE)
+        parser.add_argument(
+            '--loop',
+            action='store_true',
+            help='Keep polling for new emails',
+        )
+        parser.add_argument(
+            '--interval',
+            type=float,
+            default=5,
+            help='Seconds to wait between polls with --loop',
+        )
+
+    def handle(self, *args, **options):
+        connection = get_connection(fail_silently=False)
+        total_sent = total_failed = 0
+
+        try:
+            while True:
+                sent, failed = send_batch(options['batch_size'], connection)
+                total_sent += sent
+                total_failed += failed
+
+                if sent or failed:
+                    self.stdout.write(f'Sent {sent}, failed {failed}')
+                    continue
+
+                if not options['loop']:
+                    break
+
+                # Nothing due, so let the relay drop the idle connection
+                connection.close()
+                time.sleep(options['interval'])
+        finally:
+            connection.close()
+
+        self.stdout.write(
+            f'Outbox drained: {total_sent} sent, {total_failed} failed'
+        )
@@ -0,0 +1,132 @@
+import time as timer
+from contextlib import suppress
+from datetime import datetime, time, timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.core.management.base import BaseCommand, CommandError
+from django.template.loader import get_template
+from django.utils import timezone
+from django.utils.dateparse import parse_date
+from booking.models import Booking
+
+REMINDER_TEMPLATE = 'account/email/booking_reminder.txt'
+
+
+def chunks(items, size):
+    for start in range(0, len(items), size):
+        yield items[start:start + size]
+
+
+class Command(BaseCommand):
+    help = (
+        'Emails a reminder to every guest booked for tomorrow, in chunks '
+        'over one SMTP connection. Bookings already reminded are skipped, '
+        'so it is safe to run again after a crash. A reminder the relay '
+        'rejects is recorded on its booking and retried on the next run.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--date',
+            help='Day to send reminders for (YYYY-MM-DD), default tomorrow',
+        )
+        parser.add_argument('--chunk-size', type=int, default=100)
+
+    def handle(self, *args, **options):
+        date = timezone.localdate() + timedelta(days=1)
+
+        if options['date']:
+            try:
+                date = parse_date(options['date'])
+            except ValueError:
+                # Well formed but not a real day, e.g. 2026-02-30
+                date = None
+
+            if not date:
+                raise CommandError('Enter the date as YYYY-MM-DD.')
+
+        start = timezone.make_aware(datetime.combine(date, time.min))
+        bookings = list(
+            Booking.objects
+            .select_related('name', 'table')
+            .filter(
+                status='BOOKED',
+                start_time__gte=start,
+                start_time__lt=start + timedelta(days=1),
+                reminder_sent_on__isnull=True,
+            )
+            .exclude(name__email='')
+            .order_by('start_time', 'id')
+        )
+
+        # Compiled once and rendered per booking
+        template = get_template(REMINDER_TEMPLATE)
+        started = timer.perf_counter()
+        sent = 0
+        failed = []
+
+        with get_connection(fail_silently=False) as connection:
+            for chunk in chunks(bookings, options['chunk_size']):
+                messages = [
+                    EmailMessage(
+                        subject=(
+                            'Gregorys Bistro: Booking reminder - '
+                            f'Ref {booking.reference}'
+                        ),
+                        body=template.render({
+                            'user': booking.name,
+                            'booking': booking,
+                        }),
+                        from_email=settings.DEFAULT_FROM_EMAIL,
+                        to=[booking.name.email],
+                    )
+                    for booking in chunk
+                ]
+                pks = [booking.pk for booking in chunk]
+
+                # Claimed before sending so a crash part way through a
+                # chunk can never send it twice
+                Booking.objects.filter(pk__in=pks).update(
+                    reminder_sent_on=timezone.now(),
+                    reminder_error='',
+                )
+
+                # One at a time over the connection, so a guest the
+                # relay refuses does not hold up the rest
+                for booking, message in zip(chunk, messages):
+                    try:
+                        sent += connection.send_messages([message])
+                    except Exception as error:
+                        # Released so the next run tries it again
+                        Booking.objects.filter(pk=booking.pk).update(
+                            reminder_sent_on=None,
+                            reminder_error=repr(error),
+                        )
+                        failed.append((booking, error))
+
+                        # A dropped connection would fail every later
+                        # reminder too, so start the next on a fresh one
+                        with suppress(Exception):
+                            connection.close()
+                        with suppress(Exception):
+                            connection.open()
+
+        elapsed = timer.perf_counter() - started
+        rate = sent / elapsed if elapsed else 0
+
+        self.stdout.write(
+            f'Sent {sent} reminders for {date.isoformat()} in '
+            f'{elapsed:.2f}s ({rate:.1f} per second)'
+        )
+
+        for booking, error in failed:
+            self.stderr.write(
+                f'Could not remind {booking.name.email} about '
+                f'{booking.reference}: {error!r}'
+            )
+
+        if failed:
+            self.stderr.write(
+                f'{len(failed)} reminders failed and will be retried on '
+                f'the next run.'
+            )
@@ -0,0 +1,110 @@
+from datetime import timedelta
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+from booking.assignment import get_strategy, simulate
+from booking.models import Booking, OpeningHours, Table
+from booking.occupancy import DayOccupancy
+
+STRATEGIES = (
+    'booking.assignment.SmallestTableStrategy',
+    'booking.assignment.BestFitGapStrategy',
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Replays the bookings for one or more past days against an empty '
+        'floor with each table assignment strategy and reports the '
+        'covers seated and seat utilisation. Nothing is written.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('date', help='First day to replay (YYYY-MM-DD)')
+        parser.add_argument('--days', type=int, default=1)
+        parser.add_argument(
+            '--strategy',
+            action='append',
+            dest='strategies',
+            help='Dotted path of a strategy, may be repeated',
+        )
+        parser.add_argument(
+            '--include-cancelled',
+            action='store_true',
+            help='Replay cancelled bookings too, as extra demand',
+        )
+
+    def handle(self, *args, **options):
+        try:
+            date = parse_date(options['date'])
+        except ValueError:
+            # Well formed but not a real day, e.g. 2026-02-30
+            date = None
+
+        if not date:
+            raise CommandError('Enter the date as YYYY-MM-DD.')
+
+        strategies = [
+            get_strategy(path)
+            for path in options['strategies'] or STRATEGIES
+        ]
+        openings = {
+            opening.weekday: opening
+            for opening in OpeningHours.objects.all()
+        }
+        tables = list(Table.objects.values_list('id', 'seats'))
+
+        totals = {strategy.name: [] for strategy in strategies}
+
+        for offset in range(options['days']):
+            day = date + timedelta(days=offset)
+            opening = openings.get(day.weekday())
+
+            if not opening:
+                continue
+
+            requests = self.requests(
+                DayOccupancy(day, opening, tables),
+                options['include_cancelled'],
+            )
+
+            for strategy in strategies:
+                totals[strategy.name].append(simulate(
+                    DayOccupancy(day, opening, tables),
+                    requests,
+                    strategy,
+                ))
+
+        for name, days in totals.items():
+            self.report(name, days)
+
+    def requests(self, index, include_cancelled):
+        """
+        Returns the day's bookings as (start, party_size) in the order
+        they were made.
+        """
+        bookings = Booking.objects.filter(
+            time_range__overlap=(index.origin, index.close),
+        )
+
+        if not include_cancelled:
+            bookings = bookings.filter(status='BOOKED')
+
+        return list(
+            bookings
+            .order_by('id')
+            .values_list('start_time', 'party_size')
+        )
+
+    def report(self, name, days):
+        requests = sum(day['requests'] for day in days)
+        seated = sum(day['seated'] for day in days)
+        covers = sum(day['covers'] for day in days)
+        utilisation = (
+            sum(day['utilisation'] for day in days) / len(days)
+            if days else 0
+        )
+
+        self.stdout.write(
+            f'{name:<20}{seated:6d}/{requests:<6d} bookings '
+            f'{covers:6d} covers {utilisation:7.1%} utilisation'
+        )
@@ -0,0 +1,22 @@
+# Generated by Django 4.2.27 on 2026-10-18 12:20
+
+import django.contrib.postgres.constraints
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0003_booking_party_size'),
+    ]
+
+    operations = [
+        migrations.RemoveConstraint(
+            model_name='booking',
+            name='prevent_table_double_booking',
+        ),
+        migrations.AddConstraint(
+            model_name='booking',
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(condition=models.Q(('status', 'BOOKED')), expressions=[('table', '='), ('time_range', '&&')], name='prevent_table_double_booking'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-18 12:34
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0005_outboxemail'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='reminder_sent_on',
+            field=models.DateTimeField(blank=True, editable=False, null=True),
+        ),
+    ]
@@ -0,0 +1,34 @@
+# Generated by Django 4.2.27 on 2026-10-18 12:39
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0006_booking_reminder_sent_on'),
+    ]
+
+    operations = [
+        migrations.RemoveIndex(
+            model_name='booking',
+            name='booking_boo_time_ra_5493d0_gist',
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=django.contrib.postgres.indexes.GistIndex(condition=models.Q(('status', 'BOOKED')), fields=['time_range'], name='booking_booked_range_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(fields=['name', 'start_time'], name='booking_name_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('status', 'CANCELLED')), fields=['start_time'], name='booking_cancelled_start_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='booking',
+            index=models.Index(condition=models.Q(('reminder_sent_on__isnull', True), ('status', 'BOOKED')), fields=['start_time'], name='booking_unreminded_start_idx'),
+        ),
+    ]
@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-18 12:52
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0007_booking_hot_query_indexes'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='cancellation_reason',
+            field=models.TextField(blank=True),
+        ),
+    ]
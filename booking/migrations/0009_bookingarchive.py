@@ -0,0 +1,36 @@
+# Generated by Django 4.2.27 on 2026-10-18 12:54
+
+from django.conf import settings
+from django.db import migrations, models
+import django.db.models.deletion
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+        ('booking', '0008_booking_cancellation_reason'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='BookingArchive',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('booking_id', models.BigIntegerField(unique=True)),
+                ('reference', models.CharField(max_length=12)),
+                ('table_number', models.IntegerField()),
+                ('party_size', models.PositiveSmallIntegerField()),
+                ('start_time', models.DateTimeField()),
+                ('end_time', models.DateTimeField()),
+                ('status', models.CharField(choices=[('BOOKED', 'Booked'), ('CANCELLED', 'Cancelled')], max_length=10)),
+                ('allergies', models.TextField(blank=True)),
+                ('cancellation_reason', models.TextField(blank=True)),
+                ('archived_on', models.DateTimeField(auto_now_add=True)),
+                ('name', models.ForeignKey(null=True, on_delete=django.db.models.deletion.SET_NULL, related_name='archived_bookings', to=settings.AUTH_USER_MODEL)),
+            ],
+            options={
+                'indexes': [models.Index(fields=['name', 'start_time'], name='archive_name_start_idx'), models.Index(fields=['start_time'], name='archive_start_idx')],
+            },
+        ),
+    ]
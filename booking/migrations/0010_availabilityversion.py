@@ -0,0 +1,20 @@
+# Generated by Django 4.2.27 on 2026-10-18 13:45
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0009_bookingarchive'),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='AvailabilityVersion',
+            fields=[
+                ('key', models.CharField(max_length=64, primary_key=True, serialize=False)),
+                ('version', models.CharField(max_length=64)),
+            ],
+        ),
+    ]
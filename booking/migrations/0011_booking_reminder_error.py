@@ -0,0 +1,18 @@
+# Generated by Django 4.2.27 on 2026-10-18 13:58
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('booking', '0010_availabilityversion'),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name='booking',
+            name='reminder_error',
+            field=models.TextField(blank=True, editable=False),
+        ),
+    ]
@@ -68,6 +68,14 @@ class Booking(models.Model):
         choices=STATUS_CHOICES,
         default='BOOKED'
     )
+    reminder_sent_on = models.DateTimeField(
+        null=True,
+        blank=True,
+        editable=False,
+    )
+    # Why the last reminder could not be sent, e.g. a refused address
+    reminder_error = models.TextField(blank=True, editable=False)
+    cancellation_reason = models.TextField(blank=True)
 
     def clean(self):
         if not self.start_time:
@@ -81,9 +89,12 @@ class Booking(models.Model):
 
         weekday = self.start_time.weekday()
 
-        try:
-            opening = OpeningHours.objects.get(weekday=weekday)
-        except OpeningHours.DoesNotExist:
+        # Imported here as the registry loads these models
+        from .registry import registry
+
+        opening = registry.opening(weekday)
+
+        if opening is None:
             raise ValidationError('The restaurant is closed on this day.')
 
         start = self.start_time.time()
@@ -106,9 +117,38 @@ class Booking(models.Model):
             ),
         ]
         indexes = [
-            GistIndex(fields=['time_range']),
+            # Availability, allocation and the calendar only read BOOKED
+            GistIndex(
+                fields=['time_range'],
+                condition=Q(status='BOOKED'),
+                name='booking_booked_range_idx',
+            ),
+            # A guest's upcoming and past bookings
+            models.Index(
+                fields=['name', 'start_time'],
+                name='booking_name_start_idx',
+            ),
+            # The staff cancellations page
+            models.Index(
+                fields=['start_time'],
+                condition=Q(status='CANCELLED'),
+                name='booking_cancelled_start_idx',
+            ),
+            # Bookings still waiting for a reminder
+            models.Index(
+                fields=['start_time'],
+                condition=Q(status='BOOKED', reminder_sent_on__isnull=True),
+                name='booking_unreminded_start_idx',
+            ),
         ]
 
+    @classmethod
+    def from_db(cls, db, field_names, values):
+        instance = super().from_db(db, field_names, values)
+        # Remembered so a moved booking also invalidates its old date
+        instance._loaded_time_range = instance.__dict__.get('time_range')
+        return instance
+
     def save(self, *args, **kwargs):
         if self.start_time:
             if timezone.is_naive(self.start_time):
@@ -134,3 +174,110 @@ class Booking(models.Model):
             f'@ {self.start_time.strftime("%Y-%m-%d %H:%M")} | '
             f'Ref: {self.reference} | Status: {self.status}'
         )
+
+
+class AvailabilityVersion(models.Model):
+    """
+    The current availability version of a date, or of every date, kept
+    in the database so each bump is one atomic statement that every
+    process sees.
+    """
+    key = models.CharField(max_length=64, primary_key=True)
+    version = models.CharField(max_length=64)
+
+    def __str__(self):
+        return f'{self.key}: {self.version}'
+
+
+class OutboxEmail(models.Model):
+    """
+    An email waiting to be sent by the send_outbox worker, so requests
+    never wait on the SMTP relay.
+    """
+    STATUS_CHOICES = [
+        ('PENDING', 'Pending'),
+        ('SENT', 'Sent'),
+        ('FAILED', 'Failed'),
+    ]
+
+    subject = models.CharField(max_length=255)
+    body = models.TextField()
+    from_email = models.CharField(max_length=254)
+    recipients = models.JSONField()
+    status = models.CharField(
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default='PENDING'
+    )
+    attempts = models.PositiveSmallIntegerField(default=0)
+    next_attempt_at = models.DateTimeField(default=timezone.now)
+    last_error = models.TextField(blank=True)
+    created_on = models.DateTimeField(auto_now_add=True)
+    sent_on = models.DateTimeField(null=True, blank=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                fields=['next_attempt_at'],
+                condition=Q(status='PENDING'),
+                name='outbox_pending_due_idx',
+            ),
+        ]
+
+    def __str__(self):
+        return (
+            f'{self.subject} to {", ".join(self.recipients)} '
+            f'| Status: {self.status}'
+        )
+
+
+class BookingArchive(models.Model):
+    """
+    A past or cancelled booking moved out of the live table by the
+    archive_bookings command. Rows are only ever added.
+    """
+    booking_id = models.BigIntegerField(unique=True)
+    reference = models.CharField(max_length=12)
+    name = models.ForeignKey(
+        User,
+        null=True,
+        on_delete=models.SET_NULL,
+        related_name='archived_bookings',
+    )
+    table_number = models.IntegerField()
+    party_size = models.PositiveSmallIntegerField()
+    start_time = models.DateTimeField()
+    end_time = models.DateTimeField()
+    status = models.CharField(
+        max_length=10,
+        choices=Booking.STATUS_CHOICES,
+    )
+    allergies = models.TextField(blank=True)
+    cancellation_reason = models.TextField(blank=True)
+    archived_on = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        indexes = [
+            # A guest's past bookings and staff exports by date
+            models.Index(
+                fields=['name', 'start_time'],
+                name='archive_name_start_idx',
+            ),
+            models.Index(
+                fields=['start_time'],
+                name='archive_start_idx',
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        if not self._state.adding:
+            raise ValueError('Archived bookings cannot be changed.')
+
+        super().save(*args, **kwargs)
+
+    def __str__(self):
+        return (
+            f'{self.name} - Table No. {self.table_number} '
+            f'@ {self.start_time.strftime("%Y-%m-%d %H:%M")} | '
+            f'Ref: {self.reference} | Status: {self.status}'
+        )
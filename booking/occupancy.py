@@ -0,0 +1,252 @@
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from django.db import connection
+from django.utils import timezone
+from .cache import GLOBAL_VERSION_KEY, date_version_key, get_versions
+from .constants import SLOT_DURATION, INTERVAL
+from .registry import registry
+
+# How many dates each process keeps an index for
+MAX_INDEXED_DATES = 120
+
+_indexes = OrderedDict()
+_lock = threading.Lock()
+
+
+class DayOccupancy:
+    """
+    Occupancy of every table over one day's opening hours, held as an
+    integer bitmask per table with one bit per INTERVAL. A slot is free
+    on a table when its mask ANDed with the table's mask is zero.
+    """
+    __slots__ = (
+        'date', 'opening', 'origin', 'close', 'size', 'tables', 'masks',
+        'bookings',
+    )
+
+    def __init__(self, date, opening, tables):
+        tz = timezone.get_current_timezone()
+
+        self.date = date
+        self.opening = opening
+        self.origin = timezone.make_aware(
+            datetime.combine(date, opening.open_time),
+            tz,
+        )
+        self.close = timezone.make_aware(
+            datetime.combine(date, opening.close_time),
+            tz,
+        )
+        self.size = max(0, -(-(self.close - self.origin) // INTERVAL))
+
+        # (seats, id) so the smallest suitable table comes first
+        tables = list(tables)
+        self.tables = sorted((seats, table_id) for table_id, seats in tables)
+        self.masks = {table_id: 0 for table_id, _ in tables}
+        self.bookings = {}
+
+    def span(self, start, end):
+        """
+        Returns the mask of every quantum that start-end touches,
+        clipped to opening hours.
+        """
+        first = max(0, (start - self.origin) // INTERVAL)
+        last = min(self.size, -(-(end - self.origin) // INTERVAL))
+
+        if last <= first:
+            return 0
+
+        return ((1 << (last - first)) - 1) << first
+
+    def discard(self, booking_id):
+        table_id, mask = self.bookings.pop(booking_id, (None, 0))
+
+        if table_id in self.masks:
+            self.masks[table_id] &= ~mask
+
+    def set_booking(self, booking_id, table_id, time_range, booked=True):
+        """
+        Replaces whatever the index holds for the booking with its
+        current table and time range.
+        """
+        self.discard(booking_id)
+
+        if not booked or table_id not in self.masks:
+            return
+
+        start, end = time_range
+        mask = self.span(start, end)
+
+        if not mask:
+            return
+
+        self.masks[table_id] |= mask
+        self.bookings[booking_id] = (table_id, mask)
+
+    def slot_mask(self, start):
+        """
+        Returns the mask for a slot starting at start, or None when it
+        falls outside opening hours.
+        """
+        if start < self.origin or start + SLOT_DURATION > self.close:
+            return None
+
+        return self.span(start, start + SLOT_DURATION)
+
+    def ignored(self, exclude):
+        """
+        Returns the bits held by the excluded bookings, per table.
+        """
+        ignored = {}
+        for booking_id in exclude:
+            table_id, booking_mask = self.bookings.get(booking_id, (None, 0))
+            ignored[table_id] = ignored.get(table_id, 0) | booking_mask
+
+        return ignored
+
+    def gaps(self, table_id, start, exclude=()):
+        """
+        Returns how many free intervals the table has directly before
+        and after a slot starting at start, up to its neighbouring
+        bookings or the edges of opening hours.
+        """
+        end = start + SLOT_DURATION
+        first = max(0, (start - self.origin) // INTERVAL)
+        last = min(self.size, -(-(end - self.origin) // INTERVAL))
+        busy = (
+            self.masks[table_id]
+            & ~self.ignored(exclude).get(table_id, 0)
+        )
+
+        busy_before = busy & ((1 << first) - 1)
+        before = first - busy_before.bit_length()
+
+        busy_after = busy >> last
+        if busy_after:
+            after = (busy_after & -busy_after).bit_length() - 1
+        else:
+            after = self.size - last
+
+        return before, after
+
+    def free_tables(self, start, party_size, exclude=()):
+        """
+        Returns the ids of tables seating party_size that are free for
+        the slot, smallest first. Bookings in exclude are ignored.
+        """
+        mask = self.slot_mask(start)
+
+        if mask is None:
+            return []
+
+        ignored = self.ignored(exclude)
+
+        return [
+            table_id
+            for seats, table_id in self.tables
+            if seats >= party_size
+            and not self.masks[table_id] & ~ignored.get(table_id, 0) & mask
+        ]
+
+    def is_available(self, start, party_size, exclude=()):
+        return bool(self.free_tables(start, party_size, exclude))
+
+
+def build_occupancy(date):
+    """
+    Builds a date's index from the database, or returns None when the
+    restaurant is closed that day.
+    """
+    from .models import Booking
+
+    opening = registry.opening(date.weekday())
+
+    if opening is None:
+        return None
+
+    index = DayOccupancy(
+        date,
+        opening,
+        [(table.id, table.seats) for table in registry.tables()],
+    )
+
+    bookings = Booking.objects.filter(
+        status='BOOKED',
+        time_range__overlap=(index.origin, index.close),
+    ).values_list('id', 'table_id', 'time_range')
+
+    for booking_id, table_id, time_range in bookings:
+        index.set_booking(
+            booking_id,
+            table_id,
+            (time_range.lower, time_range.upper),
+        )
+
+    return index
+
+
+def _version(versions, date):
+    return (versions[GLOBAL_VERSION_KEY], versions[date_version_key(date)])
+
+
+def get_occupancy(date):
+    """
+    Returns the date's index, reusing this process's copy while the
+    date's availability version is unchanged.
+    """
+    # Rows read inside a transaction may never be committed
+    if connection.in_atomic_block:
+        return build_occupancy(date)
+
+    version = _version(
+        get_versions([GLOBAL_VERSION_KEY, date_version_key(date)]),
+        date,
+    )
+
+    with _lock:
+        cached = _indexes.get(date)
+        if cached and cached[0] == version:
+            _indexes.move_to_end(date)
+            return cached[1]
+
+    index = build_occupancy(date)
+
+    with _lock:
+        _indexes[date] = (version, index)
+        _indexes.move_to_end(date)
+
+        while len(_indexes) > MAX_INDEXED_DATES:
+            _indexes.popitem(last=False)
+
+    return index
+
+
+def booking_updater(booking_id, table_id, time_range, booked):
+    """
+    Returns an on_bump callback that carries this process's indexes
+    forward when they were current before the bump, applying the
+    booking's change once it is committed, and drops them otherwise.
+    Versions are only ever bumped from the one before, so an index one
+    version behind has missed nothing but this change.
+    """
+    def update(before, after, committed):
+        with _lock:
+            for date, (version, index) in list(_indexes.items()):
+                key = date_version_key(date)
+
+                if key not in after:
+                    continue
+
+                if version[1] != before.get(key) or index is None:
+                    del _indexes[date]
+                    continue
+
+                if committed:
+                    index.set_booking(
+                        booking_id, table_id, time_range, booked
+                    )
+
+                _indexes[date] = ((version[0], after[key]), index)
+
+    return update
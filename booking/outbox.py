@@ -0,0 +1,132 @@
+from contextlib import suppress
+from datetime import timedelta
+from django.conf import settings
+from django.core.mail import EmailMessage, get_connection
+from django.db import transaction
+from django.utils import timezone
+from .models import OutboxEmail
+
+BATCH_SIZE = 50
+
+# Tries before an email is marked FAILED, and the wait before the first
+# retry, doubling each time up to MAX_RETRY_DELAY
+MAX_ATTEMPTS = 6
+RETRY_DELAY = timedelta(minutes=1)
+MAX_RETRY_DELAY = timedelta(hours=1)
+
+# How long a worker has to send the emails it claimed before another
+# worker may take them; well above BATCH_SIZE sends at EMAIL_TIMEOUT
+CLAIM_TIMEOUT = timedelta(minutes=15)
+
+
+def queue_email(subject, body, recipients, from_email=None):
+    """
+    Adds an email to the outbox. It is sent by the send_outbox worker
+    once the current transaction commits.
+    """
+    return OutboxEmail.objects.create(
+        subject=subject,
+        body=body,
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients=list(recipients),
+    )
+
+
+def queue_emails(emails, from_email=None):
+    """
+    Adds a batch of (subject, body, recipients) emails to the outbox in
+    a single insert.
+    """
+    from_email = from_email or settings.DEFAULT_FROM_EMAIL
+
+    return OutboxEmail.objects.bulk_create([
+        OutboxEmail(
+            subject=subject,
+            body=body,
+            from_email=from_email,
+            recipients=list(recipients),
+        )
+        for subject, body, recipients in emails
+    ])
+
+
+def retry_delay(attempts):
+    return min(RETRY_DELAY * 2 ** (attempts - 1), MAX_RETRY_DELAY)
+
+
+def send_batch(batch_size=BATCH_SIZE, connection=None):
+    """
+    Sends up to batch_size due emails over one connection and returns
+    how many were sent and how many failed. Rows are claimed in a short
+    transaction with SKIP LOCKED, so several workers can drain the
+    outbox at once, and sent after it commits. A connection passed in
+    is left open for the next batch.
+    """
+    with transaction.atomic():
+        emails = list(
+            OutboxEmail.objects
+            .select_for_update(skip_locked=True)
+            .filter(status='PENDING', next_attempt_at__lte=timezone.now())
+            .order_by('next_attempt_at', 'id')[:batch_size]
+        )
+
+        if not emails:
+            return 0, 0
+
+        # Not due again until the claim runs out, so no other worker
+        # picks them up while the relay is slow
+        OutboxEmail.objects.filter(
+            pk__in=[email.pk for email in emails],
+        ).update(next_attempt_at=timezone.now() + CLAIM_TIMEOUT)
+
+    close = connection is None
+    if close:
+        connection = get_connection(fail_silently=False)
+    sent = failed = 0
+
+    try:
+        for email in emails:
+            message = EmailMessage(
+                subject=email.subject,
+                body=email.body,
+                from_email=email.from_email,
+                to=email.recipients,
+                connection=connection,
+            )
+            email.attempts += 1
+
+            try:
+                # Reopens the connection if an earlier send broke it
+                connection.open()
+                message.send()
+            except Exception as error:
+                # A broken connection must not lose the sends so far
+                with suppress(Exception):
+                    connection.close()
+                email.last_error = f'{type(error).__name__}: {error}'
+
+                if email.attempts >= MAX_ATTEMPTS:
+                    email.status = 'FAILED'
+                else:
+                    email.next_attempt_at = (
+                        timezone.now() + retry_delay(email.attempts)
+                    )
+                failed += 1
+            else:
+                email.status = 'SENT'
+                email.sent_on = timezone.now()
+                email.last_error = ''
+                sent += 1
+    finally:
+        if close:
+            connection.close()
+
+        # Recorded even if a send raised past the handler above, so
+        # the claimed emails are not left waiting out CLAIM_TIMEOUT
+        OutboxEmail.objects.bulk_update(
+            emails,
+            ['status', 'attempts', 'next_attempt_at', 'last_error',
+             'sent_on'],
+        )
+
+    return sent, failed
@@ -0,0 +1,249 @@
+import re
+from datetime import date, datetime, time
+from django.db import connection, transaction
+from django.utils import timezone
+from .allocation import DOUBLE_BOOKING_CONSTRAINT
+from .models import Booking
+
+TABLE = Booking._meta.db_table
+
+# Catches bookings outside every month that has its own partition
+DEFAULT_PARTITION = f'{TABLE}_default'
+
+MONTH_PARTITION = re.compile(rf'^{TABLE}_p(\d{{4}})_(\d{{2}})$')
+
+# Indexes the table has of its own, rather than to back a constraint
+INDEX_DEFINITIONS_SQL = '''
+    SELECT pg_get_indexdef(i.indexrelid)
+    FROM pg_index i
+    WHERE i.indrelid = %s::regclass
+    AND NOT EXISTS (
+        SELECT 1 FROM pg_constraint c
+        WHERE c.conrelid = i.indrelid AND c.conindid = i.indexrelid
+    )
+'''
+
+# Foreign keys and checks, which a partitioned table can have as is
+CONSTRAINT_DEFINITIONS_SQL = '''
+    SELECT conname, pg_get_constraintdef(oid)
+    FROM pg_constraint
+    WHERE conrelid = %s::regclass AND contype IN ('c', 'f')
+'''
+
+PARTITIONS_SQL = '''
+    SELECT child.relname
+    FROM pg_inherits
+    JOIN pg_class child ON child.oid = pg_inherits.inhrelid
+    WHERE pg_inherits.inhparent = %s::regclass
+'''
+
+
+def is_partitioned():
+    with connection.cursor() as cursor:
+        cursor.execute(
+            'SELECT relkind FROM pg_class WHERE oid = to_regclass(%s)',
+            [TABLE],
+        )
+        row = cursor.fetchone()
+
+    return row is not None and row[0] == 'p'
+
+
+def add_months(month, months):
+    months += month.year * 12 + month.month - 1
+    return date(months // 12, months % 12 + 1, 1)
+
+
+def month_bounds(month):
+    """
+    Returns local midnight at the start of the month and of the next,
+    so a partition holds whole days.
+    """
+    return tuple(
+        timezone.make_aware(datetime.combine(first, time.min))
+        for first in (month, add_months(month, 1))
+    )
+
+
+def partition_name(month):
+    return f'{TABLE}_p{month:%Y_%m}'
+
+
+def partition_months():
+    """
+    Returns the first day of each month that has its own partition.
+    """
+    with connection.cursor() as cursor:
+        cursor.execute(PARTITIONS_SQL, [TABLE])
+        names = [row[0] for row in cursor.fetchall()]
+
+    return sorted(
+        date(int(match[1]), int(match[2]), 1)
+        for match in map(MONTH_PARTITION.match, names)
+        if match
+    )
+
+
+def add_partition_constraints(cursor, partition):
+    """
+    Adds the model's double booking constraint and unique references
+    to one partition, as PostgreSQL cannot hold them on the partitioned
+    table itself.
+    """
+    constraint = next(
+        constraint
+        for constraint in Booking._meta.constraints
+        if constraint.name == DOUBLE_BOOKING_CONSTRAINT
+    ).clone()
+    suffix = partition[len(TABLE) + 1:]
+    constraint.name = f'{DOUBLE_BOOKING_CONSTRAINT}_{suffix}'
+
+    with connection.schema_editor(atomic=False) as editor:
+        sql = constraint.constraint_sql(Booking, editor)
+
+    cursor.execute(f'ALTER TABLE {partition} ADD {sql}')
+    cursor.execute(
+        f'ALTER TABLE {partition} '
+        f'ADD CONSTRAINT {partition}_reference_key UNIQUE (reference)'
+    )
+
+
+def create_partition(month):
+    """
+    Creates the partition for a month, moving in any of its bookings
+    the default partition caught, and returns its name.
+    """
+    name = partition_name(month)
+    start, end = month_bounds(month)
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        cursor.execute(
+            f'CREATE TABLE {name} '
+            f'(LIKE {TABLE} INCLUDING DEFAULTS INCLUDING CONSTRAINTS)'
+        )
+        add_partition_constraints(cursor, name)
+        cursor.execute(
+            f'WITH moved AS ('
+            f'DELETE FROM {DEFAULT_PARTITION} '
+            f'WHERE start_time >= %s AND start_time < %s RETURNING *'
+            f') INSERT INTO {name} SELECT * FROM moved',
+            [start, end],
+        )
+        cursor.execute(
+            f'ALTER TABLE {TABLE} ATTACH PARTITION {name} '
+            f'FOR VALUES FROM (%s) TO (%s)',
+            [start, end],
+        )
+
+    return name
+
+
+def ensure_partitions(months_ahead, today=None):
+    """
+    Creates any missing partitions from this month to months_ahead
+    months on, and returns their names.
+    """
+    month = (today or timezone.localdate()).replace(day=1)
+    existing = set(partition_months())
+
+    return [
+        create_partition(add_months(month, offset))
+        for offset in range(months_ahead + 1)
+        if add_months(month, offset) not in existing
+    ]
+
+
+def detach_partitions(before, drop=False):
+    """
+    Detaches the partitions of months before the given month, which
+    takes their bookings out of the live table at once, and returns
+    their names. The detached tables are kept unless drop is set.
+    """
+    detached = []
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        for month in partition_months():
+            if month >= before.replace(day=1):
+                break
+
+            name = partition_name(month)
+            cursor.execute(f'ALTER TABLE {TABLE} DETACH PARTITION {name}')
+            if drop:
+                cursor.execute(f'DROP TABLE {name}')
+            detached.append(name)
+
+    return detached
+
+
+def convert(months_ahead):
+    """
+    Rebuilds the bookings table as a table partitioned by month of
+    start_time, with a partition for every month from the earliest
+    booking to months_ahead on. Returns False if it already was.
+
+    Every booking is copied under an exclusive lock, so run it while
+    the site is quiet, ideally after archive_bookings.
+    """
+    if is_partitioned():
+        return False
+
+    previous = f'{TABLE}_unpartitioned'
+
+    with transaction.atomic(), connection.cursor() as cursor:
+        # Foreign key checks still pending would block the rename
+        cursor.execute('SET CONSTRAINTS ALL IMMEDIATE')
+        cursor.execute(f'LOCK TABLE {TABLE} IN ACCESS EXCLUSIVE MODE')
+
+        cursor.execute(INDEX_DEFINITIONS_SQL, [TABLE])
+        indexes = [row[0] for row in cursor.fetchall()]
+        cursor.execute(CONSTRAINT_DEFINITIONS_SQL, [TABLE])
+        constraints = cursor.fetchall()
+        cursor.execute(f'SELECT min(start_time) FROM {TABLE}')
+        earliest = cursor.fetchone()[0]
+
+        cursor.execute(f'ALTER TABLE {TABLE} RENAME TO {previous}')
+        cursor.execute(
+            f'CREATE TABLE {TABLE} (LIKE {previous} INCLUDING DEFAULTS) '
+            f'PARTITION BY RANGE (start_time)'
+        )
+        cursor.execute(
+            f'CREATE TABLE {DEFAULT_PARTITION} PARTITION OF {TABLE} DEFAULT'
+        )
+        add_partition_constraints(cursor, DEFAULT_PARTITION)
+
+        today = timezone.localdate()
+        first = today
+        if earliest is not None:
+            first = min(timezone.localdate(earliest), today)
+        ensure_partitions(
+            (today.year - first.year) * 12 + today.month - first.month
+            + months_ahead,
+            today=first,
+        )
+
+        cursor.execute(f'INSERT INTO {TABLE} SELECT * FROM {previous}')
+        cursor.execute(f'DROP TABLE {previous}')
+
+        # Unique keys must include the partition key, so references
+        # are only unique within each partition
+        cursor.execute(
+            f'ALTER TABLE {TABLE} ADD PRIMARY KEY (id, start_time)'
+        )
+        cursor.execute(
+            f'ALTER TABLE {TABLE} ALTER COLUMN id '
+            f'ADD GENERATED BY DEFAULT AS IDENTITY'
+        )
+        cursor.execute(
+            f"SELECT setval(pg_get_serial_sequence(%s, 'id'), "
+            f'coalesce(max(id), 0) + 1, false) FROM {TABLE}',
+            [TABLE],
+        )
+
+        for definition in indexes:
+            cursor.execute(definition)
+        for name, definition in constraints:
+            cursor.execute(
+                f'ALTER TABLE {TABLE} ADD CONSTRAINT {name} {definition}'
+            )
+
+    return True
@@ -0,0 +1,176 @@
+import threading
+import time
+from types import MappingProxyType
+from django.db import connection
+from .cache import GLOBAL_VERSION_KEY, bump_all_availability, get_versions
+
+# Seconds a snapshot is trusted without being reloaded, in case rows
+# were changed without a version bump, e.g. by QuerySet.update() or SQL
+MAX_AGE = 60
+
+
+class Record:
+    """
+    Read-only copy of a model row. Subclasses list the fields they copy
+    in __slots__.
+    """
+    __slots__ = ()
+
+    def __init__(self, **values):
+        for name in self.__slots__:
+            object.__setattr__(self, name, values[name])
+
+    def __setattr__(self, name, value):
+        raise AttributeError(f'{type(self).__name__} is read-only')
+
+    __delattr__ = __setattr__
+
+    def _values(self):
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __eq__(self, other):
+        if type(other) is not type(self):
+            return NotImplemented
+        return self._values() == other._values()
+
+    def __hash__(self):
+        return hash(self._values())
+
+    def __repr__(self):
+        fields = ', '.join(
+            f'{name}={getattr(self, name)!r}' for name in self.__slots__
+        )
+        return f'{type(self).__name__}({fields})'
+
+
+class OpeningRecord(Record):
+    __slots__ = ('weekday', 'open_time', 'close_time')
+
+
+class TableRecord(Record):
+    __slots__ = ('id', 'number', 'seats')
+
+
+class FloorRegistry:
+    """
+    Process-local copy of the opening hours and tables, which change a
+    few times a season but are read on every availability lookup.
+
+    Lookups are deliberately not free of queries. The first in each
+    request reads the global availability version, which table and
+    opening hours signals bump for every worker, and the copy is
+    reloaded when it has changed, and at least every MAX_AGE seconds.
+    A copy that never queried could not see changes saved by another
+    worker or made without signals. Later lookups in the same request
+    cost nothing.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self):
+        with self._lock:
+            self._version = None
+            self._loaded_at = None
+            self._checked = False
+            self._openings = {}
+            self._tables = ()
+
+    def expire(self):
+        """
+        Makes the next lookup check the global version again, called
+        as each request starts.
+        """
+        self._checked = False
+
+    def _load_openings(self):
+        from .models import OpeningHours
+
+        return MappingProxyType({
+            opening.weekday: OpeningRecord(
+                weekday=opening.weekday,
+                open_time=opening.open_time,
+                close_time=opening.close_time,
+            )
+            for opening in OpeningHours.objects.all()
+        })
+
+    def _load_tables(self):
+        from .models import Table
+
+        # Smallest first, as allocation wants them
+        return tuple(
+            TableRecord(id=table_id, number=number, seats=seats)
+            for table_id, number, seats in (
+                Table.objects
+                .order_by('seats', 'id')
+                .values_list('id', 'number', 'seats')
+            )
+        )
+
+    def _current(self):
+        with self._lock:
+            fresh = (
+                self._loaded_at is not None
+                and time.monotonic() - self._loaded_at < MAX_AGE
+            )
+            if fresh and self._checked:
+                return self._openings, self._tables
+            previous = (self._version, self._openings, self._tables)
+
+        version = get_versions([GLOBAL_VERSION_KEY])[GLOBAL_VERSION_KEY]
+
+        if fresh and version == previous[0]:
+            with self._lock:
+                self._checked = True
+            return previous[1], previous[2]
+
+        loaded_at = time.monotonic()
+        openings = self._load_openings()
+        tables = self._load_tables()
+
+        # Rows changed without a bump; indexes and slot lists built from
+        # the old ones are invalidated for every worker
+        if version == previous[0] and (openings, tables) != previous[1:]:
+            bump_all_availability()
+            version = get_versions([GLOBAL_VERSION_KEY])[GLOBAL_VERSION_KEY]
+
+        with self._lock:
+            self._version = version
+            self._loaded_at = loaded_at
+            self._checked = True
+            self._openings = openings
+            self._tables = tables
+
+        return openings, tables
+
+    def openings(self):
+        """
+        Returns opening hours keyed by weekday.
+        """
+        # Rows read inside a transaction may never be committed
+        if connection.in_atomic_block:
+            return self._load_openings()
+
+        return self._current()[0]
+
+    def opening(self, weekday):
+        """
+        Returns the opening hours for a weekday, or None when closed.
+        """
+        return self.openings().get(weekday)
+
+    def tables(self, min_seats=1):
+        """
+        Returns the tables seating at least min_seats, smallest first.
+        """
+        if connection.in_atomic_block:
+            tables = self._load_tables()
+        else:
+            tables = self._current()[1]
+
+        return [table for table in tables if table.seats >= min_seats]
+
+
+registry = FloorRegistry()
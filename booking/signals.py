@@ -0,0 +1,90 @@
+from django.conf import settings
+from django.core.signals import request_started
+from django.db import connection
+from django.db.models.signals import post_delete, post_migrate, post_save
+from django.dispatch import receiver
+from django.utils.timezone import localtime
+from .cache import bump_availability, bump_all_availability
+from .models import Booking, OpeningHours, Table
+from .occupancy import booking_updater
+from .registry import registry
+
+
+def range_bounds(time_range):
+    if isinstance(time_range, (list, tuple)):
+        return tuple(time_range)
+
+    return time_range.lower, time_range.upper
+
+
+def booking_dates(time_range):
+    """
+    Returns the local dates a booking's time range touches.
+    """
+    if not time_range:
+        return []
+
+    lower, upper = range_bounds(time_range)
+
+    return [localtime(lower).date(), localtime(upper).date()]
+
+
+def invalidate_booking(instance, booked):
+    # Editing a booking can move it off the date it was loaded with
+    loaded_range = getattr(instance, '_loaded_time_range', None)
+
+    bump_availability(
+        *booking_dates(instance.time_range),
+        *booking_dates(loaded_range),
+        on_bump=booking_updater(
+            instance.pk,
+            instance.table_id,
+            range_bounds(instance.time_range),
+            booked,
+        ),
+    )
+    instance._loaded_time_range = instance.time_range
+
+
+@receiver(post_save, sender=Booking)
+def invalidate_saved_booking(sender, instance, **kwargs):
+    invalidate_booking(instance, booked=instance.status == 'BOOKED')
+
+
+@receiver(post_delete, sender=Booking)
+def invalidate_deleted_booking(sender, instance, **kwargs):
+    invalidate_booking(instance, booked=False)
+
+
+@receiver(post_save, sender=Table)
+@receiver(post_delete, sender=Table)
+@receiver(post_save, sender=OpeningHours)
+@receiver(post_delete, sender=OpeningHours)
+def invalidate_all_dates(sender, **kwargs):
+    # Other workers reload when they see the new global version
+    registry.clear()
+    bump_all_availability()
+
+
+@receiver(request_started)
+def expire_registry(sender, **kwargs):
+    # The global version is checked once per request, not per lookup
+    registry.expire()
+
+
+@receiver(post_migrate)
+def partition_bookings(sender, using, **kwargs):
+    # Opting in converts the table on the next migrate, after which
+    # migrate also tops up the partitions ahead
+    if sender.name != 'booking' or not settings.BOOKING_PARTITIONED:
+        return
+
+    if Booking._meta.db_table not in connection.introspection.table_names():
+        return
+
+    from .partitions import convert, ensure_partitions
+
+    months_ahead = settings.BOOKING_PARTITION_MONTHS_AHEAD
+
+    if not convert(months_ahead):
+        ensure_partitions(months_ahead)
@@ -0,0 +1,107 @@
+import csv
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+
+# Rows fetched per round trip and items encoded per yielded chunk
+CHUNK_SIZE = 2000
+
+
+def chunked(items, size=CHUNK_SIZE):
+    """
+    Groups an iterable into lists of at most size items.
+    """
+    chunk = []
+
+    for item in items:
+        chunk.append(item)
+
+        if len(chunk) == size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def json_array_chunks(items, size=CHUNK_SIZE):
+    """
+    Yields a JSON array of items a chunk at a time, so only one chunk
+    is ever held in memory.
+    """
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    separator = ''
+
+    yield '['
+
+    for chunk in chunked(items, size):
+        yield separator + ','.join(encoder.encode(item) for item in chunk)
+        separator = ','
+
+    yield ']'
+
+
+async def ajson_array_chunks(items, size=CHUNK_SIZE):
+    """
+    json_array_chunks for an async iterable, such as a queryset's
+    aiterator().
+    """
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+    separator = ''
+    chunk = []
+
+    yield '['
+
+    async for item in items:
+        chunk.append(encoder.encode(item))
+
+        if len(chunk) == size:
+            yield separator + ','.join(chunk)
+            separator = ','
+            chunk = []
+
+    if chunk:
+        yield separator + ','.join(chunk)
+
+    yield ']'
+
+
+def json_lines_chunks(items, size=CHUNK_SIZE):
+    """
+    Yields items as JSON Lines, one object per line.
+    """
+    encoder = DjangoJSONEncoder(separators=(',', ':'))
+
+    for chunk in chunked(items, size):
+        yield ''.join(encoder.encode(item) + '\n' for item in chunk)
+
+
+class Echo:
+    """
+    File-like object for csv.writer that returns each line instead of
+    storing it.
+    """
+    def write(self, value):
+        return value
+
+
+def csv_chunks(header, rows, size=CHUNK_SIZE):
+    """
+    Yields the header and rows as CSV, a chunk of rows at a time.
+    """
+    writer = csv.writer(Echo())
+
+    yield writer.writerow(header)
+
+    for chunk in chunked(rows, size):
+        yield ''.join(writer.writerow(row) for row in chunk)
+
+
+def streaming_json_response(items, size=CHUNK_SIZE):
+    """
+    Streams items as a JSON array, e.g. straight from a queryset's
+    iterator(), instead of building the list for JsonResponse.
+    """
+    return StreamingHttpResponse(
+        json_array_chunks(items, size),
+        content_type='application/json',
+    )
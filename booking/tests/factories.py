@@ -0,0 +1,50 @@
+from datetime import datetime, time
+from django.contrib.auth.models import User
+from django.utils import timezone
+from booking.models import Booking, OpeningHours, Table
+
+
+def local_time(date, hour, minute=0):
+    """
+    Returns the aware local time on date.
+    """
+    return timezone.make_aware(datetime.combine(date, time(hour, minute)))
+
+
+def create_user(username='tester', **fields):
+    return User.objects.create_user(username=username, **fields)
+
+
+def create_tables(*seats):
+    """
+    Creates a table numbered from 1 for each seat count.
+    """
+    return [
+        Table.objects.create(number=number, seats=count)
+        for number, count in enumerate(seats, start=1)
+    ]
+
+
+def open_days(*weekdays, open_time=time(11, 0), close_time=time(23, 0)):
+    """
+    Creates opening hours on the given weekdays, or every day if none
+    are given.
+    """
+    return [
+        OpeningHours.objects.create(
+            weekday=weekday,
+            open_time=open_time,
+            close_time=close_time,
+        )
+        for weekday in weekdays or range(7)
+    ]
+
+
+def create_booking(table, guest, start_time, party_size=2, **fields):
+    return Booking.objects.create(
+        table=table,
+        name=guest,
+        party_size=party_size,
+        start_time=start_time,
+        **fields,
+    )
@@ -0,0 +1,223 @@
+import threading
+from datetime import timedelta
+from unittest import mock
+from django.test import Client, TestCase, TransactionTestCase
+from django.core.cache import cache
+from django.core.exceptions import ValidationError
+from django.db import IntegrityError, connection
+from django.urls import reverse
+from django.utils import timezone
+from booking import occupancy
+from booking.allocation import (
+    MAX_ALLOCATION_ATTEMPTS,
+    allocate_table,
+    free_tables_for,
+)
+from booking.models import Booking
+from booking.occupancy import build_occupancy
+from booking.tests.factories import (
+    create_tables,
+    create_user,
+    local_time,
+    open_days,
+)
+
+
+class AllocateTableTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of User, a 2, 4 and 6 seat table and opening hours
+        """
+        self.user = create_user(password='pass')
+
+        self.date = timezone.localdate() + timedelta(days=1)
+        open_days(self.date.weekday())
+
+        self.table_2, self.table_4, self.table_6 = create_tables(2, 4, 6)
+
+        self.start = local_time(self.date, 19)
+
+    def new_booking(self, party_size=2):
+        return Booking(
+            name=self.user,
+            party_size=party_size,
+            start_time=self.start,
+        )
+
+    def take_table(self, table):
+        # Bypasses signals, like a booking committed by another worker
+        Booking.objects.bulk_create([
+            Booking(
+                table=table,
+                name=self.user,
+                party_size=2,
+                start_time=self.start,
+                time_range=(self.start, self.start + timedelta(hours=1)),
+                reference=f'TAKEN{table.pk:07d}',
+            )
+        ])
+
+    def test_allocates_smallest_free_table(self):
+        """
+        Test that the smallest suitable table is saved
+        """
+        booking = allocate_table(self.new_booking(party_size=3))
+
+        self.assertIsNotNone(booking.pk)
+        self.assertEqual(booking.table, self.table_4)
+
+    def test_retries_next_table_when_taken_concurrently(self):
+        """
+        Test that losing a table to another request moves on to the
+        next smallest free table
+        """
+        stale_index = build_occupancy(self.date)
+        self.take_table(self.table_2)
+
+        with mock.patch(
+            'booking.allocation.get_occupancy',
+            return_value=stale_index,
+        ):
+            booking = allocate_table(self.new_booking())
+
+        self.assertEqual(booking.table, self.table_4)
+        self.assertEqual(
+            Booking.objects.filter(table=self.table_2).count(),
+            1,
+        )
+
+    def test_raises_when_every_candidate_is_taken(self):
+        """
+        Test that no longer available is only raised once every
+        candidate table has been tried
+        """
+        stale_index = build_occupancy(self.date)
+        for table in (self.table_2, self.table_4, self.table_6):
+            self.take_table(table)
+
+        with mock.patch(
+            'booking.allocation.get_occupancy',
+            return_value=stale_index,
+        ):
+            with self.assertRaisesMessage(
+                ValidationError,
+                'That time is no longer available'
+            ):
+                allocate_table(self.new_booking())
+
+        self.assertEqual(Booking.objects.count(), 3)
+
+    def test_other_integrity_errors_are_raised(self):
+        """
+        Test that integrity errors other than a double booking are not
+        retried
+        """
+        existing = allocate_table(self.new_booking())
+        booking = self.new_booking()
+        booking.reference = existing.reference
+
+        with self.assertRaises(IntegrityError):
+            allocate_table(booking)
+
+    def test_cancelled_booking_does_not_block_table(self):
+        """
+        Test that a cancelled booking on the same table and time does
+        not stop the table being allocated
+        """
+        cancelled = allocate_table(self.new_booking())
+        cancelled.status = 'CANCELLED'
+        cancelled.save()
+
+        booking = allocate_table(self.new_booking())
+
+        self.assertEqual(booking.table, self.table_2)
+
+
+class ConcurrentBookingStressTests(TransactionTestCase):
+
+    threads = 12
+
+    def setUp(self):
+        """
+        Setup of one user per thread, three 4 seat tables and opening
+        hours for tomorrow
+        """
+        cache.clear()
+        occupancy._indexes.clear()
+
+        self.date = timezone.localdate() + timedelta(days=1)
+
+        open_days(self.date.weekday())
+        create_tables(4, 4, 4)
+
+        self.users = [
+            create_user(f'guest{number}')
+            for number in range(self.threads)
+        ]
+
+        self.start = local_time(self.date, 19)
+
+    def tearDown(self):
+        occupancy._indexes.clear()
+
+    def test_concurrent_bookings_never_error_or_double_book(self):
+        """
+        Test that a rush of guests booking the same slot at once gets
+        no errors and no table booked twice, with no guest trying more
+        tables than the booking view's query budget allows for
+        """
+        barrier = threading.Barrier(self.threads)
+        lock = threading.Lock()
+        attempts = {}
+        statuses = []
+        errors = []
+
+        def counted(booking, tried=()):
+            with lock:
+                attempts[booking.name_id] = (
+                    attempts.get(booking.name_id, 0) + 1
+                )
+            return free_tables_for(booking, tried)
+
+        def book(user):
+            client = Client()
+            client.force_login(user)
+            try:
+                barrier.wait()
+                response = client.post(reverse('booking:booking'), {
+                    'date': self.date.isoformat(),
+                    'party_size': 2,
+                    'slot': self.start.isoformat(),
+                    'allergies': '',
+                })
+                statuses.append(response.status_code)
+            except Exception as error:
+                errors.append(error)
+            finally:
+                connection.close()
+
+        workers = [
+            threading.Thread(target=book, args=(user,))
+            for user in self.users
+        ]
+        with mock.patch('booking.allocation.free_tables_for', counted):
+            for worker in workers:
+                worker.start()
+            for worker in workers:
+                worker.join()
+
+        self.assertEqual(errors, [])
+        self.assertEqual(statuses.count(302), 3)
+        self.assertEqual(statuses.count(200), self.threads - 3)
+        self.assertLessEqual(
+            max(attempts.values()),
+            MAX_ALLOCATION_ATTEMPTS,
+        )
+
+        booked = Booking.objects.filter(status='BOOKED')
+        self.assertEqual(booked.count(), 3)
+        self.assertEqual(
+            booked.values('table').distinct().count(),
+            3,
+        )
@@ -0,0 +1,214 @@
+from datetime import timedelta
+from io import StringIO
+from django.test import TestCase
+from django.core.management import call_command
+from django.utils import timezone
+from adminview.views import export_rows
+from booking.archive import archive_cancelled, archive_ended
+from booking.cache import date_version_key, get_versions
+from booking.history import PAST, UPCOMING, booking_history, decode_cursor
+from booking.models import Booking, BookingArchive, Table
+from booking.tests.factories import create_booking, create_user, local_time
+
+
+class ArchiveTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a guest and a table with bookings from 20 days ago to
+        tomorrow, one of them cancelled
+        """
+        self.guest = create_user('guest')
+        self.table = Table.objects.create(number=5, seats=4)
+        self.today = timezone.localdate()
+
+        self.bookings = {
+            days: self.book(days)
+            for days in (-20, -15, -10, -3, 1)
+        }
+        self.cancelled = self.book(-12, status='CANCELLED')
+
+    def book(self, days, status='BOOKED'):
+        return create_booking(
+            self.table,
+            self.guest,
+            local_time(self.today + timedelta(days=days), 19),
+            allergies='Peanuts',
+            status=status,
+        )
+
+    def cutoff(self, days=7):
+        return timezone.now() - timedelta(days=days)
+
+    def test_moves_bookings_that_ended_before_the_cutoff(self):
+        """
+        Test that past bookings, booked or cancelled, move to the
+        archive with their details and recent ones stay live
+        """
+        moved = sum(archive_ended(self.cutoff()))
+
+        self.assertEqual(moved, 4)
+        self.assertEqual(
+            set(Booking.objects.values_list('pk', flat=True)),
+            {self.bookings[-3].pk, self.bookings[1].pk},
+        )
+
+        booking = self.bookings[-20]
+        archived = BookingArchive.objects.get(booking_id=booking.pk)
+        self.assertEqual(archived.reference, booking.reference)
+        self.assertEqual(archived.name, self.guest)
+        self.assertEqual(archived.table_number, 5)
+        self.assertEqual(archived.start_time, booking.start_time)
+        self.assertEqual(archived.end_time, booking.time_range[1])
+        self.assertEqual(archived.allergies, 'Peanuts')
+        self.assertEqual(
+            BookingArchive.objects.get(booking_id=self.cancelled.pk).status,
+            'CANCELLED',
+        )
+
+    def test_bumps_the_versions_of_archived_dates(self):
+        """
+        Test that archiving gives the moved bookings' dates a new
+        version, so cached slots and calendar weeks are not reused, and
+        leaves other dates alone
+        """
+        moved_key = date_version_key(self.today - timedelta(days=20))
+        live_key = date_version_key(self.today - timedelta(days=3))
+        before = get_versions([moved_key, live_key])
+
+        list(archive_ended(self.cutoff()))
+
+        after = get_versions([moved_key, live_key])
+        self.assertNotEqual(after[moved_key], before[moved_key])
+        self.assertEqual(after[live_key], before[live_key])
+
+    def test_moves_in_batches(self):
+        """
+        Test that each batch moves at most the batch size
+        """
+        self.assertEqual(
+            list(archive_ended(self.cutoff(), batch_size=3)),
+            [3, 1],
+        )
+
+    def test_scrubs_allergies(self):
+        """
+        Test that allergies can be blanked as bookings are archived
+        """
+        list(archive_ended(self.cutoff(), scrub=True))
+
+        self.assertFalse(
+            BookingArchive.objects.exclude(allergies='').exists()
+        )
+
+    def test_future_cancellations_wait_for_acknowledgement(self):
+        """
+        Test that a cancellation still to come stays live for staff to
+        acknowledge, and once archived still shows in the guest's
+        upcoming bookings
+        """
+        cancelled = self.book(3, status='CANCELLED')
+
+        list(archive_ended(self.cutoff()))
+
+        self.assertTrue(Booking.objects.filter(pk=cancelled.pk).exists())
+        self.assertFalse(
+            BookingArchive.objects.filter(booking_id=cancelled.pk).exists()
+        )
+
+        archive_cancelled([cancelled.pk])
+
+        rows, _ = booking_history(self.guest, UPCOMING, timezone.now())
+        self.assertEqual(
+            [row['reference'] for row in rows],
+            [self.bookings[1].reference, cancelled.reference],
+        )
+
+    def test_archive_cancelled_skips_live_bookings(self):
+        """
+        Test that only cancelled bookings are archived by id
+        """
+        moved = archive_cancelled(
+            [self.cancelled.pk, self.bookings[1].pk]
+        )
+
+        self.assertEqual(moved, 1)
+        self.assertTrue(
+            Booking.objects.filter(pk=self.bookings[1].pk).exists()
+        )
+
+    def test_archived_bookings_cannot_be_changed(self):
+        """
+        Test that saving an archived booking again is refused
+        """
+        list(archive_ended(self.cutoff()))
+        archived = BookingArchive.objects.first()
+        archived.party_size = 8
+
+        with self.assertRaises(ValueError):
+            archived.save()
+
+    def test_command_reports_how_many_moved(self):
+        """
+        Test that the command archives and reports the count
+        """
+        out = StringIO()
+
+        call_command(
+            'archive_bookings',
+            keep_days=7,
+            batch_size=2,
+            stdout=out,
+        )
+
+        self.assertIn('Archived 4 bookings', out.getvalue())
+        self.assertIn('in 2 batches', out.getvalue())
+
+    def test_history_includes_archived_bookings(self):
+        """
+        Test that past bookings page through live and archived rows
+        together, latest first
+        """
+        expected = [
+            self.bookings[-3].pk,
+            self.bookings[-10].pk,
+            self.cancelled.pk,
+            self.bookings[-15].pk,
+            self.bookings[-20].pk,
+        ]
+        list(archive_ended(self.cutoff()))
+
+        rows, after = booking_history(
+            self.guest, PAST, timezone.now(), page_size=3
+        )
+        more, after = booking_history(
+            self.guest,
+            PAST,
+            timezone.now(),
+            after=decode_cursor(after),
+            page_size=3,
+        )
+
+        self.assertEqual([row['id'] for row in rows + more], expected)
+        self.assertIsNone(after)
+
+    def test_export_includes_archived_bookings(self):
+        """
+        Test that exports cover archived bookings in the window
+        """
+        expected = sorted(
+            [*self.bookings.values(), self.cancelled],
+            key=lambda booking: booking.start_time,
+        )
+        list(archive_ended(self.cutoff()))
+
+        rows = list(export_rows(
+            self.today - timedelta(days=20),
+            self.today + timedelta(days=1),
+        ))
+
+        self.assertEqual(
+            [row[0] for row in rows],
+            [booking.reference for booking in expected],
+        )
+        self.assertEqual(rows[0][4], 5)
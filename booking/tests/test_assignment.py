@@ -0,0 +1,261 @@
+from datetime import time, timedelta
+from io import StringIO
+from django.test import TestCase, override_settings
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from booking.allocation import allocate_table
+from booking.assignment import (
+    AssignmentStrategy,
+    BestFitGapStrategy,
+    SmallestTableStrategy,
+    get_strategy,
+    simulate,
+)
+from booking.models import Booking, OpeningHours
+from booking.occupancy import DayOccupancy
+from booking.tests.factories import (
+    create_booking,
+    create_tables,
+    create_user,
+    local_time,
+    open_days,
+)
+
+
+class AssignmentStrategyTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of an empty floor of two 2 seat tables and a 6 seat
+        table open 17:00-22:00
+        """
+        self.date = timezone.localdate() + timedelta(days=1)
+        self.opening = OpeningHours(
+            weekday=self.date.weekday(),
+            open_time=time(17, 0),
+            close_time=time(22, 0),
+        )
+        self.tables = [(1, 2), (2, 2), (3, 6)]
+
+    def at(self, hour, minute=0):
+        return local_time(self.date, hour, minute)
+
+    def index(self):
+        return DayOccupancy(self.date, self.opening, self.tables)
+
+    def test_gaps_count_free_intervals_either_side(self):
+        """
+        Test that gaps stop at neighbouring bookings and at the edges
+        of opening hours
+        """
+        index = self.index()
+        index.set_booking(1, 1, (self.at(17, 15), self.at(18, 45)))
+
+        self.assertEqual(index.gaps(1, self.at(19)), (1, 6))
+        self.assertEqual(index.gaps(2, self.at(19)), (8, 6))
+        self.assertEqual(
+            index.gaps(1, self.at(19), exclude=[1]),
+            (8, 6),
+        )
+
+    def test_best_fit_packs_the_tightest_free_run(self):
+        """
+        Test that best fit picks the table the booking fills most
+        tightly, where the smallest table strategy picks the first
+        """
+        index = self.index()
+        index.set_booking(1, 1, (self.at(17, 15), self.at(18, 45)))
+        index.set_booking(2, 2, (self.at(17, 45), self.at(19, 15)))
+
+        free_tables = index.free_tables(self.at(20), 2)
+
+        self.assertEqual(
+            SmallestTableStrategy().order(index, self.at(20), 2, free_tables),
+            [1, 2, 3],
+        )
+        self.assertEqual(
+            BestFitGapStrategy().order(index, self.at(20), 2, free_tables),
+            [2, 1, 3],
+        )
+
+    def test_best_fit_keeps_large_tables_for_large_parties(self):
+        """
+        Test that a tight gap on a bigger table does not win over a
+        smaller table that seats the party
+        """
+        index = self.index()
+        index.set_booking(1, 3, (self.at(17), self.at(18, 30)))
+
+        self.assertEqual(
+            BestFitGapStrategy().order(index, self.at(18, 30), 2, [1, 2, 3]),
+            [1, 2, 3],
+        )
+
+    def test_simulate_seats_more_covers_with_best_fit(self):
+        """
+        Test that replaying the same requests seats a party the
+        smallest table strategy turns away
+        """
+        self.tables = [(1, 2), (2, 2)]
+        requests = [
+            (self.at(17, 15), 2),
+            (self.at(17, 45), 2),
+            (self.at(20), 2),
+            (self.at(18, 45), 2),
+        ]
+
+        smallest = simulate(self.index(), requests, SmallestTableStrategy())
+        best_fit = simulate(self.index(), requests, BestFitGapStrategy())
+
+        self.assertEqual(smallest['seated'], 3)
+        self.assertEqual(best_fit['seated'], 4)
+        self.assertEqual(best_fit['covers'], 8)
+        self.assertAlmostEqual(best_fit['utilisation'], 0.6)
+
+    def test_best_fit_uses_a_tight_gap_on_a_bigger_table(self):
+        """
+        Test that a bigger table whose gap the booking fills wins over
+        a smaller table left wide open
+        """
+        self.tables = [(1, 2), (2, 4)]
+        index = self.index()
+        index.set_booking(1, 2, (self.at(17), self.at(18, 30)))
+
+        self.assertEqual(
+            BestFitGapStrategy().order(index, self.at(18, 30), 2, [1, 2]),
+            [2, 1],
+        )
+
+    def test_simulate_seats_more_parties_across_table_sizes(self):
+        """
+        Test that on a floor of mixed table sizes best fit seats a party
+        the smallest table strategy turns away
+        """
+        self.tables = [(1, 2), (2, 4)]
+        requests = [
+            (self.at(17), 4),
+            (self.at(18, 30), 2),
+            (self.at(17, 15), 2),
+            (self.at(20), 4),
+        ]
+
+        smallest = simulate(self.index(), requests, SmallestTableStrategy())
+        best_fit = simulate(self.index(), requests, BestFitGapStrategy())
+
+        self.assertEqual(smallest['seated'], 3)
+        self.assertEqual(best_fit['seated'], 4)
+        self.assertGreater(best_fit['utilisation'], smallest['utilisation'])
+
+    def test_strategies_must_order_tables(self):
+        """
+        Test that a strategy without an order cannot be made
+        """
+        class Unordered(AssignmentStrategy):
+            name = 'unordered'
+
+        with self.assertRaises(TypeError):
+            Unordered()
+
+    @override_settings(
+        BOOKING_ASSIGNMENT_STRATEGY='booking.assignment.SmallestTableStrategy'
+    )
+    def test_strategy_comes_from_settings(self):
+        """
+        Test that the configured strategy is the one used
+        """
+        self.assertIsInstance(get_strategy(), SmallestTableStrategy)
+
+
+class AllocateWithStrategyTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of User, two 2 seat tables and opening hours
+        """
+        self.user = create_user(password='pass')
+        self.date = timezone.localdate() + timedelta(days=1)
+
+        open_days(
+            self.date.weekday(),
+            open_time=time(17, 0),
+            close_time=time(22, 0),
+        )
+
+        self.table_1, self.table_2 = create_tables(2, 2)
+
+        for table, hour, minute in (
+            (self.table_1, 17, 15),
+            (self.table_2, 17, 45),
+        ):
+            create_booking(table, self.user, self.at(hour, minute))
+
+    def at(self, hour, minute=0):
+        return local_time(self.date, hour, minute)
+
+    def book(self, hour, minute=0):
+        return allocate_table(Booking(
+            name=self.user,
+            party_size=2,
+            start_time=self.at(hour, minute),
+        ))
+
+    @override_settings(
+        BOOKING_ASSIGNMENT_STRATEGY='booking.assignment.BestFitGapStrategy'
+    )
+    def test_allocation_uses_best_fit(self):
+        """
+        Test that allocation leaves the longer free run open
+        """
+        self.assertEqual(self.book(20).table, self.table_2)
+        self.assertEqual(self.book(18, 45).table, self.table_1)
+
+    @override_settings(
+        BOOKING_ASSIGNMENT_STRATEGY='booking.assignment.SmallestTableStrategy'
+    )
+    def test_allocation_uses_smallest_table(self):
+        """
+        Test that the previous behaviour is still available
+        """
+        self.assertEqual(self.book(20).table, self.table_1)
+
+
+class SimulateAssignmentCommandTests(TestCase):
+
+    def test_reports_each_strategy(self):
+        """
+        Test that the simulator replays a day and reports every
+        strategy without changing any bookings
+        """
+        date = timezone.localdate() - timedelta(days=7)
+        open_days(
+            date.weekday(),
+            open_time=time(17, 0),
+            close_time=time(22, 0),
+        )
+        table, = create_tables(4)
+        booking = create_booking(
+            table,
+            create_user(),
+            local_time(date, 19),
+            party_size=3,
+        )
+        out = StringIO()
+
+        call_command(
+            'simulate_assignment',
+            date.isoformat(),
+            stdout=out,
+        )
+
+        self.assertIn('smallest table', out.getvalue())
+        self.assertIn('best fit by gap', out.getvalue())
+        self.assertIn('1/1', out.getvalue())
+        self.assertEqual(Booking.objects.get().pk, booking.pk)
+
+    def test_impossible_dates_are_rejected(self):
+        """
+        Test that a well formed date that does not exist is a command
+        error rather than a traceback
+        """
+        with self.assertRaisesMessage(CommandError, 'YYYY-MM-DD'):
+            call_command('simulate_assignment', '2026-02-30')
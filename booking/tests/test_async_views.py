@@ -0,0 +1,162 @@
+import json
+from asgiref.sync import sync_to_async
+from datetime import datetime, time, timedelta
+from django.test import AsyncRequestFactory, TestCase
+from django.contrib.auth.models import AnonymousUser, User
+from django.core.cache import cache
+from django.utils import timezone
+from booking import async_views
+from booking.models import Booking, Table, OpeningHours
+from booking.utils import get_available_slots
+
+
+class AsyncViewTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a guest, a staff user, a table, opening hours and a
+        booking on 2 February 2026
+        """
+        cache.clear()
+
+        self.factory = AsyncRequestFactory()
+        self.guest = User.objects.create_user(username='guest')
+        self.staff = User.objects.create_user(
+            username='staff',
+            is_staff=True,
+        )
+        self.table = Table.objects.create(number=1, seats=4)
+
+        OpeningHours.objects.create(
+            weekday=0,
+            open_time=time(11, 0),
+            close_time=time(23, 0),
+        )
+
+        self.date = timezone.localdate().replace(year=2026, month=2, day=2)
+        self.start_time = timezone.make_aware(datetime(2026, 2, 2, 13, 0))
+        self.booking = Booking.objects.create(
+            table=self.table,
+            name=self.guest,
+            party_size=2,
+            start_time=self.start_time,
+        )
+
+    def get(self, path, user, **params):
+        request = self.factory.get(path, params)
+        request.user = user
+        return request
+
+    async def content(self, response):
+        return json.loads(
+            b''.join([chunk async for chunk in response.streaming_content])
+        )
+
+    async def sync(self, func, *args):
+        return await sync_to_async(func)(*args)
+
+    async def test_available_slots_matches_sync_lookup(self):
+        """
+        Test that the async view returns the same slots as the sync
+        lookup, without the booked time
+        """
+        request = self.get(
+            '/booking/available-slots/',
+            self.guest,
+            date=self.date.isoformat(),
+            party_size=2,
+        )
+
+        response = await async_views.available_slots(request)
+
+        slots = json.loads(response.content)['slots']
+        values = [slot['value'] for slot in slots]
+        expected = [
+            slot.isoformat()
+            for slot in await self.sync(get_available_slots, self.date, 2)
+        ]
+        self.assertEqual(values, expected)
+        self.assertNotIn(self.start_time.isoformat(), values)
+
+    async def test_available_slots_excludes_own_booking(self):
+        """
+        Test that editing a booking frees its own time
+        """
+        request = self.get(
+            '/booking/available-slots/',
+            self.guest,
+            date=self.date.isoformat(),
+            party_size=2,
+            exclude=self.booking.pk,
+        )
+
+        response = await async_views.available_slots(request)
+
+        slots = json.loads(response.content)['slots']
+        values = [slot['value'] for slot in slots]
+        self.assertIn(self.start_time.isoformat(), values)
+
+    async def test_available_slots_returns_empty_for_impossible_date(self):
+        """
+        Test that a well formed date that does not exist returns no
+        slots rather than a server error
+        """
+        request = self.get(
+            '/booking/available-slots/',
+            self.guest,
+            date='2026-02-30',
+            party_size=2,
+        )
+
+        response = await async_views.available_slots(request)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(json.loads(response.content)['slots'], [])
+
+    async def test_available_slots_requires_login(self):
+        """
+        Test that anonymous requests are sent to log in
+        """
+        request = self.get('/booking/available-slots/', AnonymousUser())
+
+        response = await async_views.available_slots(request)
+
+        self.assertEqual(response.status_code, 302)
+
+    async def test_calendar_streams_events_and_revalidates(self):
+        """
+        Test that the async calendar returns the window's events and a
+        304 for a repeated ETag
+        """
+        window = {
+            'start': self.start_time.replace(hour=0).isoformat(),
+            'end': (self.start_time + timedelta(days=1)).isoformat(),
+        }
+        request = self.get('/calendar/', self.staff, **window)
+
+        response = await async_views.booking_calendar_data(request)
+
+        events = await self.content(response)
+        self.assertEqual([event['id'] for event in events], [self.booking.pk])
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        request = self.factory.get(
+            '/calendar/',
+            window,
+            headers={'If-None-Match': response['ETag']},
+        )
+        request.user = self.staff
+
+        response = await async_views.booking_calendar_data(request)
+
+        self.assertEqual(response.status_code, 304)
+
+    async def test_calendar_is_staff_only(self):
+        """
+        Test that guests are sent to log in
+        """
+        request = self.get('/calendar/', self.guest)
+
+        response = await async_views.booking_calendar_data(request)
+
+        self.assertEqual(response.status_code, 302)
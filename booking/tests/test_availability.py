@@ -0,0 +1,251 @@
+import random
+from datetime import timedelta
+from unittest import mock
+from django.test import TestCase
+from django.utils import timezone
+from booking.models import Table, Booking
+from booking.utils import get_available_slots, get_available_slots_range
+from booking.constants import SLOT_DURATION, MAX_RANGE_DAYS
+from booking.reference import per_slot_available_slots
+from booking.tests.factories import (
+    create_booking,
+    create_tables,
+    create_user,
+    local_time,
+    open_days,
+)
+
+
+class AvailabilityEquivalenceTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of User, a mixed floor plan and opening hours for tomorrow
+        """
+        self.user = create_user(password='pass')
+
+        self.date = timezone.localdate() + timedelta(days=1)
+        open_days(self.date.weekday())
+
+        self.tables = create_tables(2, 2, 4, 4, 6, 8)
+
+    def at(self, hour, minute=0, date=None):
+        return local_time(date or self.date, hour, minute)
+
+    def book(self, table, start, status='BOOKED'):
+        return create_booking(
+            table,
+            self.user,
+            start,
+            party_size=table.seats,
+            status=status,
+        )
+
+    def assertSameSlots(self, date=None, party_size=1, exclude_bookings=None):
+        date = date or self.date
+        self.assertEqual(
+            get_available_slots(
+                date=date,
+                party_size=party_size,
+                exclude_bookings=exclude_bookings,
+            ),
+            per_slot_available_slots(
+                date=date,
+                party_size=party_size,
+                exclude_bookings=exclude_bookings,
+            ),
+        )
+
+    def seed_random_day(self, seed):
+        """
+        Books random non-overlapping slots on every table, some of
+        them cancelled.
+        """
+        rng = random.Random(seed)
+        bookings = []
+
+        for table in self.tables:
+            current = self.at(11, rng.choice([0, 15, 30, 45]))
+            while current + SLOT_DURATION <= self.at(23):
+                roll = rng.random()
+                if roll < 0.6:
+                    bookings.append(self.book(table, current))
+                    current += SLOT_DURATION
+                elif roll < 0.8:
+                    bookings.append(
+                        self.book(table, current, status='CANCELLED')
+                    )
+                    current += SLOT_DURATION
+                current += timedelta(minutes=15 * rng.randint(0, 4))
+
+        return bookings
+
+    def test_empty_day_matches(self):
+        """
+        Test that an empty day matches for every party size
+        """
+        for party_size in (1, 2, 4, 6, 8, 10):
+            self.assertSameSlots(party_size=party_size)
+
+    def test_random_days_match(self):
+        """
+        Test that randomly seeded days match for every party size
+        """
+        for seed in range(5):
+            Booking.objects.all().delete()
+            self.seed_random_day(seed)
+            for party_size in (1, 2, 3, 4, 5, 6, 8, 10):
+                with self.subTest(seed=seed, party_size=party_size):
+                    self.assertSameSlots(party_size=party_size)
+
+    def test_random_days_match_with_excluded_booking(self):
+        """
+        Test that excluding a booking being edited matches
+        """
+        for seed in range(5):
+            Booking.objects.all().delete()
+            bookings = [
+                booking for booking in self.seed_random_day(seed)
+                if booking.status == 'BOOKED'
+            ]
+            excluded = random.Random(seed).choice(bookings)
+            for party_size in (2, 4, 8):
+                with self.subTest(seed=seed, party_size=party_size):
+                    self.assertSameSlots(
+                        party_size=party_size,
+                        exclude_bookings=Booking.objects.filter(
+                            pk=excluded.pk
+                        ),
+                    )
+
+    def test_bookings_on_neighbouring_days_match(self):
+        """
+        Test that bookings spilling over from adjacent days match
+        """
+        for table in self.tables:
+            self.book(table, self.at(21, 30, self.date - timedelta(days=1)))
+            self.book(table, self.at(11, 0, self.date + timedelta(days=1)))
+            self.book(table, self.at(21, 30))
+
+        for party_size in (2, 4, 8):
+            self.assertSameSlots(party_size=party_size)
+
+    def test_past_slots_cut_off_today(self):
+        """
+        Test that the cutoff for slots earlier today matches
+        """
+        now = self.at(15, 5)
+
+        with mock.patch('django.utils.timezone.now', return_value=now):
+            slots = get_available_slots(date=self.date, party_size=2)
+            self.assertEqual(
+                slots,
+                per_slot_available_slots(date=self.date, party_size=2),
+            )
+
+        self.assertTrue(slots)
+        self.assertTrue(all(slot > now for slot in slots))
+
+    def test_cancelled_booking_does_not_block_table(self):
+        """
+        Test that a cancelled overlapping booking does not block a table
+        which is booked at another time of day
+        """
+        Table.objects.exclude(pk=self.tables[-1].pk).delete()
+        self.book(self.tables[-1], self.at(13), status='CANCELLED')
+        self.book(self.tables[-1], self.at(19))
+
+        slots = get_available_slots(date=self.date, party_size=8)
+
+        self.assertIn(self.at(13), slots)
+        self.assertNotIn(self.at(19), slots)
+
+    def test_uses_constant_number_of_queries(self):
+        """
+        Test that the whole day is answered in three queries, plus one
+        to resolve the bookings being edited
+        """
+        self.seed_random_day(0)
+
+        with self.assertNumQueries(3):
+            get_available_slots(date=self.date, party_size=2)
+
+        with self.assertNumQueries(4):
+            get_available_slots(
+                date=self.date,
+                party_size=2,
+                exclude_bookings=Booking.objects.filter(pk=0),
+            )
+
+
+class AvailabilityRangeTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of User, tables and opening hours on every day but Sunday
+        """
+        self.user = create_user(password='pass')
+        open_days(*range(6))
+        self.table_2, self.table_4 = create_tables(2, 4)
+
+        self.start_date = timezone.localdate() + timedelta(days=1)
+        self.end_date = self.start_date + timedelta(days=13)
+
+    def test_range_matches_single_day_lookups(self):
+        """
+        Test that each day in the range matches get_available_slots
+        """
+        for offset in range(0, 14, 3):
+            date = self.start_date + timedelta(days=offset)
+            create_booking(
+                self.table_4,
+                self.user,
+                local_time(date, 19),
+                party_size=4,
+            )
+
+        days = get_available_slots_range(
+            self.start_date,
+            self.end_date,
+            party_size=3,
+        )
+
+        self.assertEqual(len(days), 14)
+        for date, slots in days.items():
+            with self.subTest(date=date):
+                self.assertEqual(
+                    slots,
+                    get_available_slots(date=date, party_size=3),
+                )
+
+    def test_closed_days_are_empty(self):
+        """
+        Test that days without opening hours have no slots
+        """
+        days = get_available_slots_range(self.start_date, self.end_date)
+
+        for date, slots in days.items():
+            with self.subTest(date=date):
+                self.assertEqual(bool(slots), date.weekday() != 6)
+
+    def test_range_is_capped(self):
+        """
+        Test that the range never covers more than MAX_RANGE_DAYS
+        """
+        days = get_available_slots_range(
+            self.start_date,
+            self.start_date + timedelta(days=365),
+        )
+
+        self.assertEqual(len(days), MAX_RANGE_DAYS)
+
+    def test_range_uses_constant_number_of_queries(self):
+        """
+        Test that a full range is answered in three queries
+        """
+        with self.assertNumQueries(3):
+            get_available_slots_range(
+                self.start_date,
+                self.start_date + timedelta(days=MAX_RANGE_DAYS - 1),
+                party_size=2,
+            )
@@ -0,0 +1,210 @@
+import os
+import tempfile
+from datetime import timedelta
+from io import StringIO
+from django.test import TestCase, override_settings
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from booking.models import Table, OpeningHours, Booking
+from booking.tests.factories import (
+    create_booking,
+    create_tables,
+    create_user,
+    local_time,
+    open_days,
+)
+from booking.cache import (
+    get_cached_available_slots,
+    get_cached_available_slots_range,
+)
+from booking.utils import get_available_slots
+
+
+class AvailabilityCacheTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of User, one table and opening hours for the next week
+        """
+        cache.clear()
+
+        self.user = create_user(password='pass')
+        open_days()
+        self.table, = create_tables(4)
+
+        self.date = timezone.localdate() + timedelta(days=1)
+        self.start = local_time(self.date, 13)
+
+    def book(self, start=None):
+        return create_booking(self.table, self.user, start or self.start)
+
+    def test_second_lookup_is_served_from_cache(self):
+        """
+        Test that a repeated lookup only reads the versions
+        """
+        slots = get_cached_available_slots(self.date, party_size=2)
+
+        with self.assertNumQueries(1):
+            self.assertEqual(
+                get_cached_available_slots(self.date, party_size=2),
+                slots,
+            )
+
+    def test_new_booking_invalidates_date(self):
+        """
+        Test that saving a booking invalidates its date
+        """
+        self.assertIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+
+        self.book()
+
+        self.assertNotIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+
+    def test_cancel_and_delete_invalidate_date(self):
+        """
+        Test that cancelling and deleting a booking free the slot again
+        """
+        booking = self.book()
+        self.assertNotIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+
+        booking.status = 'CANCELLED'
+        booking.save()
+        self.assertIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+
+        booking.status = 'BOOKED'
+        booking.save()
+        self.assertNotIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+
+        booking.delete()
+        self.assertIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+
+    def test_moving_booking_invalidates_old_date(self):
+        """
+        Test that moving a booking to another day frees its old date
+        """
+        booking = self.book()
+        get_cached_available_slots(self.date, party_size=2)
+
+        booking = Booking.objects.get(pk=booking.pk)
+        booking.start_time = self.start + timedelta(days=1)
+        booking.save()
+
+        self.assertIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+
+    def test_other_dates_stay_cached(self):
+        """
+        Test that a booking only invalidates its own date
+        """
+        other_date = self.date + timedelta(days=2)
+        get_cached_available_slots(other_date, party_size=2)
+
+        self.book()
+
+        with self.assertNumQueries(1):
+            get_cached_available_slots(other_date, party_size=2)
+
+    def test_table_and_opening_hours_changes_invalidate_all_dates(self):
+        """
+        Test that floor plan and opening hours changes clear every date
+        """
+        get_cached_available_slots(self.date, party_size=6)
+
+        Table.objects.create(number=2, seats=6)
+        self.assertTrue(get_cached_available_slots(self.date, party_size=6))
+
+        OpeningHours.objects.filter(weekday=self.date.weekday()).delete()
+        self.assertEqual(
+            get_cached_available_slots(self.date, party_size=6),
+            [],
+        )
+
+    def test_range_only_computes_missing_dates(self):
+        """
+        Test that cached dates are reused by a range lookup
+        """
+        get_cached_available_slots(self.date, party_size=2)
+        end_date = self.date + timedelta(days=6)
+
+        days = get_cached_available_slots_range(
+            self.date,
+            end_date,
+            party_size=2,
+        )
+
+        for date, slots in days.items():
+            with self.subTest(date=date):
+                self.assertEqual(slots, get_available_slots(date, 2))
+
+        with self.assertNumQueries(1):
+            get_cached_available_slots_range(
+                self.date,
+                end_date,
+                party_size=2,
+            )
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.filebased.FileBasedCache',
+            'LOCATION': os.path.join(
+                tempfile.gettempdir(),
+                'gregorys-bistro-test-cache',
+            ),
+        }
+    })
+    def test_works_with_file_based_cache(self):
+        """
+        Test that invalidation works against a shared file cache
+        """
+        cache.clear()
+
+        get_cached_available_slots(self.date, party_size=2)
+        self.book()
+
+        self.assertNotIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
+        cache.clear()
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'gregorys_bistro_test_cache',
+        }
+    })
+    def test_works_with_database_cache(self):
+        """
+        Test that invalidation works against the shared database cache
+        used by default outside tests
+        """
+        call_command('createcachetable', stdout=StringIO())
+
+        get_cached_available_slots(self.date, party_size=2)
+        self.book()
+
+        self.assertNotIn(
+            self.start,
+            get_cached_available_slots(self.date, party_size=2),
+        )
@@ -0,0 +1,175 @@
+import json
+from datetime import datetime, time, timedelta
+from django.test import TestCase
+from django.urls import reverse
+from django.core.cache import cache
+from django.utils import timezone
+from booking.constants import SLOT_DURATION
+from booking.models import Table
+from booking.tests.factories import (
+    create_booking,
+    create_user,
+    local_time,
+    open_days,
+)
+
+
+class BookingCalendarDataTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a staff user, a guest, a table and a Monday to Sunday
+        calendar window
+        """
+        cache.clear()
+
+        self.staff = create_user(
+            'staff',
+            password='password123',
+            is_staff=True,
+        )
+        self.client.force_login(self.staff)
+
+        self.guest = create_user(
+            'guest',
+            first_name='Greg',
+            last_name='Smith',
+        )
+        self.table = Table.objects.create(number=1, seats=4)
+
+        self.monday = timezone.localdate().replace(
+            year=2026, month=2, day=2
+        )
+        open_days()
+
+        self.url = reverse('booking:booking_calendar_data')
+        self.window = {
+            'start': timezone.make_aware(
+                datetime.combine(self.monday, time.min)
+            ).isoformat(),
+            'end': timezone.make_aware(
+                datetime.combine(self.monday + timedelta(days=7), time.min)
+            ).isoformat(),
+        }
+
+    def book(self, days, hour=19, status='BOOKED'):
+        return create_booking(
+            self.table,
+            self.guest,
+            local_time(self.monday + timedelta(days=days), hour),
+            status=status,
+        )
+
+    def events(self, response):
+        return json.loads(b''.join(response.streaming_content))
+
+    def test_only_bookings_in_the_window_are_returned(self):
+        """
+        Test that bookings outside the window and cancelled bookings
+        are left out
+        """
+        booking = self.book(days=2)
+        self.book(days=3, status='CANCELLED')
+        self.book(days=7)
+        self.book(days=-1)
+
+        response = self.client.get(self.url, self.window)
+
+        self.assertEqual(response.status_code, 200)
+        events = self.events(response)
+        self.assertEqual([event['id'] for event in events], [booking.id])
+        self.assertEqual(
+            events[0]['title'],
+            'Table 1 - guest',
+        )
+        self.assertEqual(events[0]['extendedProps']['name'], 'Greg Smith')
+        self.assertEqual(
+            events[0]['end'],
+            timezone.localtime(booking.start_time + SLOT_DURATION)
+            .isoformat(),
+        )
+
+    def test_missing_window_returns_no_events(self):
+        """
+        Test that a request without start and end returns nothing
+        rather than every booking
+        """
+        self.book(days=2)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.json(), [])
+
+    def test_unchanged_window_returns_not_modified(self):
+        """
+        Test that repeating a request with its ETag gets a 304 until a
+        booking in the window changes
+        """
+        booking = self.book(days=2)
+
+        response = self.client.get(self.url, self.window)
+        etag = response['ETag']
+        self.assertIn('no-cache', response['Cache-Control'])
+
+        response = self.client.get(
+            self.url, self.window, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+        # A change in a later week leaves this one unchanged
+        self.book(days=9)
+        response = self.client.get(
+            self.url, self.window, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 304)
+
+        booking.status = 'CANCELLED'
+        booking.save()
+        response = self.client.get(
+            self.url, self.window, HTTP_IF_NONE_MATCH=etag
+        )
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(self.events(response), [])
+
+    def test_no_last_modified_is_sent(self):
+        """
+        Test that revalidation relies on the ETag alone, as version
+        rows do not record when bookings last changed
+        """
+        self.book(days=2)
+
+        response = self.client.get(self.url, self.window)
+
+        self.assertNotIn('Last-Modified', response)
+        response = self.client.get(
+            self.url,
+            self.window,
+            HTTP_IF_MODIFIED_SINCE='Wed, 01 Jan 2098 00:00:00 GMT',
+        )
+        self.assertEqual(response.status_code, 200)
+
+    def test_query_count_is_constant(self):
+        """
+        Test that the events come from a single bookings query however
+        many there are
+        """
+        for days in range(7):
+            self.book(days=days)
+
+        # Session, user, availability versions, creating the one for the
+        # day after the bookings, and bookings
+        with self.assertNumQueries(5):
+            response = self.client.get(self.url, self.window)
+            events = self.events(response)
+
+        self.assertEqual(len(events), 7)
+
+    def test_guests_are_redirected(self):
+        """
+        Test that the calendar data is for staff only
+        """
+        self.client.force_login(self.guest)
+
+        response = self.client.get(self.url, self.window)
+
+        self.assertEqual(response.status_code, 302)
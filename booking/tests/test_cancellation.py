@@ -0,0 +1,129 @@
+from datetime import timedelta
+from django.test import TestCase
+from django.core.cache import cache
+from django.utils import timezone
+from booking.cache import get_cached_available_slots
+from booking.cancellation import cancel_window
+from booking.models import Booking, OutboxEmail
+from booking.tests.factories import (
+    create_booking,
+    create_tables,
+    create_user,
+    local_time,
+    open_days,
+)
+
+
+class CancelWindowTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a guest with an email, one without, a table and
+        opening hours for tomorrow
+        """
+        cache.clear()
+
+        self.guest = create_user(
+            'guest',
+            email='guest@example.com',
+        )
+        self.no_email = create_user('noemail')
+
+        self.date = timezone.localdate() + timedelta(days=1)
+        open_days(self.date.weekday())
+        self.tables = create_tables(4, 4, 4)
+
+    def at(self, hour, days=0):
+        return local_time(self.date + timedelta(days=days), hour)
+
+    def book(self, hour, table=0, guest=None, status='BOOKED', days=0):
+        return create_booking(
+            self.tables[table],
+            guest or self.guest,
+            self.at(hour, days),
+            status=status,
+        )
+
+    def test_cancels_only_booked_bookings_in_the_window(self):
+        """
+        Test that bookings overlapping the window are cancelled with
+        the reason, and others are left alone
+        """
+        lunch = self.book(12)
+        overlapping = self.book(16, table=1)
+        evening = self.book(19, table=2)
+        next_day = self.book(19, days=1)
+        already = self.book(17, status='CANCELLED')
+
+        cancelled = cancel_window(self.at(17), self.at(23), 'Flooded')
+
+        self.assertEqual(
+            [booking.pk for booking in cancelled],
+            [overlapping.pk, evening.pk],
+        )
+        self.assertEqual(
+            list(
+                Booking.objects
+                .filter(cancellation_reason='Flooded')
+                .order_by('start_time')
+                .values_list('pk', 'status')
+            ),
+            [(overlapping.pk, 'CANCELLED'), (evening.pk, 'CANCELLED')],
+        )
+        for booking in (lunch, next_day):
+            booking.refresh_from_db()
+            self.assertEqual(booking.status, 'BOOKED')
+        already.refresh_from_db()
+        self.assertEqual(already.cancellation_reason, '')
+
+    def test_queues_one_email_per_guest_with_an_address(self):
+        """
+        Test that each guest with an email gets the reason, queued in
+        the outbox
+        """
+        booking = self.book(19)
+        self.book(19, table=1, guest=self.no_email)
+
+        cancel_window(self.at(0), self.at(0, days=1), 'Private event')
+
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.recipients, ['guest@example.com'])
+        self.assertIn(booking.reference, email.subject)
+        self.assertIn('Private event', email.body)
+
+    def test_query_count_is_constant(self):
+        """
+        Test that cancelling many bookings takes no more queries than
+        cancelling one
+        """
+        self.book(12)
+
+        with self.assertNumQueries(5):
+            cancel_window(self.at(0), self.at(0, days=1), 'Closed')
+
+        for days in range(1, 11):
+            for table in range(3):
+                self.book(12, table=table, days=days)
+
+        with self.assertNumQueries(5):
+            cancelled = cancel_window(
+                self.at(0),
+                self.at(0, days=11),
+                'Closed',
+            )
+
+        self.assertEqual(len(cancelled), 30)
+
+    def test_cancelled_slots_become_available(self):
+        """
+        Test that cached availability is invalidated for the dates
+        cancelled
+        """
+        for table in range(3):
+            self.book(19, table=table)
+
+        self.assertNotIn(self.at(19), get_cached_available_slots(self.date))
+
+        cancel_window(self.at(0), self.at(0, days=1), 'Closed')
+
+        self.assertIn(self.at(19), get_cached_available_slots(self.date))
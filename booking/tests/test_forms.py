@@ -1,7 +1,6 @@
 from datetime import datetime, time
 from django.test import TestCase
 from django.contrib.auth.models import User
-from django.core.exceptions import ValidationError
 from django.utils import timezone
 from booking.forms import BookingForm
 from booking.models import Booking, Table, OpeningHours
@@ -107,17 +106,85 @@ class BookingFormTests(TestCase):
             user=self.user
         )
 
-        form.fields['slot'].choices = [
-            (self.start_time.isoformat(), self.start_time.isoformat())
-        ]
-
-        self.assertTrue(form.is_valid())
+        self.assertFalse(form.is_valid())
+        self.assertIn(
+            'That time is no longer available',
+            str(form.non_field_errors()),
+        )
 
-        with self.assertRaisesMessage(
-            ValidationError,
-            'That time is no longer available'
+    def test_form_rejects_slot_off_the_booking_grid(self):
+        """
+        Test that a posted time that is not one of the day's slots is
+        rejected
+        """
+        for slot in (
+            self.start_time.replace(minute=5).isoformat(),
+            self.start_time.replace(hour=22).isoformat(),
+            'not-a-time',
         ):
-            form.save()
+            form = BookingForm(
+                data={
+                    'date': self.date,
+                    'party_size': 2,
+                    'slot': slot,
+                    'allergies': '',
+                },
+                user=self.user
+            )
+
+            self.assertFalse(form.is_valid())
+            self.assertIn(
+                'Invalid time slot selected.',
+                form.non_field_errors(),
+            )
+
+    def test_form_rejects_slot_on_closed_day(self):
+        """
+        Test that a time on a day without opening hours is rejected
+        """
+        start_time = timezone.make_aware(datetime(2026, 2, 3, 13, 0))
+
+        form = BookingForm(
+            data={
+                'date': start_time.date(),
+                'party_size': 2,
+                'slot': start_time.isoformat(),
+                'allergies': '',
+            },
+            user=self.user
+        )
+
+        self.assertFalse(form.is_valid())
+        self.assertIn(
+            'The restaurant is closed on this day.',
+            form.non_field_errors(),
+        )
+
+    def test_validation_query_count_does_not_grow_with_bookings(self):
+        """
+        Test that checking the posted time takes the same two queries
+        however busy the day is
+        """
+        for hour in range(11, 21, 2):
+            Booking.objects.create(
+                table=self.table,
+                name=self.user,
+                party_size=2,
+                start_time=timezone.make_aware(datetime(2026, 2, 2, hour)),
+            )
+
+        form = BookingForm(
+            data={
+                'date': self.date,
+                'party_size': 2,
+                'slot': self.start_time.isoformat(),
+                'allergies': '',
+            },
+            user=self.user
+        )
+
+        with self.assertNumQueries(2):
+            self.assertTrue(form.is_valid(), form.errors)
 
     def test_edit_booking_excludes_self_from_overlap_check(self):
         """
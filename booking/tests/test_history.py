@@ -0,0 +1,194 @@
+from datetime import datetime, time, timedelta
+from django.test import TestCase
+from django.contrib.auth.models import User
+from django.urls import reverse
+from django.utils import timezone
+from booking.history import (
+    PAST,
+    UPCOMING,
+    booking_history,
+    decode_cursor,
+    encode_cursor,
+)
+from booking.models import Booking, Table
+
+
+class BookingHistoryTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of User, another guest and 25 upcoming and 25 past
+        bookings, with pairs sharing a start time on different tables
+        """
+        self.user = User.objects.create_user(
+            username='regular',
+            password='pass'
+        )
+        other = User.objects.create_user(username='other')
+
+        tables = [
+            Table.objects.create(number=1, seats=4),
+            Table.objects.create(number=2, seats=4),
+        ]
+
+        self.now = timezone.make_aware(
+            datetime.combine(timezone.localdate(), time(12, 0))
+        )
+
+        bookings = []
+        for number in range(-25, 25):
+            start = self.now + timedelta(days=number // 2, hours=2)
+            bookings.append(Booking(
+                table=tables[number % 2],
+                name=self.user,
+                party_size=2,
+                start_time=start,
+                time_range=(start, start + timedelta(hours=1)),
+                reference=f'HIST{number + 25:08d}',
+            ))
+
+        start = self.now + timedelta(days=3)
+        bookings.append(Booking(
+            table=tables[0],
+            name=other,
+            party_size=2,
+            start_time=start,
+            time_range=(start, start + timedelta(hours=1)),
+            reference='NOTMINE00001',
+            status='CANCELLED',
+        ))
+
+        Booking.objects.bulk_create(bookings)
+
+    def walk(self, kind, page_size):
+        pages = []
+        after = None
+
+        while True:
+            rows, after = booking_history(
+                self.user,
+                kind,
+                self.now,
+                after=decode_cursor(after) if after else None,
+                page_size=page_size,
+            )
+            pages.append(rows)
+
+            if after is None:
+                return pages
+
+    def test_pages_cover_every_booking_once_in_order(self):
+        """
+        Test that following the cursors returns each upcoming booking
+        once, soonest first, including ties on start time
+        """
+        pages = self.walk(UPCOMING, page_size=4)
+        rows = [row for page in pages for row in page]
+
+        expected = list(
+            Booking.objects
+            .filter(name=self.user, start_time__gte=self.now)
+            .order_by('start_time', 'id')
+            .values_list('id', flat=True)
+        )
+
+        self.assertEqual([row['id'] for row in rows], expected)
+        self.assertEqual([len(page) for page in pages], [4] * 6 + [1])
+
+    def test_past_bookings_latest_first(self):
+        """
+        Test that past bookings page backwards from the latest
+        """
+        pages = self.walk(PAST, page_size=10)
+        rows = [row for page in pages for row in page]
+
+        expected = list(
+            Booking.objects
+            .filter(name=self.user, start_time__lt=self.now)
+            .order_by('-start_time', '-id')
+            .values_list('id', flat=True)
+        )
+
+        self.assertEqual([row['id'] for row in rows], expected)
+
+    def test_later_pages_cost_one_query(self):
+        """
+        Test that a page deep in the history is a single query
+        """
+        first, after = booking_history(
+            self.user, UPCOMING, self.now, page_size=20
+        )
+
+        with self.assertNumQueries(1):
+            booking_history(
+                self.user,
+                UPCOMING,
+                self.now,
+                after=decode_cursor(after),
+                page_size=20,
+            )
+
+    def test_cursor_round_trip(self):
+        """
+        Test that a cursor decodes to the start time and id it was
+        made from, and that junk cursors are rejected
+        """
+        row = {'id': 42, 'start_time': self.now}
+
+        self.assertEqual(decode_cursor(encode_cursor(row)), (self.now, 42))
+        self.assertIsNone(decode_cursor('nonsense'))
+        self.assertIsNone(decode_cursor('1-2-3'))
+        self.assertIsNone(decode_cursor(None))
+
+    def test_booking_page_renders_first_page_only(self):
+        """
+        Test that the booking page caps each list at the page size
+        and offers the next cursor and the URL to load it from
+        """
+        self.client.force_login(self.user)
+
+        response = self.client.get(reverse('booking:booking'))
+
+        self.assertEqual(len(response.context['upcoming_bookings']), 10)
+        self.assertEqual(len(response.context['past_bookings']), 10)
+        self.assertIsNotNone(response.context['upcoming_next'])
+        self.assertContains(response, 'Load more', count=2)
+        self.assertContains(
+            response,
+            f"data-history-url='{reverse('booking:booking_history')}'",
+        )
+
+    def test_history_endpoint_returns_next_page(self):
+        """
+        Test that the load more endpoint renders the next page and
+        hands back the following cursor
+        """
+        self.client.force_login(self.user)
+        response = self.client.get(reverse('booking:booking'))
+
+        response = self.client.get(reverse('booking:booking_history'), {
+            'kind': UPCOMING,
+            'after': response.context['upcoming_next'],
+        })
+        data = response.json()
+
+        self.assertEqual(data['html'].count("class='booking-item'"), 10)
+        self.assertIsNotNone(data['next'])
+        self.assertNotIn('NOTMINE', data['html'])
+
+    def test_history_endpoint_rejects_bad_parameters(self):
+        """
+        Test that an unknown kind or cursor returns an empty page
+        """
+        self.client.force_login(self.user)
+
+        for params in (
+            {'kind': 'all', 'after': '1-1'},
+            {'kind': PAST, 'after': 'x'},
+            {'kind': PAST},
+        ):
+            response = self.client.get(
+                reverse('booking:booking_history'),
+                params,
+            )
+            self.assertEqual(response.json(), {'html': '', 'next': None})
@@ -0,0 +1,259 @@
+from datetime import timedelta
+from io import StringIO
+from unittest import mock
+from django.test import (
+    Client,
+    TestCase,
+    TransactionTestCase,
+    override_settings,
+)
+from django.urls import resolve, reverse
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.db import connection
+from django.utils import timezone
+from booking.instrumentation import (
+    QueryBudgetExceeded,
+    QueryStats,
+    query_budget,
+)
+from booking.models import Table
+from booking.registry import registry
+from booking.tests.factories import open_days
+
+
+class QueryInstrumentationTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a logged in User, a table and opening hours for
+        tomorrow
+        """
+        cache.clear()
+
+        self.user = User.objects.create_user(
+            username='tester',
+            password='pass',
+            is_staff=True,
+        )
+        self.client.force_login(self.user)
+
+        self.date = timezone.localdate() + timedelta(days=1)
+        open_days(self.date.weekday())
+        Table.objects.create(number=1, seats=4)
+
+        self.url = reverse('booking:available_slots')
+        self.params = {'date': self.date.isoformat(), 'party_size': 2}
+
+    def budget(self, queries):
+        # The resolved view carries the budget query_budget set on it
+        view = resolve(self.url).func
+        return mock.patch.object(view, 'query_budget', queries)
+
+    def test_budget_is_kept_through_other_decorators(self):
+        """
+        Test that a budget declared under login_required is still seen
+        on the view the URL resolves to
+        """
+        self.assertEqual(resolve(self.url).func.query_budget, 8)
+        self.assertEqual(query_budget(3)(lambda r: None).query_budget, 3)
+
+    def test_server_timing_header(self):
+        """
+        Test that responses carry the query count and database time
+        """
+        response = self.client.get(self.url, self.params)
+
+        self.assertRegex(
+            response['Server-Timing'],
+            r'^db;dur=[\d.]+;desc="[1-9]\d* queries", '
+            r'cache;desc="\d+ cache queries", total;dur=[\d.]+$',
+        )
+
+    def test_view_summary_is_logged(self):
+        """
+        Test that each request logs a summary for its view
+        """
+        with self.assertLogs('booking.instrumentation', 'INFO') as logs:
+            self.client.get(self.url, self.params)
+
+        self.assertRegex(
+            logs.output[0],
+            r'view=booking:available_slots method=GET status=200 '
+            r'queries=\d+ cache=\d+ db_ms=[\d.]+ total_ms=[\d.]+',
+        )
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_budget_exceeded_raises_when_strict(self):
+        """
+        Test that going over budget raises under tests
+        """
+        with self.budget(1):
+            with self.assertRaisesMessage(
+                QueryBudgetExceeded,
+                'over its budget of 1',
+            ):
+                self.client.get(self.url, self.params)
+
+    @override_settings(QUERY_BUDGET_STRICT=True)
+    def test_budget_exceeded_keeps_the_response_when_strict(self):
+        """
+        Test that going over budget does not turn a request the view
+        has already handled into an error response
+        """
+        client = Client(raise_request_exception=False)
+        client.force_login(self.user)
+
+        with self.budget(1):
+            response = client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('slots', response.json())
+
+    @override_settings(QUERY_BUDGET_STRICT=False)
+    def test_budget_exceeded_warns_in_production(self):
+        """
+        Test that going over budget only logs a warning otherwise
+        """
+        with self.budget(1):
+            with self.assertLogs(
+                'booking.instrumentation',
+                'WARNING',
+            ) as logs:
+                response = self.client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertIn('over its budget of 1', logs.output[-1])
+
+    def test_streamed_queries_are_counted(self):
+        """
+        Test that queries made while a streamed body is sent count
+        towards the request
+        """
+        url = reverse('booking:booking_calendar_data')
+        start = timezone.now()
+
+        with self.assertLogs('booking.instrumentation', 'INFO') as logs:
+            response = self.client.get(url, {
+                'start': start.isoformat(),
+                'end': (start + timedelta(days=7)).isoformat(),
+            })
+            self.assertEqual(logs.output, [])
+            b''.join(response.streaming_content)
+
+        self.assertIn('view=booking:booking_calendar_data', logs.output[0])
+
+    async def test_async_requests_are_counted(self):
+        """
+        Test that requests served over ASGI count the queries their
+        view runs
+        """
+        self.async_client.cookies = self.client.cookies
+
+        response = await self.async_client.get(self.url, self.params)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertNotIn('desc="0 queries"', response['Server-Timing'])
+
+
+@override_settings(
+    CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'gregorys_bistro_test_cache',
+        }
+    },
+    QUERY_BUDGET_STRICT=True,
+)
+class DatabaseCacheBudgetTests(TransactionTestCase):
+
+    def setUp(self):
+        """
+        Setup of a guest, a staff member, a table and opening hours for
+        the week, with the database cache used outside tests
+        """
+        call_command('createcachetable', stdout=StringIO())
+        cache.clear()
+        registry.clear()
+
+        self.guest = User.objects.create_user(username='guest')
+        self.staff = User.objects.create_user(
+            username='staff',
+            is_staff=True,
+        )
+
+        open_days()
+        Table.objects.create(number=1, seats=4)
+
+        self.date = timezone.localdate() + timedelta(days=1)
+
+    def tearDown(self):
+        cache.clear()
+        registry.clear()
+
+    def test_cache_queries_are_counted_apart(self):
+        """
+        Test that reads and writes of the cache table are counted as
+        cache queries, with their time in the database time
+        """
+        stats = QueryStats()
+
+        with connection.execute_wrapper(stats):
+            cache.set('budget', 1)
+            cache.get('budget')
+
+        self.assertEqual(stats.count, 0)
+        self.assertGreaterEqual(stats.cache_count, 2)
+        self.assertGreater(stats.duration, 0)
+
+    def test_views_keep_their_budgets(self):
+        """
+        Test that the polled views stay within their budgets, cold and
+        warm, when every cache read is a query, and report those cache
+        queries
+        """
+        start = timezone.now()
+        calendar = {
+            'start': start.isoformat(),
+            'end': (start + timedelta(days=7)).isoformat(),
+        }
+        slots = {'date': self.date.isoformat(), 'party_size': 2}
+
+        for attempt in ('cold', 'warm'):
+            with self.subTest(attempt=attempt):
+                self.client.force_login(self.staff)
+                response = self.client.get(
+                    reverse('booking:booking_calendar_data'),
+                    calendar,
+                )
+                self.assertEqual(response.status_code, 200)
+                b''.join(response.streaming_content)
+
+                self.client.force_login(self.guest)
+                response = self.client.get(reverse('booking:booking'))
+                self.assertEqual(response.status_code, 200)
+
+                response = self.client.get(
+                    reverse('booking:available_slots'),
+                    slots,
+                )
+                self.assertEqual(response.status_code, 200)
+                self.assertNotIn(
+                    '"0 cache queries"',
+                    response['Server-Timing'],
+                )
+
+                response = self.client.get(
+                    reverse('booking:available_slots_range'),
+                    {
+                        'start': self.date.isoformat(),
+                        'end': (self.date + timedelta(days=27)).isoformat(),
+                        'party_size': 2,
+                    },
+                )
+                self.assertEqual(response.status_code, 200)
+
+                self.client.logout()
+                response = self.client.get(reverse('home:menu'))
+                self.assertEqual(response.status_code, 200)
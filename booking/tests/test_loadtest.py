@@ -0,0 +1,106 @@
+from io import StringIO
+from django.test import SimpleTestCase, TestCase, LiveServerTestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from booking import occupancy
+from booking.loadtest import (
+    BOOK,
+    CALENDAR,
+    SLOTS,
+    LoadRun,
+    STAFF_USERNAME,
+    percentile,
+)
+from booking.models import Booking, OpeningHours, Table
+from booking.registry import registry
+
+
+class PercentileTests(SimpleTestCase):
+
+    def test_nearest_rank(self):
+        """
+        Test that percentiles pick the nearest ranked value
+        """
+        values = list(range(1, 101))
+
+        self.assertEqual(percentile(values, 0.50), 50)
+        self.assertEqual(percentile(values, 0.95), 95)
+        self.assertEqual(percentile(values, 0.99), 99)
+        self.assertEqual(percentile([7], 0.99), 7)
+        self.assertEqual(percentile([], 0.5), 0.0)
+
+
+class SeedLoadTestCommandTests(TestCase):
+
+    def test_seeds_and_clears(self):
+        """
+        Test that seeding creates the users, tables, opening hours and
+        past bookings asked for, and that clear removes them again
+        """
+        call_command(
+            'seed_load_test',
+            users=5,
+            tables=3,
+            bookings=40,
+            stdout=StringIO(),
+        )
+
+        self.assertEqual(User.objects.count(), 6)
+        self.assertEqual(Table.objects.count(), 3)
+        self.assertEqual(OpeningHours.objects.count(), 7)
+        self.assertEqual(Booking.objects.count(), 40)
+
+        call_command('seed_load_test', clear=True, stdout=StringIO())
+
+        self.assertFalse(User.objects.exists())
+        self.assertFalse(Booking.objects.exists())
+        self.assertFalse(Table.objects.exists())
+
+
+class LoadRunTests(LiveServerTestCase):
+
+    def setUp(self):
+        """
+        Setup of a small seed with a fresh cache and registry
+        """
+        cache.clear()
+        registry.clear()
+        occupancy._indexes.clear()
+
+        call_command(
+            'seed_load_test',
+            users=4,
+            tables=2,
+            bookings=10,
+            stdout=StringIO(),
+        )
+
+    def tearDown(self):
+        registry.clear()
+        occupancy._indexes.clear()
+
+    def test_run_reports_every_endpoint(self):
+        """
+        Test that a short run against the live server makes requests
+        to each endpoint without errors and books tables
+        """
+        load_run = LoadRun(
+            self.live_server_url,
+            list(User.objects.exclude(username=STAFF_USERNAME)),
+            User.objects.get(username=STAFF_USERNAME),
+            mix={'slots': 1, 'book': 1, 'calendar': 1},
+            seed=1,
+        )
+
+        step = load_run.run(concurrency=2, duration=1)
+
+        self.assertEqual(step['error_rate'], 0.0)
+        for name in (SLOTS, BOOK, CALENDAR):
+            self.assertGreater(step['endpoints'][name]['requests'], 0)
+            self.assertGreater(step['endpoints'][name]['p50_ms'], 0)
+        self.assertIn('booked', step['endpoints'][BOOK]['outcomes'])
+        self.assertTrue(
+            Booking.objects.filter(start_time__gt=timezone.now()).exists()
+        )
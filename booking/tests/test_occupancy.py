@@ -0,0 +1,316 @@
+from datetime import datetime, time, timedelta
+from io import StringIO
+from django.test import TestCase, TransactionTestCase
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.core.management import call_command
+from django.utils import timezone
+from booking import occupancy
+from booking.cache import (
+    bump_availability,
+    date_version_key,
+    get_versions,
+    new_version,
+)
+from booking.models import AvailabilityVersion, Table, OpeningHours, Booking
+from booking.occupancy import DayOccupancy, get_occupancy
+from booking.utils import get_available_slots
+
+
+class DayOccupancyTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of an index over 11:00-23:00 with a 2 and a 4 seat table
+        """
+        self.date = timezone.localdate() + timedelta(days=1)
+        opening = OpeningHours(
+            weekday=self.date.weekday(),
+            open_time=time(11, 0),
+            close_time=time(23, 0),
+        )
+        self.index = DayOccupancy(self.date, opening, [(4, 4), (2, 2)])
+
+    def at(self, hour, minute=0):
+        return timezone.make_aware(
+            datetime.combine(self.date, time(hour, minute))
+        )
+
+    def test_one_bit_per_interval(self):
+        """
+        Test that a 90 minute booking sets six bits from opening
+        """
+        self.index.set_booking(1, 2, (self.at(11), self.at(12, 30)))
+
+        self.assertEqual(self.index.size, 48)
+        self.assertEqual(self.index.masks[2], 0b111111)
+
+    def test_off_grid_booking_covers_every_interval_it_touches(self):
+        """
+        Test that a booking off the 15 minute grid blocks both slots
+        it overlaps
+        """
+        self.index.set_booking(1, 2, (self.at(13, 5), self.at(14, 35)))
+
+        self.assertEqual(
+            self.index.free_tables(self.at(11, 45), party_size=2),
+            [4],
+        )
+        self.assertEqual(
+            self.index.free_tables(self.at(14, 30), party_size=2),
+            [4],
+        )
+        self.assertEqual(
+            self.index.free_tables(self.at(14, 45), party_size=2),
+            [2, 4],
+        )
+
+    def test_smallest_free_table_first(self):
+        """
+        Test that free tables come back smallest first
+        """
+        self.assertEqual(
+            self.index.free_tables(self.at(19), party_size=2),
+            [2, 4],
+        )
+        self.assertEqual(
+            self.index.free_tables(self.at(19), party_size=3),
+            [4],
+        )
+
+    def test_excluded_booking_is_ignored(self):
+        """
+        Test that a booking being edited does not block its own table
+        """
+        self.index.set_booking(1, 2, (self.at(19), self.at(20, 30)))
+
+        self.assertEqual(self.index.free_tables(self.at(19), 2), [4])
+        self.assertEqual(
+            self.index.free_tables(self.at(19), 2, exclude=[1]),
+            [2, 4],
+        )
+
+    def test_cancelled_booking_is_removed(self):
+        """
+        Test that setting a booking as not booked clears its bits
+        """
+        self.index.set_booking(1, 2, (self.at(19), self.at(20, 30)))
+        self.index.set_booking(
+            1, 2, (self.at(19), self.at(20, 30)), booked=False
+        )
+
+        self.assertEqual(self.index.masks[2], 0)
+
+    def test_slot_outside_opening_hours_has_no_tables(self):
+        """
+        Test that slots running past closing have no free tables
+        """
+        self.assertEqual(self.index.free_tables(self.at(22), 2), [])
+        self.assertEqual(self.index.free_tables(self.at(10, 45), 2), [])
+
+
+class OccupancyIncrementalTests(TransactionTestCase):
+
+    def setUp(self):
+        """
+        Setup of User, tables and opening hours, with a fresh cache and
+        no indexes held by this process
+        """
+        cache.clear()
+        occupancy._indexes.clear()
+
+        self.user = User.objects.create_user(
+            username='tester',
+            password='pass'
+        )
+
+        self.date = timezone.localdate() + timedelta(days=1)
+
+        OpeningHours.objects.create(
+            weekday=self.date.weekday(),
+            open_time=time(11, 0),
+            close_time=time(23, 0),
+        )
+
+        self.table = Table.objects.create(number=1, seats=4)
+        self.start = timezone.make_aware(
+            datetime.combine(self.date, time(13, 0))
+        )
+
+    def tearDown(self):
+        occupancy._indexes.clear()
+
+    def test_index_is_reused_until_date_changes(self):
+        """
+        Test that a built index is served reading only its versions
+        """
+        index = get_occupancy(self.date)
+
+        with self.assertNumQueries(1):
+            self.assertIs(get_occupancy(self.date), index)
+
+    def test_booking_changes_are_applied_incrementally(self):
+        """
+        Test that saving, cancelling and deleting a booking update the
+        held index rather than rebuilding it
+        """
+        index = get_occupancy(self.date)
+
+        booking = Booking.objects.create(
+            table=self.table,
+            name=self.user,
+            party_size=2,
+            start_time=self.start,
+        )
+
+        with self.assertNumQueries(1):
+            self.assertIs(get_occupancy(self.date), index)
+            self.assertFalse(index.is_available(self.start, 2))
+
+        booking.status = 'CANCELLED'
+        booking.save()
+        self.assertIs(get_occupancy(self.date), index)
+        self.assertTrue(index.is_available(self.start, 2))
+
+        booking.status = 'BOOKED'
+        booking.save()
+        booking.delete()
+        self.assertIs(get_occupancy(self.date), index)
+        self.assertTrue(index.is_available(self.start, 2))
+
+    def test_moved_booking_updates_both_dates(self):
+        """
+        Test that moving a booking frees its old date
+        """
+        booking = Booking.objects.create(
+            table=self.table,
+            name=self.user,
+            party_size=2,
+            start_time=self.start,
+        )
+        index = get_occupancy(self.date)
+        self.assertFalse(index.is_available(self.start, 2))
+
+        booking = Booking.objects.get(pk=booking.pk)
+        booking.start_time = self.start + timedelta(days=7)
+        booking.save()
+
+        self.assertIs(get_occupancy(self.date), index)
+        self.assertTrue(index.is_available(self.start, 2))
+
+    def test_change_from_another_process_rebuilds_index(self):
+        """
+        Test that a version bump this process did not apply forces a
+        rebuild from the database
+        """
+        index = get_occupancy(self.date)
+
+        # Another worker books the table and bumps the date's version
+        Booking.objects.bulk_create([
+            Booking(
+                table=self.table,
+                name=self.user,
+                party_size=2,
+                start_time=self.start,
+                time_range=(self.start, self.start + timedelta(hours=2)),
+                reference='OTHERWORKER1',
+            )
+        ])
+        bump_availability(self.date)
+
+        rebuilt = get_occupancy(self.date)
+        self.assertIsNot(rebuilt, index)
+        self.assertNotIn(self.start, get_available_slots(self.date, 2))
+
+    def test_bump_after_another_process_rebuilds_index(self):
+        """
+        Test that a bump following one this process did not see does not
+        carry the index forward past the change it missed
+        """
+        index = get_occupancy(self.date)
+        key = date_version_key(self.date)
+
+        # Another worker books the table and bumps the date's version
+        Booking.objects.bulk_create([
+            Booking(
+                table=self.table,
+                name=self.user,
+                party_size=2,
+                start_time=self.start,
+                time_range=(self.start, self.start + timedelta(hours=2)),
+                reference='OTHERWORKER1',
+            )
+        ])
+        AvailabilityVersion.objects.filter(key=key).update(
+            version=new_version(),
+        )
+
+        Booking.objects.create(
+            table=self.table,
+            name=self.user,
+            party_size=2,
+            start_time=self.start + timedelta(hours=4),
+        )
+
+        rebuilt = get_occupancy(self.date)
+        self.assertIsNot(rebuilt, index)
+        self.assertFalse(rebuilt.is_available(self.start, 2))
+
+    def test_bumps_are_consecutive_and_keep_one_row(self):
+        """
+        Test that each bump reports the version the last one set, and
+        bumping adds nothing to keep beyond the date's own row
+        """
+        key = date_version_key(self.date)
+        bumps = []
+
+        def record(before, after, committed):
+            bumps.append((before[key], after[key]))
+
+        latest = get_versions([key])[key]
+        rows = AvailabilityVersion.objects.count()
+        for _ in range(5):
+            bump_availability(self.date, on_bump=record)
+
+        for before, after in bumps:
+            self.assertEqual(before, latest)
+            latest = after
+
+        self.assertEqual(get_versions([key])[key], latest)
+        self.assertEqual(AvailabilityVersion.objects.count(), rows)
+
+    def test_table_changes_rebuild_index(self):
+        """
+        Test that adding a table is picked up by the next lookup
+        """
+        index = get_occupancy(self.date)
+
+        table = Table.objects.create(number=2, seats=8)
+
+        self.assertEqual(
+            get_occupancy(self.date).free_tables(self.start, 8),
+            [table.pk],
+        )
+        self.assertIsNot(get_occupancy(self.date), index)
+
+
+class BenchmarkAvailabilityCommandTests(TestCase):
+
+    def test_benchmark_reports_each_strategy_and_rolls_back(self):
+        """
+        Test that the benchmark prints a timing per strategy and leaves
+        no data behind
+        """
+        out = StringIO()
+
+        call_command(
+            'benchmark_availability',
+            tables=3,
+            repeat=1,
+            stdout=out,
+        )
+
+        self.assertIn('per-slot ORM queries', out.getvalue())
+        self.assertIn('occupancy index lookup', out.getvalue())
+        self.assertFalse(Booking.objects.exists())
+        self.assertFalse(Table.objects.exists())
@@ -0,0 +1,230 @@
+from datetime import datetime, time, timedelta
+from io import StringIO
+from django.conf import settings
+from django.test import TestCase, override_settings
+from django.contrib.auth.models import User
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import call_command
+from django.urls import reverse
+from django.utils import timezone
+from booking.models import Booking, OpeningHours, OutboxEmail, Table
+from booking.outbox import MAX_ATTEMPTS, queue_email, send_batch
+
+
+class CountingBackend(EmailBackend):
+    """
+    Locmem backend that counts connections opened and refuses mail to
+    any address starting with fail.
+    """
+    opened = 0
+    is_open = False
+
+    def open(self):
+        if self.is_open:
+            return False
+        self.is_open = True
+        CountingBackend.opened += 1
+        return True
+
+    def close(self):
+        self.is_open = False
+
+    def send_messages(self, messages):
+        for message in messages:
+            if any(to.startswith('fail') for to in message.to):
+                raise ConnectionError('Relay refused the message')
+        return super().send_messages(messages)
+
+
+class ClaimCheckingBackend(CountingBackend):
+    """
+    Counting backend that records, at each send, how many outbox
+    emails another worker would still find due.
+    """
+    due_while_sending = []
+
+    def send_messages(self, messages):
+        ClaimCheckingBackend.due_while_sending.append(
+            OutboxEmail.objects.filter(
+                status='PENDING',
+                next_attempt_at__lte=timezone.now(),
+            ).count()
+        )
+        return super().send_messages(messages)
+
+
+@override_settings(
+    EMAIL_BACKEND='booking.tests.test_outbox.CountingBackend'
+)
+class OutboxTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a reset connection count
+        """
+        CountingBackend.opened = 0
+
+    def test_queue_email_only_inserts_a_row(self):
+        """
+        Test that queueing an email sends nothing
+        """
+        email = queue_email('Hello', 'Body', ['guest@example.com'])
+
+        self.assertEqual(email.status, 'PENDING')
+        self.assertEqual(email.from_email, settings.DEFAULT_FROM_EMAIL)
+        self.assertEqual(mail.outbox, [])
+
+    def test_batch_is_sent_over_one_connection(self):
+        """
+        Test that every due email is sent and marked sent using a
+        single connection
+        """
+        for number in range(5):
+            queue_email('Hello', 'Body', [f'guest{number}@example.com'])
+
+        sent, failed = send_batch(batch_size=10)
+
+        self.assertEqual((sent, failed), (5, 0))
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertEqual(CountingBackend.opened, 1)
+        self.assertFalse(
+            OutboxEmail.objects.exclude(status='SENT').exists()
+        )
+
+    def test_failed_send_is_retried_with_backoff(self):
+        """
+        Test that a failure is recorded and pushed back, without
+        stopping the rest of the batch
+        """
+        failing = queue_email('Hello', 'Body', ['fail@example.com'])
+        queue_email('Hello', 'Body', ['guest@example.com'])
+
+        sent, failed = send_batch()
+
+        self.assertEqual((sent, failed), (1, 1))
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, 'PENDING')
+        self.assertEqual(failing.attempts, 1)
+        self.assertIn('Relay refused', failing.last_error)
+        self.assertGreater(
+            failing.next_attempt_at,
+            timezone.now() + timedelta(seconds=50),
+        )
+
+        # Not due again yet
+        self.assertEqual(send_batch(), (0, 0))
+
+    def test_email_fails_after_max_attempts(self):
+        """
+        Test that an email that keeps failing is given up on
+        """
+        failing = queue_email('Hello', 'Body', ['fail@example.com'])
+
+        for _ in range(MAX_ATTEMPTS):
+            OutboxEmail.objects.update(next_attempt_at=timezone.now())
+            send_batch()
+
+        failing.refresh_from_db()
+        self.assertEqual(failing.status, 'FAILED')
+        self.assertEqual(failing.attempts, MAX_ATTEMPTS)
+
+    @override_settings(
+        EMAIL_BACKEND='booking.tests.test_outbox.ClaimCheckingBackend'
+    )
+    def test_batch_is_claimed_before_sending(self):
+        """
+        Test that emails being sent are not due for another worker
+        """
+        ClaimCheckingBackend.due_while_sending = []
+        for number in range(3):
+            queue_email('Hello', 'Body', [f'guest{number}@example.com'])
+
+        sent, failed = send_batch(batch_size=2)
+
+        self.assertEqual((sent, failed), (2, 0))
+        self.assertEqual(ClaimCheckingBackend.due_while_sending, [1, 1])
+        self.assertEqual(
+            OutboxEmail.objects.filter(status='PENDING').count(),
+            1,
+        )
+
+    def test_command_drains_outbox_in_batches(self):
+        """
+        Test that the worker keeps sending batches until nothing is due
+        """
+        for number in range(5):
+            queue_email('Hello', 'Body', [f'guest{number}@example.com'])
+        out = StringIO()
+
+        call_command('send_outbox', batch_size=2, stdout=out)
+
+        self.assertEqual(len(mail.outbox), 5)
+        self.assertIn('5 sent, 0 failed', out.getvalue())
+
+
+class OutboxSenderTests(TestCase):
+
+    def test_contact_form_queues_email(self):
+        """
+        Test that the contact form responds without sending
+        """
+        response = self.client.post(reverse('home:contact'), {
+            'email': 'guest@example.com',
+            'message': 'Do you have a high chair?',
+        })
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(mail.outbox, [])
+        self.assertIn('high chair', OutboxEmail.objects.get().body)
+
+    def test_admin_cancellation_queues_email(self):
+        """
+        Test that cancelling in the admin queues the notice for the
+        guest instead of sending it in the request
+        """
+        admin_user = User.objects.create_superuser(
+            username='admin',
+            password='password123',
+        )
+        guest = User.objects.create_user(
+            username='guest',
+            email='guest@example.com',
+        )
+        table = Table.objects.create(number=1, seats=4)
+        OpeningHours.objects.create(
+            weekday=0,
+            open_time=time(11, 0),
+            close_time=time(23, 0),
+        )
+        start_time = timezone.make_aware(datetime(2026, 2, 2, 19, 0))
+        booking = Booking.objects.create(
+            table=table,
+            name=guest,
+            party_size=2,
+            start_time=start_time,
+        )
+        self.client.force_login(admin_user)
+
+        local_start = timezone.localtime(start_time)
+        response = self.client.post(
+            reverse('admin:booking_booking_change', args=[booking.pk]),
+            {
+                'table': table.pk,
+                'name': guest.pk,
+                'allergies': '',
+                'party_size': 2,
+                'start_time_0': local_start.date().isoformat(),
+                'start_time_1': local_start.strftime('%H:%M:%S'),
+                'status': 'CANCELLED',
+                'cancellation_reason': 'Kitchen closed',
+            },
+        )
+
+        self.assertEqual(response.status_code, 302)
+        self.assertEqual(mail.outbox, [])
+        email = OutboxEmail.objects.get()
+        self.assertEqual(email.recipients, ['guest@example.com'])
+        self.assertIn(booking.reference, email.subject)
+        booking.refresh_from_db()
+        self.assertEqual(booking.cancellation_reason, 'Kitchen closed')
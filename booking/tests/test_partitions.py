@@ -0,0 +1,193 @@
+from datetime import timedelta
+from io import StringIO
+from django.test import TestCase
+from django.core.management import call_command
+from django.core.management.base import CommandError
+from django.db import IntegrityError, connection, transaction
+from django.utils import timezone
+from booking.allocation import is_double_booking
+from booking.models import Booking, Table
+from booking.partitions import (
+    TABLE,
+    add_months,
+    convert,
+    detach_partitions,
+    ensure_partitions,
+    is_partitioned,
+    partition_months,
+    partition_name,
+)
+from booking.tests.factories import create_booking, create_user, local_time
+
+
+class PartitionTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a guest, a table and a booking two months ago, before
+        the bookings table is partitioned
+        """
+        # Converting is what these test, so a suite run with
+        # BOOKING_PARTITIONED set skips them
+        if is_partitioned():
+            self.skipTest('Bookings are already partitioned')
+
+        self.guest = create_user('guest')
+        self.table = Table.objects.create(number=5, seats=4)
+        self.month = timezone.localdate().replace(day=1)
+
+        self.old = self.book(-2)
+
+    def book(self, months, hour=19, **kwargs):
+        return create_booking(
+            self.table,
+            self.guest,
+            self.at(months, hour),
+            **kwargs,
+        )
+
+    def at(self, months, hour=19):
+        day = add_months(self.month, months) + timedelta(days=14)
+        return local_time(day, hour)
+
+    def partition_of(self, booking):
+        with connection.cursor() as cursor:
+            cursor.execute(
+                f'SELECT tableoid::regclass::text FROM {TABLE} '
+                f'WHERE id = %s',
+                [booking.pk],
+            )
+            return cursor.fetchone()[0]
+
+    def test_convert_keeps_bookings(self):
+        """
+        Test that converting partitions every month from the earliest
+        booking to the months ahead and keeps the bookings and their ids
+        """
+        convert(months_ahead=2)
+
+        self.assertTrue(is_partitioned())
+        self.assertEqual(
+            partition_months(),
+            [add_months(self.month, months) for months in range(-2, 3)],
+        )
+        self.assertEqual(Booking.objects.get(pk=self.old.pk), self.old)
+        self.assertEqual(
+            self.partition_of(self.old),
+            partition_name(add_months(self.month, -2)),
+        )
+        self.assertGreater(self.book(1).pk, self.old.pk)
+
+    def test_convert_only_runs_once(self):
+        """
+        Test that converting a partitioned table does nothing
+        """
+        convert(months_ahead=2)
+
+        self.assertFalse(convert(months_ahead=2))
+
+    def test_double_booking_is_rejected_in_a_partition(self):
+        """
+        Test that each partition keeps the double booking constraint
+        """
+        convert(months_ahead=2)
+        self.book(1)
+
+        with self.assertRaises(IntegrityError) as raised:
+            with transaction.atomic():
+                self.book(1)
+
+        self.assertTrue(is_double_booking(raised.exception))
+
+    def test_references_stay_unique(self):
+        """
+        Test that a partition rejects a reference it already holds
+        """
+        convert(months_ahead=2)
+
+        with self.assertRaises(IntegrityError) as raised:
+            with transaction.atomic():
+                self.book(-2, hour=12, reference=self.old.reference)
+
+        self.assertFalse(is_double_booking(raised.exception))
+
+    def test_new_partition_takes_default_rows(self):
+        """
+        Test that bookings past the partitions go to the default one,
+        and move when their month's partition is created
+        """
+        convert(months_ahead=2)
+        booking = self.book(6)
+
+        self.assertEqual(self.partition_of(booking), f'{TABLE}_default')
+
+        created = ensure_partitions(6)
+
+        self.assertEqual(
+            created,
+            [partition_name(add_months(self.month, months))
+             for months in range(3, 7)],
+        )
+        self.assertEqual(
+            self.partition_of(booking),
+            partition_name(add_months(self.month, 6)),
+        )
+
+    def test_editing_moves_a_booking_between_partitions(self):
+        """
+        Test that moving a booking to another month moves its row
+        """
+        convert(months_ahead=2)
+        booking = self.book(1)
+
+        booking.start_time = self.at(2)
+        booking.save()
+
+        self.assertEqual(
+            self.partition_of(booking),
+            partition_name(add_months(self.month, 2)),
+        )
+
+    def test_detach_old_partitions(self):
+        """
+        Test that detaching takes old months out of the live table and
+        drops them when asked
+        """
+        convert(months_ahead=2)
+
+        detached = detach_partitions(add_months(self.month, -1), drop=True)
+
+        self.assertEqual(
+            detached,
+            [partition_name(add_months(self.month, -2))],
+        )
+        self.assertFalse(Booking.objects.filter(pk=self.old.pk).exists())
+        self.assertNotIn(detached[0], connection.introspection.table_names())
+
+    def test_command_needs_a_partitioned_table(self):
+        """
+        Test that the command refuses to run before converting
+        """
+        with self.assertRaises(CommandError):
+            call_command('partition_bookings', stdout=StringIO())
+
+    def test_command_converts_and_detaches(self):
+        """
+        Test that the command converts, creates the months ahead and
+        detaches old months
+        """
+        out = StringIO()
+
+        call_command(
+            'partition_bookings',
+            convert=True,
+            months_ahead=2,
+            detach_months=1,
+            stdout=out,
+        )
+
+        self.assertIn(
+            f'Detached {partition_name(add_months(self.month, -2))}',
+            out.getvalue(),
+        )
+        self.assertFalse(Booking.objects.filter(pk=self.old.pk).exists())
@@ -0,0 +1,193 @@
+import re
+from datetime import datetime, time, timedelta
+from io import StringIO
+from django.test import TestCase
+from django.test.utils import CaptureQueriesContext
+from django.contrib.auth.models import User
+from django.core.management import call_command
+from django.db import connection
+from django.urls import reverse
+from django.utils import timezone
+from adminview.views import export_rows
+from booking.allocation import validate_slot
+from booking.calendar import calendar_bookings
+from booking.constants import SLOT_DURATION
+from booking.models import Booking, Table
+from booking.occupancy import build_occupancy
+from booking.tests.factories import open_days
+from booking.utils import get_available_slots_range
+
+SEQ_SCAN = rf'Seq Scan on {Booking._meta.db_table}\b'
+
+# .iterator() reads through a server side cursor
+SERVER_CURSOR = re.compile(r'^DECLARE .+? CURSOR .*?FOR (?=\(*SELECT)')
+
+# Enough rows that the planner only picks an index when it helps
+TABLES = 40
+USERS = 200
+DAYS = 90
+SITTINGS = (time(12, 0), time(15, 0), time(18, 0))
+
+
+class HotQueryPlanTests(TestCase):
+
+    @classmethod
+    def setUpTestData(cls):
+        """
+        Setup of half a year of bookings around today over 40 tables,
+        with one in 25 cancelled, and fresh planner statistics
+        """
+        open_days()
+
+        tables = Table.objects.bulk_create([
+            Table(number=number + 1, seats=2 + number % 3 * 2)
+            for number in range(TABLES)
+        ])
+
+        cls.users = User.objects.bulk_create([
+            User(username=f'guest{number}', email=f'guest{number}@a.com')
+            for number in range(USERS)
+        ])
+        cls.staff = User.objects.create_user(
+            username='staff',
+            password='pass',
+            is_staff=True,
+        )
+
+        cls.today = timezone.localdate()
+        bookings = []
+
+        for day in range(-DAYS, DAYS):
+            date = cls.today + timedelta(days=day)
+            for sitting in SITTINGS:
+                start = timezone.make_aware(datetime.combine(date, sitting))
+                for table in tables:
+                    number = len(bookings)
+                    bookings.append(Booking(
+                        table=table,
+                        name=cls.users[number % USERS],
+                        party_size=2,
+                        start_time=start,
+                        time_range=(start, start + SLOT_DURATION),
+                        reference=f'PLAN{number:08d}',
+                        status='CANCELLED' if number % 25 == 0 else 'BOOKED',
+                    ))
+
+        Booking.objects.bulk_create(bookings, batch_size=5000)
+
+        with connection.cursor() as cursor:
+            cursor.execute(f'ANALYZE {Booking._meta.db_table}')
+
+    def assertNoSeqScan(self, run):
+        """
+        Runs the code path and explains every booking query it made,
+        failing if any of them reads the whole bookings table.
+        """
+        with CaptureQueriesContext(connection) as queries:
+            run()
+
+        explained = 0
+
+        with connection.cursor() as cursor:
+            for query in queries.captured_queries:
+                sql = SERVER_CURSOR.sub('', query['sql'])
+                # Unions start with the first query in brackets
+                if not sql.lstrip('(').startswith('SELECT'):
+                    continue
+                if Booking._meta.db_table not in sql:
+                    continue
+
+                cursor.execute(f'EXPLAIN {sql}')
+                plan = '\n'.join(row[0] for row in cursor.fetchall())
+                self.assertNotRegex(plan, SEQ_SCAN, f'{sql}\n\n{plan}')
+                explained += 1
+
+        self.assertGreater(explained, 0)
+
+    def at(self, days, hour):
+        date = self.today + timedelta(days=days)
+        return timezone.make_aware(datetime.combine(date, time(hour, 0)))
+
+    def test_guest_bookings_page(self):
+        """
+        Test that a guest's upcoming and past bookings use an index
+        """
+        self.client.force_login(self.users[7])
+
+        self.assertNoSeqScan(
+            lambda: self.client.get(reverse('booking:booking'))
+        )
+
+    def test_cancellations_page(self):
+        """
+        Test that the staff cancellations page uses an index
+        """
+        self.client.force_login(self.staff)
+
+        self.assertNoSeqScan(
+            lambda: self.client.get(reverse('adminview:cancellations'))
+        )
+
+    def test_calendar_week(self):
+        """
+        Test that a week of the reservations calendar uses an index
+        """
+        self.assertNoSeqScan(
+            lambda: list(calendar_bookings(self.at(0, 0), self.at(7, 0)))
+        )
+
+    def test_validate_slot(self):
+        """
+        Test that checking a slot for a free table uses an index
+        """
+        self.assertNoSeqScan(
+            lambda: validate_slot(self.at(1, 21), party_size=2)
+        )
+
+    def test_day_occupancy(self):
+        """
+        Test that building a day's occupancy index uses an index
+        """
+        self.assertNoSeqScan(
+            lambda: build_occupancy(self.today + timedelta(days=1))
+        )
+
+    def test_available_slots_range(self):
+        """
+        Test that a week of available slots uses an index
+        """
+        start_date = self.today + timedelta(days=1)
+
+        self.assertNoSeqScan(
+            lambda: get_available_slots_range(
+                start_date,
+                start_date + timedelta(days=6),
+                party_size=2,
+            )
+        )
+
+    def test_reminders(self):
+        """
+        Test that finding tomorrow's unreminded bookings uses an index
+        """
+        date = self.today + timedelta(days=1)
+
+        self.assertNoSeqScan(
+            lambda: call_command(
+                'send_reminders',
+                date=date.isoformat(),
+                stdout=StringIO(),
+            )
+        )
+
+    def test_export(self):
+        """
+        Test that exporting a week of bookings uses an index
+        """
+        start_date = self.today + timedelta(days=1)
+
+        self.assertNoSeqScan(
+            lambda: list(
+                export_rows(start_date, start_date + timedelta(days=6))
+            )
+        )
@@ -0,0 +1,198 @@
+from datetime import datetime, time, timedelta
+from unittest import mock
+from django.test import SimpleTestCase, TransactionTestCase
+from django.core.cache import cache
+from django.core.signals import request_started
+from django.utils import timezone
+from booking.cache import bump_all_availability, get_cached_available_slots
+from booking.models import Booking, Table, OpeningHours
+from booking.occupancy import get_occupancy
+from booking.registry import MAX_AGE, OpeningRecord, TableRecord, registry
+from booking.utils import get_available_slots_range
+
+
+class RecordTests(SimpleTestCase):
+
+    def test_records_are_read_only(self):
+        """
+        Test that a record cannot be changed once made
+        """
+        table = TableRecord(id=1, number=4, seats=2)
+
+        with self.assertRaises(AttributeError):
+            table.seats = 6
+        with self.assertRaises(AttributeError):
+            table.colour = 'red'
+
+        self.assertEqual(table, TableRecord(id=1, number=4, seats=2))
+        self.assertFalse(hasattr(table, '__dict__'))
+
+
+class FloorRegistryTests(TransactionTestCase):
+
+    def setUp(self):
+        """
+        Setup of opening hours for tomorrow and two tables, with a
+        fresh cache and registry
+        """
+        cache.clear()
+        registry.clear()
+
+        self.date = timezone.localdate() + timedelta(days=1)
+
+        OpeningHours.objects.create(
+            weekday=self.date.weekday(),
+            open_time=time(11, 0),
+            close_time=time(23, 0),
+        )
+        self.table_4 = Table.objects.create(number=2, seats=4)
+        self.table_2 = Table.objects.create(number=1, seats=2)
+
+    def tearDown(self):
+        registry.clear()
+
+    def test_each_request_reads_the_version_once(self):
+        """
+        Test that, by design, the first lookup of a request costs the
+        one query that reads the global version, and the rest none
+        """
+        registry.tables()
+        request_started.send(sender=self.__class__)
+
+        with self.assertNumQueries(1):
+            registry.tables()
+
+        with self.assertNumQueries(0):
+            registry.tables()
+            registry.opening(self.date.weekday())
+
+    def test_warm_lookups_cost_no_queries(self):
+        """
+        Test that opening hours and tables are served from memory once
+        loaded and checked in this request
+        """
+        registry.tables()
+
+        with self.assertNumQueries(0):
+            self.assertEqual(
+                registry.opening(self.date.weekday()),
+                OpeningRecord(
+                    weekday=self.date.weekday(),
+                    open_time=time(11, 0),
+                    close_time=time(23, 0),
+                ),
+            )
+            self.assertEqual(
+                [table.id for table in registry.tables()],
+                [self.table_2.id, self.table_4.id],
+            )
+            self.assertEqual(
+                [table.id for table in registry.tables(3)],
+                [self.table_4.id],
+            )
+
+    def test_clean_and_range_lookups_use_the_registry(self):
+        """
+        Test that booking validation needs no query and a range lookup
+        only reads bookings
+        """
+        registry.tables()
+        booking = Booking(
+            table=self.table_2,
+            party_size=2,
+            start_time=timezone.make_aware(
+                datetime.combine(self.date, time(19, 0))
+            ),
+        )
+
+        with self.assertNumQueries(0):
+            booking.clean()
+
+        with self.assertNumQueries(1):
+            get_available_slots_range(self.date, self.date, 2)
+
+    def test_table_changes_are_picked_up(self):
+        """
+        Test that saving or deleting a table refreshes the registry
+        """
+        registry.tables()
+
+        table = Table.objects.create(number=3, seats=8)
+        self.assertIn(table.id, [table.id for table in registry.tables()])
+
+        table.delete()
+        self.assertEqual(len(registry.tables()), 2)
+
+    def test_change_from_another_process_reloads(self):
+        """
+        Test that a new global version from another worker reloads the
+        registry on the next request
+        """
+        registry.tables()
+
+        # Another worker changes the hours and bumps the version
+        OpeningHours.objects.update(close_time=time(22, 0))
+        bump_all_availability()
+
+        # The version is only checked once per request
+        self.assertEqual(
+            registry.opening(self.date.weekday()).close_time,
+            time(23, 0),
+        )
+
+        request_started.send(sender=self.__class__)
+
+        with self.assertNumQueries(3):
+            registry.tables()
+        self.assertEqual(
+            registry.opening(self.date.weekday()).close_time,
+            time(22, 0),
+        )
+
+    def test_unannounced_change_is_picked_up_after_max_age(self):
+        """
+        Test that a change whose version bump never arrives is still
+        picked up once the snapshot is MAX_AGE seconds old
+        """
+        registry.tables()
+        loaded = registry._loaded_at
+
+        # Changed without a signal, so no version bump
+        OpeningHours.objects.update(close_time=time(22, 0))
+
+        with mock.patch('booking.registry.time.monotonic') as monotonic:
+            monotonic.return_value = loaded + MAX_AGE - 1
+            registry.expire()
+            self.assertEqual(
+                registry.opening(self.date.weekday()).close_time,
+                time(23, 0),
+            )
+
+            monotonic.return_value = loaded + MAX_AGE
+            self.assertEqual(
+                registry.opening(self.date.weekday()).close_time,
+                time(22, 0),
+            )
+
+    def test_max_age_reload_invalidates_slots_built_from_old_rows(self):
+        """
+        Test that a reload finding rows changed without a bump gives
+        every date a new version, so cached slots and this process's
+        indexes match the new hours
+        """
+        slots = get_cached_available_slots(self.date, 2)
+        index = get_occupancy(self.date)
+        loaded = registry._loaded_at
+
+        OpeningHours.objects.update(close_time=time(22, 0))
+        self.assertEqual(get_cached_available_slots(self.date, 2), slots)
+
+        with mock.patch('booking.registry.time.monotonic') as monotonic:
+            monotonic.return_value = loaded + MAX_AGE
+            registry.tables()
+
+        late = timezone.make_aware(datetime.combine(self.date, time(21, 0)))
+        self.assertIn(late, slots)
+        self.assertNotIn(late, get_cached_available_slots(self.date, 2))
+        self.assertIsNot(get_occupancy(self.date), index)
+        self.assertEqual(get_occupancy(self.date).close.time(), time(22, 0))
@@ -0,0 +1,219 @@
+from datetime import timedelta
+from io import StringIO
+from smtplib import SMTPRecipientsRefused, SMTPServerDisconnected
+from django.test import TestCase, override_settings
+from django.core import mail
+from django.core.mail.backends.locmem import EmailBackend
+from django.core.management import CommandError, call_command
+from django.utils import timezone
+from booking.models import Table
+from booking.tests.factories import create_booking, create_user, local_time
+
+
+class FailingBackend(EmailBackend):
+    """
+    Locmem backend that, like SMTP, sends messages in order until it
+    reaches one with a fail address, which the relay always refuses.
+    """
+    def send_messages(self, messages):
+        sent = 0
+        for message in messages:
+            if any(to.startswith('fail') for to in message.to):
+                raise SMTPRecipientsRefused({
+                    to: (550, b'No such user') for to in message.to
+                })
+            sent += super().send_messages([message])
+        return sent
+
+
+class DisconnectingBackend(EmailBackend):
+    """
+    Locmem backend that, like SMTP, drops the connection when it
+    reaches a drop address and refuses every send until it is reopened.
+    """
+    def open(self):
+        self.connected = True
+        return True
+
+    def close(self):
+        self.connected = False
+
+    def send_messages(self, messages):
+        if not getattr(self, 'connected', False):
+            raise SMTPServerDisconnected('please run connect() first')
+
+        for message in messages:
+            if any(to.startswith('drop') for to in message.to):
+                self.connected = False
+                raise SMTPServerDisconnected('Connection unexpectedly closed')
+        return super().send_messages(messages)
+
+
+class SendRemindersCommandTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of a table and a helper for tomorrow's bookings
+        """
+        self.table = Table.objects.create(number=1, seats=4)
+        self.tomorrow = timezone.localdate() + timedelta(days=1)
+
+    def book(self, username, email, date=None, hour=19, status='BOOKED'):
+        return create_booking(
+            self.table,
+            create_user(username, email=email),
+            local_time(date or self.tomorrow, hour),
+            status=status,
+        )
+
+    def test_reminds_only_tomorrows_booked_guests(self):
+        """
+        Test that cancelled bookings, other days and guests without an
+        email are skipped
+        """
+        booking = self.book('guest', 'guest@example.com')
+        self.book('cancelled', 'c@example.com', hour=12, status='CANCELLED')
+        self.book(
+            'later',
+            'l@example.com',
+            date=self.tomorrow + timedelta(days=1),
+        )
+        self.book('noemail', '', hour=15)
+        out = StringIO()
+
+        call_command('send_reminders', stdout=out)
+
+        self.assertEqual(len(mail.outbox), 1)
+        self.assertEqual(mail.outbox[0].to, ['guest@example.com'])
+        self.assertIn(booking.reference, mail.outbox[0].body)
+        self.assertIn('Sent 1 reminders', out.getvalue())
+        self.assertIn('per second', out.getvalue())
+
+    def test_one_select_and_one_update_per_chunk(self):
+        """
+        Test that bookings are read in one query and marked a chunk at
+        a time
+        """
+        for number, hour in enumerate((12, 15, 19)):
+            self.book(f'guest{number}', f'{number}@example.com', hour=hour)
+
+        with self.assertNumQueries(3):
+            call_command('send_reminders', chunk_size=2, stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 3)
+
+    def test_running_again_does_not_resend(self):
+        """
+        Test that a second run sends nothing
+        """
+        self.book('guest', 'guest@example.com')
+
+        call_command('send_reminders', stdout=StringIO())
+        call_command('send_reminders', stdout=StringIO())
+
+        self.assertEqual(len(mail.outbox), 1)
+
+    @override_settings(
+        EMAIL_BACKEND='booking.tests.test_reminders.FailingBackend'
+    )
+    def test_failed_reminder_is_recorded_and_retried(self):
+        """
+        Test that a reminder the relay refuses is recorded on its
+        booking, reported and released for the next run
+        """
+        sent = self.book('guest', 'guest@example.com', hour=12)
+        failing = self.book('fail', 'fail@example.com', hour=19)
+        err = StringIO()
+
+        call_command(
+            'send_reminders',
+            chunk_size=1,
+            stdout=StringIO(),
+            stderr=err,
+        )
+
+        sent.refresh_from_db()
+        failing.refresh_from_db()
+        self.assertIsNotNone(sent.reminder_sent_on)
+        self.assertEqual(sent.reminder_error, '')
+        self.assertIsNone(failing.reminder_sent_on)
+        self.assertIn('SMTPRecipientsRefused', failing.reminder_error)
+        self.assertIn(failing.reference, err.getvalue())
+        self.assertIn('1 reminders failed', err.getvalue())
+
+        failing.name.email = 'fixed@example.com'
+        failing.name.save()
+        call_command('send_reminders', stdout=StringIO())
+
+        failing.refresh_from_db()
+        self.assertIsNotNone(failing.reminder_sent_on)
+        self.assertEqual(failing.reminder_error, '')
+        self.assertEqual(len(mail.outbox), 2)
+
+    @override_settings(
+        EMAIL_BACKEND='booking.tests.test_reminders.FailingBackend'
+    )
+    def test_refused_guest_does_not_stop_the_rest(self):
+        """
+        Test that guests after one the relay always refuses still get
+        their reminders, on every run, without anyone being sent two
+        """
+        before = self.book('guest', 'guest@example.com', hour=12)
+        failing = self.book('fail', 'fail@example.com', hour=15)
+        after = self.book('after', 'after@example.com', hour=19)
+
+        for _ in range(2):
+            call_command(
+                'send_reminders',
+                stdout=StringIO(),
+                stderr=StringIO(),
+            )
+
+        for booking in (before, failing, after):
+            booking.refresh_from_db()
+        self.assertIsNotNone(before.reminder_sent_on)
+        self.assertIsNone(failing.reminder_sent_on)
+        self.assertIsNotNone(after.reminder_sent_on)
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [['guest@example.com'], ['after@example.com']],
+        )
+
+        # A guest booked after the refused one is reminded next run
+        later = self.book('later', 'later@example.com', hour=21)
+        call_command('send_reminders', stdout=StringIO(), stderr=StringIO())
+
+        later.refresh_from_db()
+        self.assertIsNotNone(later.reminder_sent_on)
+        self.assertEqual(mail.outbox[-1].to, ['later@example.com'])
+
+    @override_settings(
+        EMAIL_BACKEND='booking.tests.test_reminders.DisconnectingBackend'
+    )
+    def test_dropped_connection_is_reopened_for_the_rest(self):
+        """
+        Test that guests after a send that drops the connection are
+        still reminded over a fresh one
+        """
+        dropped = self.book('drop', 'drop@example.com', hour=12)
+        after = self.book('after', 'after@example.com', hour=19)
+
+        call_command('send_reminders', stdout=StringIO(), stderr=StringIO())
+
+        dropped.refresh_from_db()
+        after.refresh_from_db()
+        self.assertIsNone(dropped.reminder_sent_on)
+        self.assertIn('SMTPServerDisconnected', dropped.reminder_error)
+        self.assertIsNotNone(after.reminder_sent_on)
+        self.assertEqual(
+            [message.to for message in mail.outbox],
+            [['after@example.com']],
+        )
+
+    def test_impossible_dates_are_rejected(self):
+        """
+        Test that a well formed date that does not exist is a command
+        error rather than a traceback
+        """
+        with self.assertRaisesMessage(CommandError, 'YYYY-MM-DD'):
+            call_command('send_reminders', date='2026-02-30')
@@ -0,0 +1,78 @@
+import json
+from datetime import datetime
+from django.core.serializers.json import DjangoJSONEncoder
+from django.test import SimpleTestCase
+from django.utils import timezone
+from booking.streaming import csv_chunks, json_array_chunks, json_lines_chunks
+
+
+class StreamingEncoderTests(SimpleTestCase):
+
+    def setUp(self):
+        """
+        Setup of a generator of rows with dates, as a queryset iterator
+        would give
+        """
+        self.when = timezone.make_aware(datetime(2026, 2, 2, 19, 0))
+        self.rows = (
+            {'id': number, 'start': self.when}
+            for number in range(5)
+        )
+
+    def test_json_array_matches_json_dumps(self):
+        """
+        Test that the streamed array decodes to the same list, with
+        several items per chunk
+        """
+        chunks = list(json_array_chunks(self.rows, size=2))
+
+        self.assertEqual(len(chunks), 5)
+        self.assertEqual(
+            ''.join(chunks),
+            json.dumps(
+                [{'id': number, 'start': self.when} for number in range(5)],
+                cls=DjangoJSONEncoder,
+                separators=(',', ':'),
+            ),
+        )
+
+    def test_empty_json_array(self):
+        """
+        Test that no items streams an empty array
+        """
+        self.assertEqual(''.join(json_array_chunks([])), '[]')
+
+    def test_items_are_read_lazily(self):
+        """
+        Test that items are only pulled from the iterator as chunks
+        are consumed
+        """
+        consumed = []
+
+        def rows():
+            for number in range(10):
+                consumed.append(number)
+                yield {'id': number}
+
+        chunks = json_array_chunks(rows(), size=3)
+        next(chunks)
+        next(chunks)
+
+        self.assertEqual(consumed, [0, 1, 2])
+
+    def test_json_lines_one_object_per_line(self):
+        """
+        Test that each item is written on its own line
+        """
+        lines = ''.join(json_lines_chunks(self.rows, size=2)).splitlines()
+
+        self.assertEqual(len(lines), 5)
+        self.assertEqual(json.loads(lines[4])['id'], 4)
+
+    def test_csv_header_then_rows(self):
+        """
+        Test that CSV starts with the header and quotes as needed
+        """
+        text = ''.join(csv_chunks(['id', 'note'], [(1, 'a, b'), (2, '')]))
+
+        self.assertEqual(text, 'id,note\r\n1,"a, b"\r\n2,\r\n')
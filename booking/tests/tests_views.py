@@ -2,6 +2,7 @@ from datetime import datetime, time
 from django.test import TestCase
 from django.urls import reverse
 from django.contrib.auth.models import User
+from django.core.cache import cache
 from django.utils import timezone
 from booking.models import Booking, Table, OpeningHours
 
@@ -12,6 +13,8 @@ class BookingViewTests(TestCase):
         """
         Setup of self function for other tests to use
         """
+        cache.clear()
+
         self.user = User.objects.create_user(
             username='testuser',
             password='password123'
@@ -77,6 +80,21 @@ class BookingViewTests(TestCase):
         self.assertEqual(response.status_code, 200)
         self.assertEqual(response.json()['slots'], [])
 
+    def test_available_slots_returns_empty_for_impossible_date(self):
+        """
+        Test that a well formed date that does not exist returns no
+        slots rather than a server error
+        """
+        url = reverse('booking:available_slots')
+
+        response = self.client.get(url, {
+            'date': '2026-02-30',
+            'party_size': 2,
+        })
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()['slots'], [])
+
     def test_available_slots_excludes_existing_booking(self):
         """
         Test to ensure available slots exclude existing bookings
@@ -109,6 +127,97 @@ class BookingViewTests(TestCase):
 
         self.assertNotIn(self.start_time.isoformat(), slots)
 
+    def test_available_slots_range_groups_by_date(self):
+        """
+        Test that the range view returns slots keyed by date
+        """
+        Booking.objects.create(
+            table=self.table,
+            name=self.user,
+            party_size=2,
+            start_time=self.start_time,
+        )
+
+        Booking.objects.create(
+            table=self.table2,
+            name=self.user,
+            party_size=2,
+            start_time=self.start_time,
+        )
+
+        url = reverse('booking:available_slots_range')
+
+        response = self.client.get(url, {
+            'start': self.monday_date.isoformat(),
+            'end': '2026-02-09',
+            'party_size': 2,
+        })
+
+        self.assertEqual(response.status_code, 200)
+
+        dates = response.json()['dates']
+        self.assertEqual(len(dates), 8)
+        self.assertEqual(dates['2026-02-03'], [])
+
+        slots = [slot['value'] for slot in dates['2026-02-02']]
+        self.assertTrue(slots)
+        self.assertNotIn(self.start_time.isoformat(), slots)
+
+    def test_available_slots_range_rejects_invalid_dates(self):
+        """
+        Test that a malformed date is a bad request with no dates
+        """
+        url = reverse('booking:available_slots_range')
+
+        response = self.client.get(url, {
+            'start': 'invalid-date',
+            'end': '2026-02-09',
+            'party_size': 2,
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['dates'], {})
+
+    def test_available_slots_range_rejects_bad_parameters(self):
+        """
+        Test that a missing or malformed parameter is a bad request
+        like a malformed date, rather than an empty answer or a server
+        error
+        """
+        url = reverse('booking:available_slots_range')
+        params = {
+            'start': self.monday_date.isoformat(),
+            'end': '2026-02-09',
+            'party_size': 2,
+        }
+
+        for name, value in (
+            ('party_size', ''),
+            ('party_size', 'two'),
+            ('exclude', 'abc'),
+        ):
+            with self.subTest(**{name: value}):
+                response = self.client.get(url, {**params, name: value})
+
+                self.assertEqual(response.status_code, 400)
+                self.assertEqual(response.json()['dates'], {})
+
+    def test_available_slots_range_rejects_impossible_dates(self):
+        """
+        Test that a well formed date that does not exist is a bad
+        request rather than a server error
+        """
+        url = reverse('booking:available_slots_range')
+
+        response = self.client.get(url, {
+            'start': '2026-02-30',
+            'end': '2026-03-02',
+            'party_size': 2,
+        })
+
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(response.json()['dates'], {})
+
     # Make Booking
     def test_make_booking_page_loads(self):
         """
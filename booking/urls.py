@@ -1,12 +1,16 @@
+from django.conf import settings
 from django.urls import path
-from . import views
+from . import async_views, views
 
 app_name = 'booking'
 
+# The polling endpoints run as async views when served over ASGI
+polling_views = async_views if settings.BOOKING_ASYNC_VIEWS else views
+
 urlpatterns = [
     path(
         'admin/bookings/calendar-data/',
-        views.booking_calendar_data,
+        polling_views.booking_calendar_data,
         name='booking_calendar_data',
     ),
     path(
@@ -16,9 +20,19 @@ urlpatterns = [
     ),
     path(
         'available-slots/',
-        views.available_slots,
+        polling_views.available_slots,
         name='available_slots'
     ),
+    path(
+        'available-slots/range/',
+        views.available_slots_range,
+        name='available_slots_range'
+    ),
+    path(
+        'history/',
+        views.booking_history_page,
+        name='booking_history'
+    ),
     path(
         'cancel/<int:booking_id>/',
         views.cancel_booking,
@@ -1,21 +1,16 @@
-from datetime import datetime
+from bisect import bisect_right
+from datetime import datetime, timedelta
 from django.utils import timezone
-from django.db.models import Q
-from .constants import SLOT_DURATION, INTERVAL
+from .constants import SLOT_DURATION, INTERVAL, MAX_RANGE_DAYS
 
 
-def get_available_slots(date, party_size=1, exclude_bookings=None):
-    from .models import Table, OpeningHours
-
-    weekday = date.weekday()
-
-    try:
-        opening = OpeningHours.objects.get(weekday=weekday)
-    except OpeningHours.DoesNotExist:
-        return []
-
+def get_slot_starts(date, opening, now=None):
+    """
+    Returns every bookable start time for the date within the opening
+    hours, skipping slots that have already passed today.
+    """
     tz = timezone.get_current_timezone()
-    now = timezone.now()
+    now = now or timezone.now()
 
     start = timezone.make_aware(
         datetime.combine(date, opening.open_time),
@@ -32,29 +27,157 @@ def get_available_slots(date, party_size=1, exclude_bookings=None):
 
     while current <= end:
         # Don’t allow booking in the past
-        if date == now.date() and current <= now:
-            current += INTERVAL
-            continue
+        if not (date == now.date() and current <= now):
+            slots.append(current)
 
-        booking_end = current + SLOT_DURATION
+        current += INTERVAL
 
-        overlap_q = Q(
-            bookings__status='BOOKED',
-            bookings__time_range__overlap=(current, booking_end),
-        )
+    return slots
+
+
+def merge_intervals(intervals):
+    """
+    Sorts (start, end) pairs and merges any that overlap so they can be
+    swept in a single pass.
+    """
+    merged = []
+
+    for start, end in sorted(intervals):
+        if merged and start < merged[-1][1]:
+            merged[-1][1] = max(merged[-1][1], end)
+        else:
+            merged.append([start, end])
+
+    return merged
 
-        if exclude_bookings:
-            overlap_q &= ~Q(bookings__in=exclude_bookings)
 
-        available_tables = (
-            Table.objects
-            .filter(seats__gte=party_size)
-            .exclude(overlap_q)
+def get_busy_intervals(table_ids, start, end, exclude_bookings=None):
+    """
+    Loads every BOOKED time range overlapping start-end for the tables
+    in one query, merged per table.
+    """
+    from .models import Booking
+
+    bookings = Booking.objects.filter(
+        status='BOOKED',
+        table_id__in=table_ids,
+        time_range__overlap=(start, end),
+    )
+
+    if exclude_bookings is not None:
+        bookings = bookings.exclude(pk__in=exclude_bookings)
+
+    busy = {}
+    rows = bookings.values_list('table_id', 'time_range')
+    for table_id, time_range in rows:
+        busy.setdefault(table_id, []).append(
+            (time_range.lower, time_range.upper)
         )
 
-        if available_tables.exists():
-            slots.append(current)
+    return {
+        table_id: merge_intervals(intervals)
+        for table_id, intervals in busy.items()
+    }
 
-        current += INTERVAL
 
-    return slots
+def free_slots(slots, table_ids, busy):
+    """
+    Sweeps each table's merged busy intervals against the sorted slot
+    starts and returns the slots where at least one table is free.
+    """
+    if not slots:
+        return []
+
+    available = set()
+
+    for table_id in table_ids:
+        intervals = busy.get(table_id, [])
+
+        if not intervals:
+            return list(slots)
+
+        # Skip straight to the first booking still running at opening
+        ends = [interval_end for _, interval_end in intervals]
+        i = bisect_right(ends, slots[0])
+
+        for slot in slots:
+            if slot in available:
+                continue
+
+            # Skip bookings that finish before this slot starts
+            while i < len(intervals) and intervals[i][1] <= slot:
+                i += 1
+
+            slot_end = slot + SLOT_DURATION
+            if i == len(intervals) or intervals[i][0] >= slot_end:
+                available.add(slot)
+
+    return [slot for slot in slots if slot in available]
+
+
+def get_available_slots_range(start_date, end_date, party_size=1,
+                              exclude_bookings=None):
+    """
+    Returns a dict of date to available slots for every date from
+    start_date to end_date inclusive, capped at MAX_RANGE_DAYS.
+    """
+    from .registry import registry
+
+    end_date = min(
+        end_date,
+        start_date + timedelta(days=MAX_RANGE_DAYS - 1),
+    )
+
+    openings = registry.openings()
+
+    now = timezone.now()
+    days = {}
+    date = start_date
+
+    while date <= end_date:
+        opening = openings.get(date.weekday())
+        days[date] = get_slot_starts(date, opening, now) if opening else []
+        date += timedelta(days=1)
+
+    all_slots = [slot for slots in days.values() for slot in slots]
+
+    if not all_slots:
+        return {date: [] for date in days}
+
+    table_ids = [table.id for table in registry.tables(party_size)]
+
+    if not table_ids:
+        return {date: [] for date in days}
+
+    # Every booking that could clash with any slot in the window
+    busy = get_busy_intervals(
+        table_ids,
+        all_slots[0],
+        all_slots[-1] + SLOT_DURATION,
+        exclude_bookings=exclude_bookings,
+    )
+
+    return {
+        date: free_slots(slots, table_ids, busy)
+        for date, slots in days.items()
+    }
+
+
+def get_available_slots(date, party_size=1, exclude_bookings=None):
+    from .occupancy import get_occupancy
+
+    index = get_occupancy(date)
+
+    if index is None:
+        return []
+
+    # Used when editing an existing booking
+    exclude = ()
+    if exclude_bookings is not None:
+        exclude = list(exclude_bookings.values_list('pk', flat=True))
+
+    return [
+        slot
+        for slot in get_slot_starts(date, index.opening)
+        if index.is_available(slot, party_size, exclude)
+    ]
@@ -1,17 +1,35 @@
 from django.http import JsonResponse
 from django.shortcuts import render, redirect, get_object_or_404
+from django.template.loader import render_to_string
 from django.contrib.auth.decorators import login_required
 from django.contrib.admin.views.decorators import staff_member_required
 from django.contrib import messages
+from django.core.exceptions import ValidationError
 from django.utils import timezone
-from django.utils.timezone import localtime
 from django.utils.dateparse import parse_date
+from django.views.decorators.cache import cache_control
+from django.views.decorators.http import condition
+from .allocation import MAX_ALLOCATION_ATTEMPTS
 from .forms import BookingForm
+from .instrumentation import query_budget
+from .history import PAST, UPCOMING, booking_history, decode_cursor
 from .models import Booking
-from .utils import get_available_slots
+from .streaming import CHUNK_SIZE, streaming_json_response
+from .utils import get_available_slots, get_available_slots_range
+from .cache import (
+    get_cached_available_slots,
+    get_cached_available_slots_range,
+)
+from .calendar import (
+    calendar_bookings,
+    calendar_etag,
+    calendar_event,
+    get_window,
+)
 
 
 @login_required
+@query_budget(8)
 def available_slots(request):
     date_str = request.GET.get('date')
     party_size = request.GET.get('party_size')
@@ -20,7 +38,11 @@ def available_slots(request):
     if not date_str or not party_size:
         return JsonResponse({'slots': []})
 
-    date = parse_date(date_str)
+    try:
+        date = parse_date(date_str)
+    except ValueError:
+        # Well formed but not a real day, e.g. 2026-02-30
+        date = None
     if not date:
         return JsonResponse({'slots': []})
 
@@ -37,11 +59,17 @@ def available_slots(request):
             name=request.user,
         )
 
-    slots = get_available_slots(
-        date=date,
-        party_size=party_size,
-        exclude_bookings=exclude_bookings,
-    )
+    if exclude_bookings is None:
+        slots = get_cached_available_slots(
+            date=date,
+            party_size=party_size,
+        )
+    else:
+        slots = get_available_slots(
+            date=date,
+            party_size=party_size,
+            exclude_bookings=exclude_bookings,
+        )
 
     data = [
         {
@@ -55,6 +83,74 @@ def available_slots(request):
 
 
 @login_required
+@query_budget(8)
+def available_slots_range(request):
+    """
+    Returns available slots for every date from start to end, keyed by
+    ISO date, so the date picker can grey out fully booked days.
+    """
+    start_str = request.GET.get('start')
+    end_str = request.GET.get('end')
+    party_size = request.GET.get('party_size')
+    exclude_id = request.GET.get('exclude')
+
+    # Any missing or malformed parameter is a bad request
+    if not start_str or not end_str or not party_size:
+        return JsonResponse({'dates': {}}, status=400)
+
+    try:
+        # A well formed date that is not a real day, e.g. 2026-02-30,
+        # raises ValueError too
+        start_date = parse_date(start_str)
+        end_date = parse_date(end_str)
+        party_size = int(party_size)
+        exclude_id = int(exclude_id) if exclude_id else None
+    except ValueError:
+        return JsonResponse({'dates': {}}, status=400)
+
+    if not start_date or not end_date:
+        return JsonResponse({'dates': {}}, status=400)
+
+    # Used when editing an existing booking
+    exclude_bookings = None
+    if exclude_id is not None:
+        exclude_bookings = Booking.objects.filter(
+            id=exclude_id,
+            name=request.user,
+        )
+
+    if exclude_bookings is None:
+        days = get_cached_available_slots_range(
+            start_date=start_date,
+            end_date=end_date,
+            party_size=party_size,
+        )
+    else:
+        days = get_available_slots_range(
+            start_date=start_date,
+            end_date=end_date,
+            party_size=party_size,
+            exclude_bookings=exclude_bookings,
+        )
+
+    data = {
+        date.isoformat(): [
+            {
+                'value': slot.isoformat(),
+                'label': slot.strftime('%H:%M'),
+            }
+            for slot in slots
+        ]
+        for date, slots in days.items()
+    }
+
+    return JsonResponse({'dates': data})
+
+
+# Every table but the last lost to other requests while booking, each
+# retry costing three queries
+@login_required
+@query_budget(12 + 3 * (MAX_ALLOCATION_ATTEMPTS - 1))
 def make_booking(request):
     # Redirect staff or superuser to staff booking page
     if (
@@ -66,27 +162,35 @@ def make_booking(request):
     ):
         return redirect('adminview:staff_booking')
 
-    now = timezone.now()
-
-    upcoming_bookings = Booking.objects.filter(
-        name=request.user,
-        start_time__gte=now
-        ).order_by('start_time')
-
-    past_bookings = Booking.objects.filter(
-        name=request.user,
-        start_time__lt=now,
-        ).order_by('-start_time')
-
     form = BookingForm(
         request.POST or None,
         user=request.user,
     )
 
     if request.method == 'POST' and form.is_valid():
-        form.save()
-        messages.success(request, 'Booking created successfully!')
-        return redirect('booking:booking')
+        try:
+            form.save()
+        except ValidationError as error:
+            # Every suitable table was taken while the form was open
+            form.add_error(None, error)
+        else:
+            messages.success(request, 'Booking created successfully!')
+            return redirect('booking:booking')
+
+    now = timezone.now()
+
+    # Only the first page of each, the rest load on request
+    upcoming_bookings, upcoming_next = booking_history(
+        request.user,
+        UPCOMING,
+        now,
+    )
+
+    past_bookings, past_next = booking_history(
+        request.user,
+        PAST,
+        now,
+    )
 
     return render(
         request,
@@ -94,12 +198,42 @@ def make_booking(request):
         {
             'form': form,
             'upcoming_bookings': upcoming_bookings,
+            'upcoming_next': upcoming_next,
             'past_bookings': past_bookings,
+            'past_next': past_next,
             'editing': False,
         }
     )
 
 
+@login_required
+def booking_history_page(request):
+    """
+    Returns the next page of the user's upcoming or past bookings after
+    the given cursor, rendered as list items.
+    """
+    kind = request.GET.get('kind')
+    after = decode_cursor(request.GET.get('after'))
+
+    if kind not in (UPCOMING, PAST) or after is None:
+        return JsonResponse({'html': '', 'next': None})
+
+    bookings, next_cursor = booking_history(
+        request.user,
+        kind,
+        timezone.now(),
+        after=after,
+    )
+
+    html = render_to_string(
+        f'booking/snippets/{kind}_bookings.html',
+        {'bookings': bookings},
+        request=request,
+    )
+
+    return JsonResponse({'html': html, 'next': next_cursor})
+
+
 def cancel_booking(request, booking_id):
     booking = get_object_or_404(Booking, id=booking_id, name=request.user)
     booking.status = 'CANCELLED'
@@ -108,38 +242,22 @@ def cancel_booking(request, booking_id):
 
 
 @staff_member_required(login_url='account_login')
+@query_budget(5)
+@cache_control(private=True, no_cache=True)
+@condition(etag_func=calendar_etag)
 def booking_calendar_data(request):
     """
-    Returns bookings as calendar events.
+    Returns bookings overlapping the start/end window FullCalendar asks
+    for as calendar events. Unchanged windows get a 304.
     """
+    window = get_window(request)
 
-    bookings = (
-        Booking.objects
-        .select_related('table', 'name')
-        .exclude(status__iexact='CANCELLED')
-    )
+    if window is None:
+        return JsonResponse([], safe=False)
 
-    events = []
-
-    for booking in bookings:
-        start = localtime(booking.start_time)
-        end = localtime(booking.time_range.upper)
-        events.append({
-            'id': booking.id,
-            'title': f'Table {booking.table} - {booking.name}',
-            'start': start.isoformat(),
-            'end': end.isoformat(),
-            'extendedProps': {
-                'reference': booking.reference,
-                'name': booking.name.get_full_name() or booking.name.username,
-                'table': str(booking.table),
-                'party_size': booking.party_size,
-                'status': booking.status,
-                'allergies': booking.allergies,
-            }
-        })
+    rows = calendar_bookings(*window).iterator(chunk_size=CHUNK_SIZE)
 
-    return JsonResponse(events, safe=False)
+    return streaming_json_response(calendar_event(row) for row in rows)
 
 
 @login_required
@@ -158,9 +276,13 @@ def edit_booking(request, booking_id):
             user=request.user,
         )
         if form.is_valid():
-            form.save()
-            messages.success(request, 'Booking updated successfully!')
-            return redirect('booking:booking')
+            try:
+                form.save()
+            except ValidationError as error:
+                form.add_error(None, error)
+            else:
+                messages.success(request, 'Booking updated successfully!')
+                return redirect('booking:booking')
     else:
         form = BookingForm(
             instance=booking,
@@ -172,7 +294,6 @@ def edit_booking(request, booking_id):
         'booking/booking.html',
         {
             'form': form,
-            'my_bookings': Booking.objects.filter(name=request.user),
             'editing': True,
         }
     )
@@ -0,0 +1,63 @@
+from django.contrib import admin
+from django.utils.html import format_html
+from .models import GalleryImage, MenuItem
+
+
+@admin.register(MenuItem)
+class MenuItemAdmin(admin.ModelAdmin):
+    """
+    Lists menu items by category, with prices, order and availability
+    editable from the list.
+    """
+    list_display = (
+        'name',
+        'category',
+        'price',
+        'position',
+        'is_available',
+    )
+
+    list_editable = (
+        'price',
+        'position',
+        'is_available',
+    )
+
+    list_filter = (
+        'category',
+        'is_available',
+    )
+
+    search_fields = (
+        'name',
+    )
+
+
+@admin.register(GalleryImage)
+class GalleryImageAdmin(admin.ModelAdmin):
+    """
+    Lists gallery images with their thumbnails, in gallery order.
+    """
+    list_display = (
+        'alt_text',
+        'preview',
+        'position',
+    )
+
+    list_editable = (
+        'position',
+    )
+
+    readonly_fields = (
+        'preview',
+    )
+
+    @admin.display(description='Thumbnail')
+    def preview(self, obj):
+        if not obj.thumbnail:
+            return '-'
+
+        return format_html(
+            "<img src='{}' alt='' height='60' loading='lazy'>",
+            obj.thumbnail.url,
+        )
@@ -0,0 +1,139 @@
+import hashlib
+from functools import partial, wraps
+from urllib.parse import urlencode
+from django.conf import settings
+from django.contrib.messages import get_messages
+from django.core.cache import cache
+from django.db import transaction
+from django.http import HttpResponse
+from django.utils.cache import (
+    get_conditional_response,
+    patch_cache_control,
+    patch_vary_headers,
+    set_response_etag,
+)
+from booking.cache import new_version
+
+PAGE_VERSION_KEY = 'pages:version'
+MENU_VERSION_KEY = 'menu:version'
+GALLERY_VERSION_KEY = 'gallery:version'
+
+
+def get_version(key):
+    """
+    Returns the version stored at key, creating it if missing or
+    evicted.
+    """
+    cache.add(key, new_version(), None)
+    return cache.get(key)
+
+
+def page_version():
+    # Cached pages and nav fragments are stored under this
+    return get_version(PAGE_VERSION_KEY)
+
+
+def menu_version():
+    return get_version(MENU_VERSION_KEY)
+
+
+def gallery_version():
+    return get_version(GALLERY_VERSION_KEY)
+
+
+def purge_pages():
+    """
+    Gives pages a new version so every cached page and nav fragment is
+    rendered again, e.g. after a deploy.
+    """
+    cache.set(PAGE_VERSION_KEY, new_version(), None)
+
+
+def bump_content(key):
+    """
+    Gives the menu or gallery at key a new version once the change is
+    committed, so fragments cached against the old one are not read
+    again, and purges the cached pages showing it.
+    """
+    def bump():
+        cache.set(key, new_version(), None)
+        purge_pages()
+
+    transaction.on_commit(bump)
+
+
+def page_key(request, params=()):
+    """
+    Returns the key for the page at the request's path. Only the query
+    parameters the view reads are part of it, so links with anything
+    else added share the one cached page.
+    """
+    query = urlencode([
+        (name, request.GET[name])
+        for name in sorted(params)
+        if name in request.GET
+    ])
+    path = hashlib.md5(
+        f'{request.path}?{query}'.encode(),
+        usedforsecurity=False,
+    ).hexdigest()
+    return f'pages:{page_version()}:{path}'
+
+
+def cached_page(view=None, *, params=()):
+    """
+    Serves a page the same for every anonymous visitor from the cache,
+    unless they have messages waiting to be shown. Signed in users get
+    a fresh page, with the nav cached per kind of user by base.html.
+    Every page has an ETag, so unchanged pages are answered with 304.
+
+    params names the query parameters the view reads, e.g.
+    @cached_page(params=['page']).
+    """
+    if view is None:
+        return partial(cached_page, params=params)
+
+    @wraps(view)
+    def wrapper(request, *args, **kwargs):
+        # Counting messages does not mark them as shown
+        shared = (
+            request.method in ('GET', 'HEAD')
+            and not request.user.is_authenticated
+            and not len(get_messages(request))
+        )
+
+        key = page_key(request, params) if shared else None
+        content = cache.get(key) if shared else None
+
+        if content is None:
+            response = view(request, *args, **kwargs)
+
+            if shared and response.status_code == 200:
+                cache.set(
+                    key,
+                    response.content,
+                    settings.PAGE_CACHE_TIMEOUT,
+                )
+        else:
+            response = HttpResponse(content)
+
+        if shared:
+            patch_cache_control(
+                response,
+                public=True,
+                max_age=settings.PAGE_CACHE_MAX_AGE,
+            )
+        else:
+            patch_cache_control(response, private=True, no_cache=True)
+
+        # Signing in or out changes the page at the same URL
+        patch_vary_headers(response, ['Cookie'])
+        set_response_etag(response)
+
+        return get_conditional_response(
+            request,
+            etag=response['ETag'],
+            response=response,
+        )
+
+    return wrapper
@@ -0,0 +1,25 @@
+from django.conf import settings
+from django.core.checks import Error, register
+
+LOCAL_STORAGE = 'django.core.files.storage.FileSystemStorage'
+
+
+@register()
+def check_media_storage(app_configs, **kwargs):
+    """
+    Uploaded menu and gallery images are only served by runserver with
+    DEBUG on, so anywhere else they must go to Cloudinary.
+    """
+    backend = settings.STORAGES['default']['BACKEND']
+
+    if settings.DEBUG or settings.TESTING or backend != LOCAL_STORAGE:
+        return []
+
+    return [
+        Error(
+            'Uploaded gallery and menu images would be saved to '
+            'MEDIA_ROOT, which is not served with DEBUG off.',
+            hint='Set the CLOUDINARY_URL config var.',
+            id='home.E001',
+        )
+    ]
@@ -0,0 +1,15 @@
+from django.conf import settings
+from django.utils.functional import SimpleLazyObject
+from .cache import page_version
+
+
+def page_cache(request):
+    """
+    Adds what base.html caches the nav under, and how long template
+    fragments are cached. The version is only read from the cache when
+    a template uses it.
+    """
+    return {
+        'page_version': SimpleLazyObject(page_version),
+        'page_cache_timeout': settings.PAGE_CACHE_TIMEOUT,
+    }
@@ -0,0 +1,162 @@
+import hashlib
+import json
+import posixpath
+from functools import lru_cache
+from io import BytesIO
+from django.contrib.staticfiles.storage import staticfiles_storage
+from django.core.files.base import ContentFile
+from PIL import Image, ImageOps
+
+# Images under here get derivatives, which are saved alongside
+SOURCE_DIR = 'images/'
+DERIVATIVE_DIR = 'images/responsive/'
+MANIFEST_NAME = 'images/responsive.json'
+
+SOURCE_EXTENSIONS = ('.jpg', '.jpeg', '.png')
+
+# Widths derivatives are made at, up to the source's own
+WIDTHS = (320, 640, 960, 1280, 1920)
+
+# Uploaded gallery images get a single WebP thumbnail this wide
+THUMBNAIL_WIDTH = 640
+
+# Pillow format, save options and content type of each derivative
+# extension. WebP is offered first, with the source's own format as
+# the fallback, so transparent PNGs stay transparent.
+FORMATS = {
+    'webp': ('WEBP', {'quality': 75, 'method': 6}, 'image/webp'),
+    'jpg': (
+        'JPEG',
+        {'quality': 80, 'optimize': True, 'progressive': True},
+        'image/jpeg',
+    ),
+    'png': ('PNG', {'optimize': True}, 'image/png'),
+}
+
+
+def is_source(path):
+    return (
+        path.startswith(SOURCE_DIR)
+        and not path.startswith(DERIVATIVE_DIR)
+        and path.lower().endswith(SOURCE_EXTENSIONS)
+    )
+
+
+def derivative_widths(width):
+    widest = min(width, WIDTHS[-1])
+    return [step for step in WIDTHS if step < widest] + [widest]
+
+
+def derivative_name(path, width, extension):
+    stem = posixpath.splitext(path[len(SOURCE_DIR):])[0]
+    return f'{DERIVATIVE_DIR}{stem}-{width}.{extension}'
+
+
+def encode(image, extension):
+    image_format, options, _ = FORMATS[extension]
+
+    if image_format == 'JPEG':
+        image = image.convert('RGB')
+
+    output = BytesIO()
+    image.save(output, image_format, **options)
+
+    return output.getvalue()
+
+
+def thumbnail(file, width=THUMBNAIL_WIDTH):
+    """
+    Returns a WebP copy of the image in file, scaled down to width if it
+    is any wider. The file is left at its start to be saved after.
+    """
+    file.seek(0)
+    image = Image.open(file)
+    image.load()
+    file.seek(0)
+
+    image = ImageOps.exif_transpose(image)
+
+    if image.width > width:
+        image = image.resize(
+            (width, max(round(image.height * width / image.width), 1)),
+            Image.LANCZOS,
+        )
+
+    return encode(image, 'webp')
+
+
+def build_derivatives(storage, path, previous=None):
+    """
+    Saves width-stepped WebP and JPEG or PNG copies of the image at
+    path in storage. Returns its manifest entry and the names saved,
+    which are none when previous shows the image has not changed.
+    """
+    with storage.open(path) as source:
+        data = source.read()
+
+    digest = hashlib.md5(data, usedforsecurity=False).hexdigest()[:12]
+
+    if previous and previous['hash'] == digest and all(
+        storage.exists(name)
+        for _, candidates in previous['srcset']
+        for _, name in candidates
+    ):
+        return previous, []
+
+    # Phones save photos sideways with an EXIF rotation
+    image = ImageOps.exif_transpose(Image.open(BytesIO(data)))
+    width, height = image.size
+    fallback = 'png' if path.lower().endswith('.png') else 'jpg'
+
+    # The fallback format comes last, for the img itself
+    entry = {
+        'hash': digest,
+        'width': width,
+        'height': height,
+        'srcset': [['webp', []], [fallback, []]],
+    }
+    saved = []
+
+    for step in derivative_widths(width):
+        resized = image.resize(
+            (step, max(round(height * step / width), 1)),
+            Image.LANCZOS,
+        )
+
+        for extension, candidates in entry['srcset']:
+            name = derivative_name(path, step, extension)
+            if storage.exists(name):
+                storage.delete(name)
+            storage.save(name, ContentFile(encode(resized, extension)))
+
+            candidates.append([step, name])
+            saved.append(name)
+
+    return entry, saved
+
+
+def read_manifest(storage):
+    if not storage.exists(MANIFEST_NAME):
+        return {}
+
+    with storage.open(MANIFEST_NAME) as manifest:
+        return json.loads(manifest.read())
+
+
+def write_manifest(storage, manifest):
+    if storage.exists(MANIFEST_NAME):
+        storage.delete(MANIFEST_NAME)
+
+    storage.save(
+        MANIFEST_NAME,
+        ContentFile(json.dumps(manifest, indent=2, sort_keys=True)),
+    )
+
+
+@lru_cache(maxsize=None)
+def manifest():
+    """
+    Returns the collected manifest of image derivatives, read once per
+    process. Empty until collectstatic has run.
+    """
+    return read_manifest(staticfiles_storage)
@@ -0,0 +1,58 @@
+import posixpath
+from django.contrib.staticfiles import finders
+from django.core.files import File
+from django.core.management.base import BaseCommand, CommandError
+from home.models import GalleryImage
+
+# The photos gallery.html showed before it read from the database
+PHOTOS = [
+    ('images/dish1.jpg', 'Signature Dish'),
+    ('images/dish2.jpg', 'Chef Special'),
+    ('images/dessert.jpg', 'Dessert'),
+    ('images/interior.jpg', 'Bistro Interior'),
+    ('images/chef.jpg', 'Chef at Work'),
+    ('images/wine.jpg', 'Wine Selection'),
+]
+
+
+class Command(BaseCommand):
+    help = (
+        'Uploads the photos the gallery was built with as gallery images, '
+        'with thumbnails. Photos already in the gallery are skipped.'
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            '--if-empty',
+            action='store_true',
+            help='Only import into an empty gallery, as on the first deploy',
+        )
+
+    def handle(self, *args, **options):
+        # Run on every release, so photos staff removed stay removed
+        if options['if_empty'] and GalleryImage.objects.exists():
+            self.stdout.write('Gallery already has photos')
+            return
+
+        existing = set(
+            GalleryImage.objects.values_list('alt_text', flat=True)
+        )
+        imported = 0
+
+        for position, (path, alt_text) in enumerate(PHOTOS):
+            if alt_text in existing:
+                continue
+
+            source = finders.find(path)
+            if source is None:
+                raise CommandError(f'{path} is not a static file')
+
+            with open(source, 'rb') as photo:
+                GalleryImage.objects.create(
+                    image=File(photo, name=posixpath.basename(path)),
+                    alt_text=alt_text,
+                    position=position,
+                )
+            imported += 1
+
+        self.stdout.write(f'Imported {imported} photos')
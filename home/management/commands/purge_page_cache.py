@@ -0,0 +1,37 @@
+from django.core.cache import DEFAULT_CACHE_ALIAS, caches
+from django.core.cache.backends.dummy import DummyCache
+from django.core.cache.backends.locmem import LocMemCache
+from django.core.management.base import BaseCommand
+from home.cache import (
+    GALLERY_VERSION_KEY,
+    MENU_VERSION_KEY,
+    bump_content,
+    purge_pages,
+)
+
+
+class Command(BaseCommand):
+    help = (
+        'Drops every cached page, nav, menu and gallery fragment, so '
+        'changed templates and static files are served straight after a '
+        'deploy.'
+    )
+
+    def handle(self, *args, **options):
+        # The release phase runs in a dyno of its own, so only a shared
+        # cache reaches the pages the web dynos hold
+        if isinstance(
+            caches[DEFAULT_CACHE_ALIAS],
+            (LocMemCache, DummyCache),
+        ):
+            self.stderr.write(
+                'The cache is local to this process, so pages cached by '
+                'the web processes were not purged. Set a shared '
+                'CACHE_BACKEND.'
+            )
+
+        for key in (MENU_VERSION_KEY, GALLERY_VERSION_KEY):
+            bump_content(key)
+
+        purge_pages()
+        self.stdout.write('Page cache purged')
@@ -0,0 +1,36 @@
+from django.core.cache import cache
+from .cache import menu_version
+from .models import MenuItem
+
+
+def build_menu(items):
+    """
+    Groups menu items by category, in the order the menu page and its
+    PDF show them, as (name, price) pairs. Empty categories are left
+    out.
+    """
+    grouped = {slug: [] for slug, _ in MenuItem.CATEGORIES}
+
+    for item in items:
+        grouped[item.category].append((item.name, item.price))
+
+    return [
+        {'slug': slug, 'title': title, 'items': grouped[slug]}
+        for slug, title in MenuItem.CATEGORIES
+        if grouped[slug]
+    ]
+
+
+def current_menu():
+    """
+    Returns the available menu items grouped by build_menu, cached until
+    a menu item is saved or deleted.
+    """
+    key = f'menu:{menu_version()}'
+    menu = cache.get(key)
+
+    if menu is None:
+        menu = build_menu(MenuItem.objects.filter(is_available=True))
+        cache.set(key, menu)
+
+    return menu
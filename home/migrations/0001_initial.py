@@ -0,0 +1,43 @@
+# Generated by Django 4.2.27 on 2026-10-18 13:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='GalleryImage',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('image', models.ImageField(upload_to='gallery/')),
+                ('thumbnail', models.ImageField(blank=True, editable=False, height_field='thumbnail_height', upload_to='gallery/thumbnails/', width_field='thumbnail_width')),
+                ('thumbnail_width', models.PositiveIntegerField(editable=False, null=True)),
+                ('thumbnail_height', models.PositiveIntegerField(editable=False, null=True)),
+                ('alt_text', models.CharField(max_length=150)),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+            ],
+            options={
+                'ordering': ('position', 'id'),
+            },
+        ),
+        migrations.CreateModel(
+            name='MenuItem',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('category', models.CharField(choices=[('starters', 'Starters'), ('mains', 'Main Courses'), ('desserts', 'Desserts'), ('drinks', 'Drinks')], max_length=10)),
+                ('name', models.CharField(max_length=100)),
+                ('price', models.CharField(help_text='As printed, e.g. £7 / £9', max_length=20)),
+                ('position', models.PositiveSmallIntegerField(default=0)),
+                ('is_available', models.BooleanField(default=True)),
+            ],
+            options={
+                'ordering': ('position', 'name'),
+            },
+        ),
+    ]
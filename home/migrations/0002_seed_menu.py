@@ -0,0 +1,44 @@
+from django.db import migrations
+
+# The menu as it was written into menu.html
+MENU = [
+    ('starters', 'Artisan Bread & Olive Oil', '£6'),
+    ('starters', 'French Onion Soup', '£9'),
+    ('starters', 'Seasonal Salad', '£8'),
+    ('mains', 'Grilled Salmon', '£24'),
+    ('mains', 'Beef Bourguignon', '£26'),
+    ('mains', 'Mushroom Risotto', '£21'),
+    ('desserts', 'Crème Brûlée', '£8'),
+    ('desserts', 'Chocolate Torte', '£9'),
+    ('drinks', 'House Red / White Wine', '£7 / £9'),
+    ('drinks', 'Craft Beer', '£6'),
+    ('drinks', 'Espresso / Cappuccino', '£4 / £5'),
+]
+
+
+def seed_menu(apps, schema_editor):
+    MenuItem = apps.get_model('home', 'MenuItem')
+
+    MenuItem.objects.bulk_create(
+        MenuItem(category=category, name=name, price=price, position=position)
+        for position, (category, name, price) in enumerate(MENU)
+    )
+
+
+def unseed_menu(apps, schema_editor):
+    MenuItem = apps.get_model('home', 'MenuItem')
+
+    MenuItem.objects.filter(
+        name__in=[name for _, name, _ in MENU]
+    ).delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('home', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.RunPython(seed_menu, unseed_menu),
+    ]
@@ -0,0 +1,61 @@
+import posixpath
+from django.core.files.base import ContentFile
+from django.db import models
+from .images import thumbnail
+
+
+class MenuItem(models.Model):
+    CATEGORIES = [
+        ('starters', 'Starters'),
+        ('mains', 'Main Courses'),
+        ('desserts', 'Desserts'),
+        ('drinks', 'Drinks'),
+    ]
+
+    category = models.CharField(max_length=10, choices=CATEGORIES)
+    name = models.CharField(max_length=100)
+    price = models.CharField(
+        max_length=20,
+        help_text='As printed, e.g. £7 / £9',
+    )
+    position = models.PositiveSmallIntegerField(default=0)
+    is_available = models.BooleanField(default=True)
+
+    class Meta:
+        ordering = ('position', 'name')
+
+    def __str__(self):
+        return f'{self.name} ({self.get_category_display()})'
+
+
+class GalleryImage(models.Model):
+    image = models.ImageField(upload_to='gallery/')
+    thumbnail = models.ImageField(
+        upload_to='gallery/thumbnails/',
+        width_field='thumbnail_width',
+        height_field='thumbnail_height',
+        editable=False,
+        blank=True,
+    )
+    thumbnail_width = models.PositiveIntegerField(null=True, editable=False)
+    thumbnail_height = models.PositiveIntegerField(null=True, editable=False)
+    alt_text = models.CharField(max_length=150)
+    position = models.PositiveSmallIntegerField(default=0)
+
+    class Meta:
+        ordering = ('position', 'id')
+
+    def __str__(self):
+        return self.alt_text
+
+    def save(self, *args, **kwargs):
+        # A newly uploaded image has not been written to storage yet
+        if self.image and not self.image._committed:
+            stem = posixpath.splitext(posixpath.basename(self.image.name))[0]
+            self.thumbnail.save(
+                f'{stem}.webp',
+                ContentFile(thumbnail(self.image)),
+                save=False,
+            )
+
+        super().save(*args, **kwargs)
@@ -0,0 +1,161 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from functools import lru_cache
+from pathlib import Path
+from django.contrib.staticfiles import finders
+from django.core.cache import cache
+from fpdf import FPDF
+from PIL import Image
+from .menu import current_menu
+
+# Bump when the layout below changes, so the old PDF is not served
+LAYOUT_VERSION = 1
+
+LOGO = 'images/logo.png'
+
+# Lato (SIL Open Font License) covers the curly quotes, dashes and
+# currency symbols staff type into menu items, which the built in PDF
+# fonts cannot encode. Only the glyphs used are embedded.
+FONT = Path(__file__).resolve().parent / 'fonts' / 'Lato-Regular.ttf'
+FONT_FAMILY = 'Lato'
+FILENAME = 'Gregorys_Bistro_Menu.pdf'
+
+BACKGROUND = (179, 141, 60)
+BORDER = (90, 62, 43)
+HEADING = (150, 60, 0)
+ITEM = (120, 80, 40)
+
+# A4 in points, with the menu in a centred column
+CONTENT_WIDTH = 360
+PAGE_BOTTOM = 750
+
+
+def logo_path():
+    return finders.find(LOGO)
+
+
+@lru_cache(maxsize=None)
+def logo_digest():
+    # Read once per process as the logo only changes on deploy
+    with open(logo_path(), 'rb') as logo:
+        return hashlib.md5(logo.read(), usedforsecurity=False).hexdigest()
+
+
+def menu_digest(menu):
+    """
+    Returns a hash of everything the PDF of menu is drawn from.
+    """
+    digest = hashlib.md5(usedforsecurity=False)
+    digest.update(str(LAYOUT_VERSION).encode())
+    digest.update(json.dumps(menu, ensure_ascii=False).encode())
+    digest.update(logo_digest().encode())
+
+    return digest.hexdigest()[:12]
+
+
+class MenuPDF(FPDF):
+
+    def __init__(self):
+        super().__init__(unit='pt', format='A4')
+        self.set_auto_page_break(False)
+        # A fixed date keeps the same menu to the same bytes
+        self.set_creation_date(datetime(2026, 1, 1, tzinfo=timezone.utc))
+        self.set_title('Gregorys Bistro Menu')
+        self.add_font(FONT_FAMILY, fname=FONT)
+
+    def new_page(self):
+        self.add_page()
+
+        self.set_fill_color(*BACKGROUND)
+        self.rect(0, 0, self.w, self.h, style='F')
+
+        inset = 20
+        self.set_draw_color(*BORDER)
+        self.set_line_width(1.2)
+        self.rect(
+            inset,
+            inset,
+            self.w - inset * 2,
+            self.h - inset * 2,
+            round_corners=True,
+            corner_radius=8,
+        )
+
+    def centred_text(self, text, centre, y):
+        self.text(centre - self.get_string_width(text) / 2, y, text)
+
+
+def render_menu_pdf(menu, logo):
+    """
+    Draws the menu onto A4 pages under the logo at path logo and
+    returns the PDF.
+    """
+    pdf = MenuPDF()
+    pdf.new_page()
+
+    left = (pdf.w - CONTENT_WIDTH) / 2
+    centre = pdf.w / 2
+
+    # Embedded at twice its printed size rather than full resolution
+    image = Image.open(logo)
+    image.thumbnail((240, 240))
+    pdf.image(image, x=centre - 60, y=10, w=120, h=120)
+    top = y = 160
+
+    pdf.set_font(FONT_FAMILY, size=22)
+    pdf.set_text_color(*HEADING)
+    pdf.centred_text('Menu', centre, y)
+
+    title_width = pdf.get_string_width('Menu')
+    pdf.set_line_width(1)
+    pdf.line(centre - title_width / 2, y + 4, centre + title_width / 2, y + 4)
+    y += 40
+
+    for category in menu:
+        pdf.set_font(FONT_FAMILY, size=18)
+        pdf.set_text_color(*HEADING)
+        pdf.centred_text(category['title'], centre, y)
+        y += 10
+
+        pdf.set_line_width(0.6)
+        pdf.line(left, y, left + CONTENT_WIDTH, y)
+        y += 14
+
+        pdf.set_font(FONT_FAMILY, size=14)
+        pdf.set_text_color(*ITEM)
+
+        for name, price in category['items']:
+            pdf.centred_text(name, centre, y)
+            pdf.text(
+                left + CONTENT_WIDTH - pdf.get_string_width(price),
+                y,
+                price,
+            )
+            y += 18
+
+            if y > PAGE_BOTTOM:
+                pdf.new_page()
+                y = top
+
+        y += 24
+
+    return bytes(pdf.output())
+
+
+def menu_pdf():
+    """
+    Returns the digest and bytes of the current menu's PDF, rendering
+    it only when no PDF for this digest is cached.
+    """
+    menu = current_menu()
+    digest = menu_digest(menu)
+    key = f'menu-pdf:{digest}'
+    content = cache.get(key)
+
+    if content is None:
+        content = render_menu_pdf(menu, logo_path())
+        # The key changes with the menu, so it can be kept until evicted
+        cache.set(key, content, None)
+
+    return digest, content
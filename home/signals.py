@@ -0,0 +1,23 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from .cache import GALLERY_VERSION_KEY, MENU_VERSION_KEY, bump_content
+from .models import GalleryImage, MenuItem
+
+
+@receiver(post_save, sender=MenuItem)
+@receiver(post_delete, sender=MenuItem)
+def invalidate_menu(sender, **kwargs):
+    bump_content(MENU_VERSION_KEY)
+
+
+@receiver(post_save, sender=GalleryImage)
+@receiver(post_delete, sender=GalleryImage)
+def invalidate_gallery(sender, **kwargs):
+    bump_content(GALLERY_VERSION_KEY)
+
+
+@receiver(post_delete, sender=GalleryImage)
+def delete_gallery_files(sender, instance, **kwargs):
+    # Uploads are not removed along with their rows otherwise
+    instance.image.delete(save=False)
+    instance.thumbnail.delete(save=False)
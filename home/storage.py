@@ -0,0 +1,81 @@
+import posixpath
+from django.core.files.base import ContentFile
+from rcssmin import cssmin
+from rjsmin import jsmin
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+from .images import (
+    build_derivatives,
+    is_source,
+    read_manifest,
+    write_manifest,
+)
+
+MINIFIERS = {'.css': cssmin, '.js': jsmin}
+
+
+class ResponsiveImageMixin:
+    """
+    Saves width-stepped WebP and JPEG or PNG copies of every collected
+    image, listed in a manifest for the responsive_image template tag.
+    Unchanged images are skipped.
+    """
+
+    def save_derivatives(self, paths):
+        """
+        Yields the source and name of each derivative saved, adding it
+        to paths so later steps process it too.
+        """
+        previous = read_manifest(self)
+        manifest = {}
+
+        for path in sorted(paths):
+            if not is_source(path):
+                continue
+
+            manifest[path], saved = build_derivatives(
+                self,
+                path,
+                previous.get(path),
+            )
+
+            for name in saved:
+                paths[name] = (self, name)
+                yield path, name
+
+        write_manifest(self, manifest)
+
+
+class StaticAssetStorage(
+    ResponsiveImageMixin,
+    CompressedManifestStaticFilesStorage,
+):
+    """
+    Minifies CSS and JS and adds image derivatives, then names every
+    file by a hash of its content and saves gzip and brotli copies, so
+    WhiteNoise can serve them compressed and cache them forever.
+    """
+
+    def post_process(self, paths, dry_run=False, **options):
+        if not dry_run:
+            self.minify(paths)
+            # Hashing below reports the derivatives with everything else
+            list(self.save_derivatives(paths))
+
+        yield from super().post_process(paths, dry_run=dry_run, **options)
+
+    def minify(self, paths):
+        for path, (storage, source_path) in list(paths.items()):
+            minifier = MINIFIERS.get(posixpath.splitext(path)[1])
+
+            # Vendored files are usually minified already
+            if minifier is None or '.min.' in path:
+                continue
+
+            with storage.open(source_path) as source:
+                content = minifier(source.read().decode())
+
+            if self.exists(path):
+                self.delete(path)
+            self.save(path, ContentFile(content.encode()))
+
+            paths[path] = (self, path)
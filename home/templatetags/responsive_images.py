@@ -0,0 +1,54 @@
+from django import template
+from django.templatetags.static import static
+from ..images import FORMATS, manifest
+
+register = template.Library()
+
+
+def srcset(candidates):
+    return ', '.join(f'{static(name)} {width}w' for width, name in candidates)
+
+
+@register.inclusion_tag('home/snippets/responsive_image.html')
+def responsive_image(path, alt, sizes='100vw', loading='lazy', **attrs):
+    """
+    Renders the static image at path as a picture offering its WebP
+    derivatives first, with srcset, sizes and intrinsic dimensions so
+    the browser downloads only the width it will show. A width scales
+    the dimensions down for images shown smaller than their own size.
+    Images without derivatives, e.g. before collectstatic, render as a
+    plain img.
+    """
+    width = attrs.pop('width', None)
+
+    context = {
+        'src': static(path),
+        'alt': alt,
+        'sizes': sizes,
+        'loading': loading,
+        'width': width,
+        'attrs': attrs.items(),
+        'sources': [],
+    }
+
+    entry = manifest().get(path)
+
+    if entry is None:
+        return context
+
+    *sources, (_, fallback) = entry['srcset']
+
+    width = int(width or entry['width'])
+
+    context.update({
+        'src': static(fallback[-1][1]),
+        'srcset': srcset(fallback),
+        'width': width,
+        'height': round(entry['height'] * width / entry['width']),
+        'sources': [
+            {'type': FORMATS[extension][2], 'srcset': srcset(candidates)}
+            for extension, candidates in sources
+        ],
+    })
+
+    return context
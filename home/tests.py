@@ -0,0 +1,841 @@
+import io
+import json
+import re
+import shutil
+import tempfile
+from io import BytesIO, StringIO
+from pathlib import Path
+from unittest import mock
+from django.conf import settings
+from django.contrib.auth.models import User
+from django.core.cache import cache
+from django.shortcuts import render
+from django.test import SimpleTestCase, TestCase, override_settings
+from django.contrib.staticfiles.storage import (
+    StaticFilesStorage,
+    staticfiles_storage,
+)
+from django.core.files.base import ContentFile
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.core.management import call_command
+from django.template import Context, Template
+from django.template.utils import get_app_template_dirs
+from django.templatetags.static import static
+from django.urls import reverse
+from PIL import Image
+from whitenoise.middleware import WhiteNoiseMiddleware
+from .cache import purge_pages
+from .checks import check_media_storage
+from .images import MANIFEST_NAME, WIDTHS, derivative_widths, manifest
+from .menu import current_menu
+from .models import GalleryImage, MenuItem
+from .pdf import logo_path, menu_digest, render_menu_pdf
+from .storage import ResponsiveImageMixin
+
+STATIC_TAG = re.compile(r'''{% static ["']([^"']+)["'] %}''')
+HASHED = re.compile(r'\.[0-9a-f]{12}\.\w+$')
+
+
+def template_static_references():
+    """
+    Returns every path the site's own templates load with {% static %}.
+    """
+    template_dirs = [
+        Path(template_dir)
+        for template_dir in [
+            *settings.TEMPLATES[0]['DIRS'],
+            *get_app_template_dirs('templates'),
+        ]
+        if Path(template_dir).is_relative_to(settings.BASE_DIR)
+    ]
+
+    return sorted({
+        reference
+        for template_dir in template_dirs
+        for template in template_dir.rglob('*.html')
+        for reference in STATIC_TAG.findall(template.read_text())
+    })
+
+
+def image_file(size, mode='RGB', image_format='JPEG'):
+    output = BytesIO()
+    Image.new(mode, size, 'red').save(output, image_format)
+    return ContentFile(output.getvalue())
+
+
+class DerivativeStorage(ResponsiveImageMixin, StaticFilesStorage):
+    # The mixin on plain storage, without hashing or compression
+    pass
+
+
+class ResponsiveImageMixinTests(SimpleTestCase):
+
+    def setUp(self):
+        """
+        Setup of a storage holding a wide photo, a transparent logo and
+        a stylesheet, as collectstatic leaves them
+        """
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+        self.storage = DerivativeStorage(location=self.root)
+        self.storage.save('images/hero.jpg', image_file((1000, 500)))
+        self.storage.save(
+            'images/logo.png',
+            image_file((200, 200), 'RGBA', 'PNG'),
+        )
+        self.storage.save('css/style.css', ContentFile(b'body {}'))
+
+    def collect(self):
+        paths = ('images/hero.jpg', 'images/logo.png', 'css/style.css')
+        return [
+            name
+            for _, name in self.storage.save_derivatives(
+                {path: (self.storage, path) for path in paths}
+            )
+        ]
+
+    def read_manifest(self):
+        with self.storage.open(MANIFEST_NAME) as manifest_file:
+            return json.loads(manifest_file.read())
+
+    def test_saves_width_stepped_derivatives(self):
+        """
+        Test that each image gets WebP and fallback copies at every
+        width step up to its own width, listed in the manifest
+        """
+        saved = self.collect()
+
+        hero = self.read_manifest()['images/hero.jpg']
+        self.assertEqual((hero['width'], hero['height']), (1000, 500))
+        self.assertEqual(
+            [extension for extension, _ in hero['srcset']],
+            ['webp', 'jpg'],
+        )
+        self.assertEqual(
+            hero['srcset'][0][1],
+            [
+                [320, 'images/responsive/hero-320.webp'],
+                [640, 'images/responsive/hero-640.webp'],
+                [960, 'images/responsive/hero-960.webp'],
+                [1000, 'images/responsive/hero-1000.webp'],
+            ],
+        )
+        self.assertEqual(len(saved), 10)
+
+        with self.storage.open('images/responsive/hero-640.jpg') as file:
+            self.assertEqual(Image.open(file).size, (640, 320))
+
+    def test_wide_images_stop_at_the_widest_step(self):
+        """
+        Test that images wider than every step are not made any wider
+        """
+        self.assertEqual(derivative_widths(6240), list(WIDTHS))
+
+    def test_png_fallback_keeps_transparency(self):
+        """
+        Test that PNGs fall back to PNG rather than JPEG
+        """
+        self.collect()
+
+        logo = self.read_manifest()['images/logo.png']
+        self.assertEqual(
+            logo['srcset'][1],
+            ['png', [[200, 'images/responsive/logo-200.png']]],
+        )
+
+        with self.storage.open('images/responsive/logo-200.png') as file:
+            self.assertEqual(Image.open(file).mode, 'RGBA')
+
+    def test_unchanged_images_are_skipped(self):
+        """
+        Test that collecting again only rebuilds changed images
+        """
+        self.collect()
+        self.storage.delete('images/logo.png')
+        self.storage.save('images/logo.png', image_file((100, 100)))
+
+        saved = self.collect()
+
+        self.assertEqual(
+            saved,
+            ['images/responsive/logo-100.webp',
+             'images/responsive/logo-100.png'],
+        )
+        self.assertIn('images/hero.jpg', self.read_manifest())
+
+
+class ResponsiveImageTagTests(SimpleTestCase):
+
+    def setUp(self):
+        """
+        Setup of a collected manifest for one image
+        """
+        self.root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.root)
+
+        storage = DerivativeStorage(location=self.root)
+        storage.save('images/dish.jpg', image_file((800, 600)))
+        list(storage.save_derivatives({'images/dish.jpg': (storage, '')}))
+
+        settings = override_settings(STATIC_ROOT=self.root)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+        manifest.cache_clear()
+        self.addCleanup(manifest.cache_clear)
+
+    def render(self, tag):
+        return Template(
+            '{% load responsive_images %}' + tag
+        ).render(Context())
+
+    def test_renders_srcset_sizes_and_dimensions(self):
+        """
+        Test that the tag offers WebP first and lazy loads with the
+        image's own dimensions
+        """
+        html = self.render(
+            '{% responsive_image "images/dish.jpg" alt="Dish" '
+            'sizes="50vw" class="img-fluid" %}'
+        )
+
+        self.assertInHTML(
+            "<picture><source type='image/webp' srcset='"
+            "/static/images/responsive/dish-320.webp 320w, "
+            "/static/images/responsive/dish-640.webp 640w, "
+            "/static/images/responsive/dish-800.webp 800w' sizes='50vw'>"
+            "<img src='/static/images/responsive/dish-800.jpg' srcset='"
+            "/static/images/responsive/dish-320.jpg 320w, "
+            "/static/images/responsive/dish-640.jpg 640w, "
+            "/static/images/responsive/dish-800.jpg 800w' sizes='50vw' "
+            "width='800' height='600' alt='Dish' loading='lazy' "
+            "decoding='async' class='img-fluid'></picture>",
+            html,
+        )
+
+    def test_width_scales_the_dimensions(self):
+        """
+        Test that a display width keeps the aspect ratio
+        """
+        html = self.render(
+            '{% responsive_image "images/dish.jpg" alt="" width=200 %}'
+        )
+
+        self.assertIn("width='200' height='150'", html)
+
+    def test_images_without_derivatives_render_plainly(self):
+        """
+        Test that an image missing from the manifest is a plain img
+        """
+        html = self.render(
+            '{% responsive_image "images/other.jpg" alt="Other" '
+            'loading="eager" %}'
+        )
+
+        self.assertInHTML(
+            "<img src='/static/images/other.jpg' alt='Other' "
+            "loading='eager' decoding='async'>",
+            html,
+        )
+
+
+class StaticAssetStorageTests(SimpleTestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        """
+        Setup of the site's static files collected as for deployment
+        """
+        super().setUpClass()
+
+        root = tempfile.mkdtemp()
+        cls.addClassCleanup(shutil.rmtree, root)
+
+        collected = override_settings(
+            STATIC_ROOT=root,
+            STORAGES={
+                **settings.STORAGES,
+                'staticfiles': {
+                    'BACKEND': 'home.storage.StaticAssetStorage',
+                },
+            },
+        )
+        collected.enable()
+        cls.addClassCleanup(collected.disable)
+
+        manifest.cache_clear()
+        cls.addClassCleanup(manifest.cache_clear)
+
+        call_command('collectstatic', interactive=False, verbosity=0)
+
+    def test_static_references_are_hashed_and_compressed(self):
+        """
+        Test that every template {% static %} path is served from a
+        hashed name, compressed with gzip and brotli when it is text
+        """
+        references = template_static_references()
+        self.assertIn('css/style.css', references)
+
+        for reference in references:
+            with self.subTest(reference):
+                name = staticfiles_storage.stored_name(reference)
+
+                self.assertRegex(name, HASHED)
+                self.assertTrue(staticfiles_storage.exists(name))
+
+                if name.endswith(('.css', '.js')):
+                    self.assertTrue(staticfiles_storage.exists(f'{name}.gz'))
+                    self.assertTrue(staticfiles_storage.exists(f'{name}.br'))
+
+    def test_css_and_js_are_minified(self):
+        """
+        Test that collected stylesheets and scripts are smaller than
+        their sources
+        """
+        for reference in ('css/style.css', 'js/available_slots.js'):
+            with self.subTest(reference):
+                source = Path(settings.STATICFILES_DIRS[0], reference)
+                name = staticfiles_storage.stored_name(reference)
+
+                self.assertLess(
+                    staticfiles_storage.size(name),
+                    source.stat().st_size,
+                )
+
+    def test_image_derivatives_are_hashed(self):
+        """
+        Test that the responsive image tag links hashed derivatives
+        """
+        html = Template(
+            '{% load responsive_images %}'
+            '{% responsive_image "images/dish1.jpg" alt="" %}'
+        ).render(Context())
+
+        self.assertRegex(html, r'dish1-320\.[0-9a-f]{12}\.webp 320w')
+
+    def test_hashed_files_are_cached_forever(self):
+        """
+        Test that WhiteNoise marks hashed files immutable
+        """
+        whitenoise = WhiteNoiseMiddleware(lambda request: None)
+
+        self.assertTrue(
+            whitenoise.immutable_file_test('', static('css/style.css'))
+        )
+        self.assertFalse(
+            whitenoise.immutable_file_test('', '/static/css/style.css')
+        )
+
+
+class PageCacheTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of an empty cache, a customer and a member of staff
+        """
+        cache.clear()
+        self.customer = User.objects.create_user(
+            username='customer',
+            password='password',
+        )
+        self.staff = User.objects.create_user(
+            username='staffer',
+            password='password',
+            is_staff=True,
+        )
+        self.home_url = reverse('home:home')
+
+    def count_renders(self, url, times=2):
+        with mock.patch('home.views.render', wraps=render) as rendered:
+            for _ in range(times):
+                response = self.client.get(url)
+        return response, rendered.call_count
+
+    def test_guests_are_served_from_the_cache(self):
+        """
+        Test that the public pages are only rendered once for guests
+        """
+        for name in ('home:home', 'home:gallery', 'home:menu'):
+            with self.subTest(name):
+                response, renders = self.count_renders(reverse(name))
+
+                self.assertEqual(renders, 1)
+                self.assertEqual(response.status_code, 200)
+                self.assertEqual(
+                    response['Cache-Control'],
+                    f'public, max-age={settings.PAGE_CACHE_MAX_AGE}',
+                )
+                self.assertEqual(response['Vary'], 'Cookie')
+
+    def test_unchanged_pages_are_not_modified(self):
+        """
+        Test that a request with the page's ETag gets a 304
+        """
+        etag = self.client.get(self.home_url)['ETag']
+
+        response = self.client.get(self.home_url, HTTP_IF_NONE_MATCH=etag)
+
+        self.assertEqual(response.status_code, 304)
+        self.assertEqual(response.content, b'')
+
+    def test_unread_query_parameters_share_the_cached_page(self):
+        """
+        Test that only the parameters a page reads give it another
+        cache entry, so added tracking parameters render nothing new
+        """
+        gallery_url = reverse('home:gallery')
+
+        with mock.patch('home.views.render', wraps=render) as rendered:
+            for params in (
+                {},
+                {'x': 1},
+                {'x': 2, 'utm_source': 'mail'},
+                {'page': 2},
+                {'page': 2, 'x': 3},
+            ):
+                self.client.get(gallery_url, params)
+            self.client.get(self.home_url, {'page': 2})
+            self.client.get(self.home_url)
+
+        self.assertEqual(rendered.call_count, 3)
+
+    def test_signed_in_users_get_their_own_page(self):
+        """
+        Test that signed in users are not served the guest page and see
+        their own name
+        """
+        self.client.get(self.home_url)
+        self.client.login(username='customer', password='password')
+
+        response, renders = self.count_renders(self.home_url)
+
+        self.assertEqual(renders, 2)
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+        self.assertContains(response, '| customer |')
+        self.assertContains(response, 'Book A Table')
+        self.assertNotContains(response, '| Login |')
+
+    def test_cached_nav_is_kept_per_kind_of_user(self):
+        """
+        Test that the staff nav is not shown to customers, and the
+        username is not cached with the nav
+        """
+        self.client.login(username='staffer', password='password')
+        self.assertContains(self.client.get(self.home_url), 'Staff Booking')
+
+        other_staff = User.objects.create_user(
+            username='otherstaff',
+            password='password',
+            is_staff=True,
+        )
+        self.client.force_login(other_staff)
+        response = self.client.get(self.home_url)
+        self.assertContains(response, 'Staff Booking')
+        self.assertContains(response, '| otherstaff |')
+
+        self.client.login(username='customer', password='password')
+        response = self.client.get(self.home_url)
+        self.assertNotContains(response, 'Staff Booking')
+        self.assertContains(response, '| customer |')
+
+    def test_messages_are_shown_on_cached_pages(self):
+        """
+        Test that signing out shows its message on the cached home page
+        """
+        self.client.get(self.home_url)
+        self.client.login(username='customer', password='password')
+
+        response = self.client.post(reverse('account_logout'), follow=True)
+
+        self.assertContains(response, 'You have signed out.')
+        self.assertContains(response, '| Login |')
+        self.assertEqual(response['Cache-Control'], 'private, no-cache')
+
+    def test_purge_renders_pages_again(self):
+        """
+        Test that purging the cache, directly or with the command,
+        renders the page again
+        """
+        self.client.get(self.home_url)
+
+        with mock.patch('home.views.render', wraps=render) as rendered:
+            purge_pages()
+            self.client.get(self.home_url)
+            call_command(
+                'purge_page_cache',
+                stdout=io.StringIO(),
+                stderr=io.StringIO(),
+            )
+            self.client.get(self.home_url)
+            self.client.get(self.home_url)
+
+        self.assertEqual(rendered.call_count, 2)
+
+    def test_purge_warns_when_the_cache_is_not_shared(self):
+        """
+        Test that purging a cache local to the command's own process
+        says that the web processes were not reached
+        """
+        stderr = io.StringIO()
+        call_command('purge_page_cache', stdout=io.StringIO(), stderr=stderr)
+
+        self.assertIn('not purged', stderr.getvalue())
+
+    @override_settings(CACHES={
+        'default': {
+            'BACKEND': 'django.core.cache.backends.db.DatabaseCache',
+            'LOCATION': 'gregorys_bistro_test_cache',
+        }
+    })
+    def test_purge_reaches_pages_in_the_shared_cache(self):
+        """
+        Test that the release command purges pages cached in the shared
+        database cache
+        """
+        call_command('createcachetable', stdout=StringIO())
+        self.client.get(self.home_url)
+        stderr = io.StringIO()
+
+        with mock.patch('home.views.render', wraps=render) as rendered:
+            with self.captureOnCommitCallbacks(execute=True):
+                call_command(
+                    'purge_page_cache',
+                    stdout=io.StringIO(),
+                    stderr=stderr,
+                )
+            self.client.get(self.home_url)
+
+        self.assertEqual(rendered.call_count, 1)
+        self.assertEqual(stderr.getvalue(), '')
+
+
+class MenuPDFTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of an empty cache and the current PDF's URL
+        """
+        cache.clear()
+        self.digest = menu_digest(current_menu())
+        self.pdf_url = reverse('home:menu_pdf', args=[self.digest])
+
+    def test_menu_page_links_the_pdf(self):
+        """
+        Test that the menu page lists the menu and links the PDF
+        rather than loading jsPDF
+        """
+        response = self.client.get(reverse('home:menu'))
+
+        self.assertContains(response, f"href='{self.pdf_url}'")
+        self.assertContains(response, 'Crème Brûlée')
+        self.assertContains(response, "data-filter='desserts'")
+        self.assertNotContains(response, 'jspdf')
+
+    def test_pdf_is_served_with_long_caching(self):
+        """
+        Test that the PDF downloads with its digest as ETag and is
+        cached forever
+        """
+        response = self.client.get(self.pdf_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response['Content-Type'], 'application/pdf')
+        self.assertTrue(response.content.startswith(b'%PDF'))
+        self.assertIn('Gregorys_Bistro_Menu.pdf',
+                      response['Content-Disposition'])
+        self.assertEqual(response['ETag'], f'"{self.digest}"')
+        self.assertIn('immutable', response['Cache-Control'])
+
+    def test_pdf_is_rendered_once(self):
+        """
+        Test that later downloads come from the cache and revalidation
+        gets a 304
+        """
+        with mock.patch(
+            'home.pdf.render_menu_pdf',
+            wraps=render_menu_pdf,
+        ) as rendered:
+            etag = self.client.get(self.pdf_url)['ETag']
+            self.client.get(self.pdf_url)
+            response = self.client.get(
+                self.pdf_url,
+                HTTP_IF_NONE_MATCH=etag,
+            )
+
+        self.assertEqual(rendered.call_count, 1)
+        self.assertEqual(response.status_code, 304)
+
+    def test_old_links_redirect_to_the_current_pdf(self):
+        """
+        Test that a link from before the menu changed still works
+        """
+        response = self.client.get(
+            reverse('home:menu_pdf', args=['0123456789ab'])
+        )
+
+        self.assertRedirects(response, self.pdf_url)
+
+    def test_pdf_renders_text_outside_latin_1(self):
+        """
+        Test that items typed with curly quotes, dashes or euros still
+        download
+        """
+        with self.captureOnCommitCallbacks(execute=True):
+            MenuItem.objects.create(
+                category='mains',
+                name='Chef’s Special – Duck',
+                price='€24',
+            )
+        pdf_url = reverse('home:menu_pdf', args=[menu_digest(current_menu())])
+
+        response = self.client.get(pdf_url)
+
+        self.assertEqual(response.status_code, 200)
+        self.assertTrue(response.content.startswith(b'%PDF'))
+
+    def test_pdf_is_kept_until_evicted(self):
+        """
+        Test that the rendered PDF is cached without a timeout
+        """
+        with mock.patch('home.pdf.cache') as pdf_cache:
+            pdf_cache.get.return_value = None
+            self.client.get(self.pdf_url)
+
+        self.assertIsNone(pdf_cache.set.call_args.args[2])
+
+    def test_same_menu_renders_the_same_pdf(self):
+        """
+        Test that rendering does not depend on when it runs
+        """
+        self.assertEqual(
+            render_menu_pdf(current_menu(), logo_path()),
+            render_menu_pdf(current_menu(), logo_path()),
+        )
+
+
+class MenuItemTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of an empty cache and a signed in customer, who is not
+        served the cached page
+        """
+        cache.clear()
+        user = User.objects.create_user(
+            username='customer',
+            password='password',
+        )
+        self.client.force_login(user)
+        self.menu_url = reverse('home:menu')
+
+    def test_menu_is_grouped_by_category(self):
+        """
+        Test that the seeded items are grouped in category order and
+        unavailable items are left out
+        """
+        MenuItem.objects.filter(name='Craft Beer').update(is_available=False)
+
+        menu = current_menu()
+
+        self.assertEqual(
+            [category['title'] for category in menu],
+            ['Starters', 'Main Courses', 'Desserts', 'Drinks'],
+        )
+        self.assertEqual(
+            menu[3]['items'],
+            [('House Red / White Wine', '£7 / £9'),
+             ('Espresso / Cappuccino', '£4 / £5')],
+        )
+
+    def test_menu_fragment_is_cached(self):
+        """
+        Test that the menu is not read again while it is cached
+        """
+        self.client.get(self.menu_url)
+
+        with mock.patch(
+            'home.views.current_menu',
+            wraps=current_menu,
+        ) as read_menu:
+            # Only the session and user are loaded
+            with self.assertNumQueries(2):
+                response = self.client.get(self.menu_url)
+
+        read_menu.assert_not_called()
+        self.assertContains(response, 'Beef Bourguignon')
+
+    def test_saving_an_item_updates_the_menu_and_pdf(self):
+        """
+        Test that saving a menu item renders the menu and its PDF link
+        again, including the page cached for guests
+        """
+        self.client.get(self.menu_url)
+        self.client.logout()
+        old_pdf_url = reverse(
+            'home:menu_pdf',
+            args=[menu_digest(current_menu())],
+        )
+        self.assertContains(self.client.get(self.menu_url), old_pdf_url)
+
+        with self.captureOnCommitCallbacks(execute=True):
+            MenuItem.objects.create(
+                category='desserts',
+                name='Lemon Tart',
+                price='£7',
+            )
+
+        response = self.client.get(self.menu_url)
+        self.assertContains(response, 'Lemon Tart')
+        self.assertNotContains(response, old_pdf_url)
+
+
+class GalleryImageTests(TestCase):
+
+    def setUp(self):
+        """
+        Setup of an empty cache and uploads saved to a temporary
+        directory
+        """
+        cache.clear()
+        self.media_root = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.media_root)
+
+        media = override_settings(MEDIA_ROOT=self.media_root)
+        media.enable()
+        self.addCleanup(media.disable)
+
+        self.gallery_url = reverse('home:gallery')
+
+    def upload(self, alt_text='Dish', size=(1000, 500), **kwargs):
+        return GalleryImage.objects.create(
+            image=SimpleUploadedFile(
+                'dish.jpg',
+                image_file(size).read(),
+                content_type='image/jpeg',
+            ),
+            alt_text=alt_text,
+            **kwargs,
+        )
+
+    def test_thumbnail_is_made_on_upload(self):
+        """
+        Test that an upload gets a WebP thumbnail with its dimensions
+        """
+        image = self.upload()
+
+        self.assertTrue(image.thumbnail.name.endswith('.webp'))
+        self.assertEqual(
+            (image.thumbnail_width, image.thumbnail_height),
+            (640, 320),
+        )
+
+        with image.image.open() as file:
+            self.assertEqual(Image.open(file).size, (1000, 500))
+
+    def test_thumbnail_is_kept_when_not_uploading(self):
+        """
+        Test that saving without a new image keeps the thumbnail
+        """
+        image = self.upload()
+        thumbnail = image.thumbnail.name
+
+        image.alt_text = 'Signature Dish'
+        image.save()
+        image.refresh_from_db()
+
+        self.assertEqual(image.thumbnail.name, thumbnail)
+
+    def test_deleting_removes_the_files(self):
+        """
+        Test that deleting an image deletes its uploads
+        """
+        image = self.upload()
+        storage = image.image.storage
+        names = [image.image.name, image.thumbnail.name]
+
+        image.delete()
+
+        self.assertFalse(any(storage.exists(name) for name in names))
+
+    def test_gallery_is_paginated_and_lazy_loaded(self):
+        """
+        Test that the gallery shows a page of thumbnails at a time and
+        only loads the first row eagerly
+        """
+        for position in range(13):
+            self.upload(f'Photo {position}', (100, 100), position=position)
+
+        first = self.client.get(self.gallery_url)
+        second = self.client.get(self.gallery_url, {'page': 2})
+
+        self.assertContains(first, '.webp', count=12)
+        self.assertContains(first, "loading='eager'", count=3)
+        self.assertContains(first, "loading='lazy'", count=9)
+        self.assertContains(first, '?page=2')
+        self.assertContains(second, "alt='Photo 12'")
+        self.assertNotContains(second, "alt='Photo 0'")
+        self.assertContains(second, 'Page 2 of 2')
+
+    def test_saving_an_image_updates_the_gallery(self):
+        """
+        Test that a new image shows in the cached gallery
+        """
+        self.assertContains(self.client.get(self.gallery_url), 'on their way')
+
+        with self.captureOnCommitCallbacks(execute=True):
+            self.upload('Roast Duck')
+
+        self.assertContains(self.client.get(self.gallery_url), 'Roast Duck')
+
+    def test_import_gallery_if_empty_leaves_a_used_gallery(self):
+        """
+        Test that the release step only imports into an empty gallery,
+        so photos staff removed are not brought back
+        """
+        self.upload('Roast Duck')
+
+        call_command('import_gallery', if_empty=True, stdout=io.StringIO())
+
+        self.assertEqual(
+            list(GalleryImage.objects.values_list('alt_text', flat=True)),
+            ['Roast Duck'],
+        )
+
+        GalleryImage.objects.all().delete()
+        call_command('import_gallery', if_empty=True, stdout=io.StringIO())
+
+        self.assertEqual(GalleryImage.objects.count(), 6)
+
+    @override_settings(DEBUG=False, TESTING=False)
+    def test_local_media_storage_fails_the_checks(self):
+        """
+        Test that serving without Cloudinary is a check error, as local
+        uploads would not be served
+        """
+        self.assertEqual(
+            [error.id for error in check_media_storage(None)],
+            ['home.E001'],
+        )
+
+        cloudinary = {
+            **settings.STORAGES,
+            'default': {
+                'BACKEND': 'cloudinary_storage.storage.MediaCloudinaryStorage',
+            },
+        }
+        with override_settings(STORAGES=cloudinary):
+            self.assertEqual(check_media_storage(None), [])
+
+    def test_import_gallery_skips_imported_photos(self):
+        """
+        Test that the command uploads the original photos once
+        """
+        call_command('import_gallery', stdout=io.StringIO())
+        call_command('import_gallery', stdout=io.StringIO())
+
+        self.assertEqual(
+            list(GalleryImage.objects.values_list('alt_text', flat=True)),
+            ['Signature Dish', 'Chef Special', 'Dessert',
+             'Bistro Interior', 'Chef at Work', 'Wine Selection'],
+        )
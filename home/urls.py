@@ -7,6 +7,11 @@ urlpatterns = [
     path('contact/', views.contact_page, name='contact'),
     path('gallery/', views.gallery_page, name='gallery'),
     path('menu/', views.menu_page, name='menu'),
+    path(
+        'menu/<slug:digest>.pdf',
+        views.menu_pdf_download,
+        name='menu_pdf',
+    ),
     path('home/', views.menu_page, name='home'),
     path('', views.home_page, name='home'),
 ]
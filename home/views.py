@@ -1,10 +1,28 @@
+from django.core.paginator import Paginator
+from django.http import HttpResponse
 from django.shortcuts import render, redirect
 from django.contrib import messages
-from django.core.mail import send_mail
-from django.conf import settings
+from django.urls import reverse
+from django.utils.cache import patch_cache_control
+from django.utils.functional import SimpleLazyObject
+from django.views.decorators.http import etag
+from booking.instrumentation import query_budget
+from booking.outbox import queue_email
+from .cache import cached_page, gallery_version, menu_version
 from .forms import ContactForm
+from .menu import current_menu
+from .models import GalleryImage
+from .pdf import FILENAME, menu_digest, menu_pdf
 
+# The PDF's URL changes with its content, so it never goes stale
+PDF_MAX_AGE = 60 * 60 * 24 * 365
 
+# A page of photos at a time, so the gallery's weight stays the same
+# however many are uploaded
+GALLERY_PAGE_SIZE = 12
+
+
+@cached_page
 def home_page(request):
     return render(request, 'home/index.html')
 
@@ -16,11 +34,10 @@ def contact_page(request):
             email = form.cleaned_data['email']
             message = form.cleaned_data['message']
 
-            send_mail(
+            queue_email(
                 subject='New contact form submission',
-                message=f'From: {email}\n\n{message}',
-                from_email=settings.DEFAULT_FROM_EMAIL,
-                recipient_list=['gregorys.bistro.2026@gmail.com'],
+                body=f'From: {email}\n\n{message}',
+                recipients=['gregorys.bistro.2026@gmail.com'],
             )
 
             messages.success(
@@ -34,9 +51,53 @@ def contact_page(request):
     return render(request, 'home/contact.html', {'form': form})
 
 
+@query_budget(4)
+@cached_page(params=['page'])
 def gallery_page(request):
-    return render(request, 'home/gallery.html')
+    number = request.GET.get('page', '1')
 
+    # Only read from the database when the cached fragment is missing
+    return render(request, 'home/gallery.html', {
+        'gallery_version': gallery_version(),
+        'page_number': number if number.isdigit() else '1',
+        'page_obj': SimpleLazyObject(
+            lambda: Paginator(
+                GalleryImage.objects.all(),
+                GALLERY_PAGE_SIZE,
+            ).get_page(number)
+        ),
+    })
 
+
+@query_budget(3)
+@cached_page
 def menu_page(request):
-    return render(request, 'home/menu.html')
+    return render(request, 'home/menu.html', {
+        'menu_version': menu_version(),
+        'menu': SimpleLazyObject(current_menu),
+        'menu_pdf_url': SimpleLazyObject(
+            lambda: reverse(
+                'home:menu_pdf',
+                args=[menu_digest(current_menu())],
+            )
+        ),
+    })
+
+
+@etag(lambda request, digest: menu_digest(current_menu()))
+def menu_pdf_download(request, digest):
+    current, content = menu_pdf()
+
+    # Pages cached before a deploy still link the old PDF
+    if digest != current:
+        return redirect('home:menu_pdf', digest=current)
+
+    response = HttpResponse(content, content_type='application/pdf')
+    response['Content-Disposition'] = f'attachment; filename="{FILENAME}"'
+    patch_cache_control(
+        response,
+        public=True,
+        max_age=PDF_MAX_AGE,
+        immutable=True,
+    )
+    return response
@@ -13,6 +13,7 @@ https://docs.djangoproject.com/en/4.2/ref/settings/
 from django.contrib.messages import constants as messages
 from pathlib import Path
 import os
+import sys
 import dj_database_url
 if os.path.isfile('env.py'):
     import env
@@ -56,6 +57,7 @@ LOGOUT_REDIRECT_URL = '/'
 PASSWORD_RESET_REDIRECT_URL = '/accounts/login/'
 
 MIDDLEWARE = [
+    'booking.instrumentation.QueryInstrumentationMiddleware',
     'django.middleware.security.SecurityMiddleware',
     'whitenoise.middleware.WhiteNoiseMiddleware',
     'django.contrib.sessions.middleware.SessionMiddleware',
@@ -80,6 +82,7 @@ TEMPLATES = [
                 'django.template.context_processors.request',
                 'django.contrib.auth.context_processors.auth',
                 'django.contrib.messages.context_processors.messages',
+                'home.context_processors.page_cache',
             ],
         },
     },
@@ -95,6 +98,94 @@ DATABASES = {
     'default': dj_database_url.parse(os.environ.get('DATABASE_URL'))
 }
 
+# Cache
+# https://docs.djangoproject.com/en/4.2/topics/cache/
+# Availability is keyed by versions kept in Postgres, so it is never
+# stale whatever the backend. Only the public page cache needs one shared
+# by every gunicorn worker, dyno and management command, so the release
+# purge and menu or gallery edits reach the pages the others cached. The
+# release phase runs createcachetable.
+
+CACHES = {
+    'default': {
+        'BACKEND': os.environ.get(
+            'CACHE_BACKEND',
+            'django.core.cache.backends.db.DatabaseCache',
+        ),
+        'LOCATION': os.environ.get('CACHE_LOCATION', 'gregorys_bistro_cache'),
+    }
+}
+
+# Public pages and the nav are cached for an hour, or until the
+# purge_page_cache command runs on release. Browsers and proxies may
+# reuse an anonymous page for PAGE_CACHE_MAX_AGE seconds.
+
+PAGE_CACHE_TIMEOUT = 60 * 60
+PAGE_CACHE_MAX_AGE = 5 * 60
+
+# Table assignment
+# Dotted path to the strategy that picks a booking's table, see
+# booking/assignment.py and the simulate_assignment command.
+
+BOOKING_ASSIGNMENT_STRATEGY = os.environ.get(
+    'BOOKING_ASSIGNMENT_STRATEGY',
+    'booking.assignment.BestFitGapStrategy',
+)
+
+# Serve the slot and calendar endpoints from async views; only worth it
+# when running under ASGI workers, see Async Deployment in the README.
+
+BOOKING_ASYNC_VIEWS = os.environ.get('BOOKING_ASYNC_VIEWS') == 'True'
+
+# Store bookings in monthly PostgreSQL partitions. migrate converts the
+# table once this is set, see Partitioned Bookings in the README.
+
+BOOKING_PARTITIONED = os.environ.get('BOOKING_PARTITIONED') == 'True'
+BOOKING_PARTITION_MONTHS_AHEAD = int(
+    os.environ.get('BOOKING_PARTITION_MONTHS_AHEAD', 3)
+)
+
+# Query budgets
+# Views over their query_budget raise under tests, or when this is set,
+# and log a warning otherwise, see booking/instrumentation.py.
+
+TESTING = sys.argv[1:2] == ['test']
+
+QUERY_BUDGET_STRICT = (
+    TESTING or os.environ.get('QUERY_BUDGET_STRICT') == 'True'
+)
+
+# Tests always use a cache local to the process, whatever the backend
+# configured for the server
+
+if TESTING:
+    CACHES['default'] = {
+        'BACKEND': 'django.core.cache.backends.locmem.LocMemCache',
+        'LOCATION': 'gregorys-bistro-tests',
+    }
+
+# Logging
+# Per-request query summaries go to the console for the Heroku logs.
+
+LOGGING = {
+    'version': 1,
+    'disable_existing_loggers': False,
+    'handlers': {
+        'console': {
+            'class': 'logging.StreamHandler',
+        },
+    },
+    'loggers': {
+        'booking.instrumentation': {
+            'handlers': ['console'],
+            'level': os.environ.get(
+                'QUERY_LOG_LEVEL',
+                'WARNING' if TESTING else 'INFO',
+            ),
+        },
+    },
+}
+
 CSRF_TRUSTED_ORIGINS = [
     'https://*.codeinstitute-ide.net/',
     'https://*.herokuapp.com'
@@ -150,6 +241,34 @@ STATIC_URL = 'static/'
 STATICFILES_DIRS = [os.path.join(BASE_DIR, 'static'), ]
 STATIC_ROOT = os.path.join(BASE_DIR, 'staticfiles')
 
+# Uploaded menu and gallery images go to Cloudinary when CLOUDINARY_URL
+# is set, and to MEDIA_ROOT otherwise, e.g. in development and tests.
+
+MEDIA_URL = '/media/'
+MEDIA_ROOT = os.path.join(BASE_DIR, 'media')
+
+# collectstatic minifies CSS and JS, saves resized WebP copies of the
+# images for the responsive_image tag, hashes every file name and adds
+# gzip and brotli copies, see home/storage.py. Tests skip the manifest
+# so they run without collectstatic.
+
+STORAGES = {
+    'default': {
+        'BACKEND': (
+            'cloudinary_storage.storage.MediaCloudinaryStorage'
+            if os.environ.get('CLOUDINARY_URL') and not TESTING
+            else 'django.core.files.storage.FileSystemStorage'
+        ),
+    },
+    'staticfiles': {
+        'BACKEND': (
+            'django.contrib.staticfiles.storage.StaticFilesStorage'
+            if TESTING
+            else 'home.storage.StaticAssetStorage'
+        ),
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/4.2/ref/settings/#default-auto-field
 
@@ -161,4 +280,7 @@ EMAIL_PORT = 587
 EMAIL_USE_TLS = True
 EMAIL_HOST_USER = 'a13d60001@smtp-brevo.com'
 EMAIL_HOST_PASSWORD = os.environ.get('BREVO_KEY')
+# Seconds before a hung relay fails a send rather than holding the
+# outbox worker and reminder run indefinitely
+EMAIL_TIMEOUT = 10
 DEFAULT_FROM_EMAIL = 'Gregorys Bistro <gregorys.bistro.2026@gmail.com>'
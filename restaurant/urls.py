@@ -1,3 +1,5 @@
+from django.conf import settings
+from django.conf.urls.static import static
 from django.contrib import admin
 from django.urls import path, include
 
@@ -8,3 +10,6 @@ urlpatterns = [
     path('', include('adminview.urls'), name='adminview-urls'),
     path('', include('home.urls'), name='home-urls'),
 ]
+
+# Uploads stored locally are only served by runserver with DEBUG on
+urlpatterns += static(settings.MEDIA_URL, document_root=settings.MEDIA_ROOT)
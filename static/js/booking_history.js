@@ -0,0 +1,35 @@
+document.addEventListener('DOMContentLoaded', function () {
+    const buttons = document.querySelectorAll('.load-more');
+    const historyUrl = document.querySelector('.booking-page')
+        .dataset.historyUrl;
+
+    function loadMore(button) {
+        const list = document.getElementById(button.dataset.list);
+        const params = new URLSearchParams({
+            kind: button.dataset.kind,
+            after: button.dataset.next,
+        });
+
+        button.disabled = true;
+
+        fetch(`${historyUrl}?${params}`)
+            .then(response => response.json())
+            .then(data => {
+                list.insertAdjacentHTML('beforeend', data.html);
+
+                if (data.next) {
+                    button.dataset.next = data.next;
+                    button.disabled = false;
+                } else {
+                    button.remove();
+                }
+            })
+            .catch(() => {
+                button.disabled = false;
+            });
+    }
+
+    buttons.forEach(button => {
+        button.addEventListener('click', () => loadMore(button));
+    });
+});